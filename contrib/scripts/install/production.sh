@@ -130,14 +130,40 @@ autorestart = true
 redirect_stderr = true
 EOF
 
-echo -e "\n -> Creating the supervisor file for the Celery worker, /etc/supervisor/conf.d/mayan-celery.conf \n"
+echo -e "\n -> Creating the supervisor file for the Celery workers, /etc/supervisor/conf.d/mayan-celery.conf \n"
 cat > /etc/supervisor/conf.d/mayan-celery.conf << EOF
-[program:mayan-worker]
-command = ${INSTALLATION_DIRECTORY}bin/python ${INSTALLATION_DIRECTORY}bin/mayan-edms.py celery --settings=mayan.settings.production worker -Ofair -l ERROR
+[program:mayan-worker-interactive]
+command = ${INSTALLATION_DIRECTORY}bin/python ${INSTALLATION_DIRECTORY}bin/mayan-edms.py celery --settings=mayan.settings.production worker -Ofair -l ERROR -n interactive@%%h --task-class=interactive --concurrency=2
 directory = ${INSTALLATION_DIRECTORY}
 user = www-data
-stdout_logfile = /var/log/mayan/worker-stdout.log
-stderr_logfile = /var/log/mayan/worker-stderr.log
+stdout_logfile = /var/log/mayan/worker-interactive-stdout.log
+stderr_logfile = /var/log/mayan/worker-interactive-stderr.log
+autostart = true
+autorestart = true
+startsecs = 10
+stopwaitsecs = 10
+killasgroup = true
+priority = 998
+
+[program:mayan-worker-bulk]
+command = ${INSTALLATION_DIRECTORY}bin/python ${INSTALLATION_DIRECTORY}bin/mayan-edms.py celery --settings=mayan.settings.production worker -Ofair -l ERROR -n bulk@%%h --task-class=bulk --concurrency=2
+directory = ${INSTALLATION_DIRECTORY}
+user = www-data
+stdout_logfile = /var/log/mayan/worker-bulk-stdout.log
+stderr_logfile = /var/log/mayan/worker-bulk-stderr.log
+autostart = true
+autorestart = true
+startsecs = 10
+stopwaitsecs = 10
+killasgroup = true
+priority = 998
+
+[program:mayan-worker-periodic]
+command = ${INSTALLATION_DIRECTORY}bin/python ${INSTALLATION_DIRECTORY}bin/mayan-edms.py celery --settings=mayan.settings.production worker -Ofair -l ERROR -n periodic@%%h --task-class=periodic --concurrency=1
+directory = ${INSTALLATION_DIRECTORY}
+user = www-data
+stdout_logfile = /var/log/mayan/worker-periodic-stdout.log
+stderr_logfile = /var/log/mayan/worker-periodic-stderr.log
 autostart = true
 autorestart = true
 startsecs = 10
@@ -3,6 +3,7 @@ from __future__ import unicode_literals, absolute_import
 import logging
 
 from django.apps import apps
+from django.db.models import Q
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +12,7 @@ class ModelPermission(object):
     _registry = {}
     _proxies = {}
     _inheritances = {}
+    _inheritance_queries = {}
 
     @classmethod
     def register(cls, model, permissions):
@@ -76,9 +78,57 @@ class ModelPermission(object):
         cls._proxies[model] = source
 
     @classmethod
-    def register_inheritance(cls, model, related):
+    def register_inheritance(cls, model, related, related_model=None, query_function=None):
+        """
+        Make the instances of model inherit the access granted to the
+        object returned by related. related should be a double underscore
+        ORM path to a relation field. When it is a callable or a method
+        name instead, the relation must be declared alongside as a query:
+        query_function receives a queryset of accessible related_model
+        instances and returns a Q object selecting the instances of model
+        that inherit their access.
+        """
         cls._inheritances[model] = related
+        if query_function:
+            cls._inheritance_queries[model] = (related_model, query_function)
 
     @classmethod
     def get_inheritance(cls, model):
         return cls._inheritances[model]
+
+    @classmethod
+    def get_inherited_object(cls, instance):
+        """
+        Return the object from which instance inherits its access. Double
+        underscore ORM paths are followed one relation at a time. Raise
+        KeyError if the model of instance doesn't inherit access.
+        """
+        from common.utils import return_attrib
+
+        related = cls.get_inheritance(model=type(instance))
+
+        try:
+            related = related.replace('__', '.')
+        except AttributeError:
+            # A callable
+            pass
+
+        return return_attrib(instance, related)
+
+    @classmethod
+    def get_inheritance_query(cls, model):
+        """
+        Return the parent model and the query function of the inheritance
+        of model. Raise KeyError if the model doesn't inherit access and
+        FieldDoesNotExist if its inheritance is not expressed as a query.
+        """
+        from common.utils import get_related_model
+
+        try:
+            return cls._inheritance_queries[model]
+        except KeyError:
+            related = cls.get_inheritance(model=model)
+            return (
+                get_related_model(model=model, path=related),
+                lambda queryset: Q(**{'{}__in'.format(related): queryset})
+            )
@@ -3,14 +3,14 @@ from __future__ import absolute_import, unicode_literals
 import logging
 
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
 from django.db import models
 from django.db.models import Q
 from django.utils.translation import ugettext, ugettext_lazy as _
 
 from common.utils import return_attrib
 from permissions import Permission
-from permissions.models import StoredPermission
+from permissions.models import Role, StoredPermission
 
 from .exceptions import PermissionNotValidForClass
 from .classes import ModelPermission
@@ -48,9 +48,7 @@ class AccessControlListManager(models.Manager):
                 obj = return_attrib(obj, related)
 
             try:
-                parent_accessor = ModelPermission.get_inheritance(
-                    model=obj._meta.model
-                )
+                ModelPermission.get_inheritance(model=obj._meta.model)
             except AttributeError:
                 # AttributeError means non model objects: ie Statistics
                 # These can't have ACLs so we raise PermissionDenied
@@ -60,8 +58,9 @@ class AccessControlListManager(models.Manager):
             else:
                 try:
                     return self.check_access(
-                        obj=getattr(obj, parent_accessor),
-                        permissions=permissions, user=user
+                        obj=ModelPermission.get_inherited_object(
+                            instance=obj
+                        ), permissions=permissions, user=user
                     )
                 except PermissionDenied:
                     pass
@@ -90,6 +89,76 @@ class AccessControlListManager(models.Manager):
                 permissions, obj, user, user_roles
             )
 
+    def check_access_bulk(self, permissions, user, objects, related=None):
+        """
+        Bulk version of check_access. Instead of raising PermissionDenied
+        return the set of objects from the objects list to which the user
+        has access. Direct and inherited ACLs are resolved for the whole
+        list at once, using a single query per model instead of a chain of
+        queries per object.
+        """
+        objects = list(objects)
+
+        if user.is_superuser or user.is_staff:
+            logger.debug(
+                'Permissions "%s" on bulk objects granted to user "%s" as '
+                'superuser or staff', permissions, user
+            )
+            return set(objects)
+
+        try:
+            Permission.check_permissions(
+                requester=user, permissions=permissions
+            )
+        except PermissionDenied:
+            try:
+                stored_permissions = [
+                    permission.stored_permission for permission in permissions
+                ]
+            except TypeError:
+                # Not a list of permissions, just one
+                stored_permissions = (permissions.stored_permission,)
+
+            # Anonymous users don't have groups, the roles query is empty
+            user_roles = Role.objects.filter(groups__in=user.groups.all())
+
+            targets = {}
+            for obj in objects:
+                if related:
+                    target = return_attrib(obj, related)
+                else:
+                    target = obj
+
+                try:
+                    model = target._meta.model
+                except AttributeError:
+                    # Non model objects: ie Statistics
+                    # These can't have ACLs so access is denied
+                    continue
+                else:
+                    targets.setdefault(model, {}).setdefault(
+                        target.pk, []
+                    ).append(obj)
+
+            result = set()
+            for model, target_objects in targets.items():
+                granted_pks = self._get_granted_pks(
+                    model=model, pks=target_objects.keys(),
+                    stored_permissions=stored_permissions,
+                    user_roles=user_roles
+                )
+                for pk in granted_pks:
+                    result.update(target_objects[pk])
+
+            logger.debug(
+                'Permissions "%s" granted to user "%s" for %d of %d objects',
+                permissions, user, len(result), len(objects)
+            )
+
+            return result
+        else:
+            return set(objects)
+
     def filter_by_access(self, permission, user, queryset):
         if user.is_superuser or user.is_staff:
             logger.debug('Unfiltered queryset returned to user "%s" as superuser or staff',
@@ -101,74 +170,151 @@ class AccessControlListManager(models.Manager):
                 requester=user, permissions=(permission,)
             )
         except PermissionDenied:
-            user_roles = []
-            for group in user.groups.all():
-                for role in group.roles.all():
-                    user_roles.append(role)
+            # Anonymous users don't have groups, the roles query is empty
+            user_roles = Role.objects.filter(groups__in=user.groups.all())
 
             try:
-                parent_accessor = ModelPermission.get_inheritance(
-                    model=queryset.model
+                acl_query = self.get_access_query(
+                    model=queryset.model,
+                    stored_permissions=(permission.stored_permission,),
+                    user_roles=user_roles
                 )
-            except KeyError:
-                parent_acl_query = Q()
-            else:
-                instance = queryset.first()
-                if instance:
-                    parent_object = getattr(instance, parent_accessor)
-
-                    try:
-                        # Try to see if parent_object is a function
-                        parent_object()
-                    except TypeError:
-                        # Is not a function, try it as a field
-                        parent_content_type = ContentType.objects.get_for_model(
-                            parent_object
-                        )
-                        parent_queryset = self.filter(
-                            content_type=parent_content_type, role__in=user_roles,
-                            permissions=permission.stored_permission
-                        )
-                        parent_acl_query = Q(
-                            **{
-                                '{}__pk__in'.format(
-                                    parent_accessor
-                                ): parent_queryset.values_list(
-                                    'object_id', flat=True
-                                )
-                            }
-                        )
-                    else:
-                        # Is a function. Can't perform Q object filtering.
-                        # Perform iterative filtering.
-                        result = []
-                        for entry in queryset:
-                            try:
-                                self.check_access(permissions=permission, user=user, obj=entry)
-                            except PermissionDenied:
-                                pass
-                            else:
-                                result.append(entry.pk)
-
-                        return queryset.filter(pk__in=result)
-                else:
-                    parent_acl_query = Q()
-
-            # Directly granted access
-            content_type = ContentType.objects.get_for_model(queryset.model)
-            acl_query = Q(pk__in=self.filter(
-                content_type=content_type, role__in=user_roles,
-                permissions=permission.stored_permission
-            ).values_list('object_id', flat=True))
+            except FieldDoesNotExist:
+                # The model inherits access through a callable that was not
+                # declared with a query function. Can't perform Q object
+                # filtering, resolve the access of the rows in bulk.
+                logger.warning(
+                    'ACL inheritance of model "%s" is not expressed as a '
+                    'query, filtering its queryset in Python',
+                    queryset.model
+                )
+                granted = self.check_access_bulk(
+                    permissions=permission, user=user, objects=queryset
+                )
+                return queryset.filter(pk__in=[entry.pk for entry in granted])
+
             logger.debug(
                 'Filtered queryset returned to user "%s" based on roles "%s"',
                 user, user_roles
             )
 
-            return queryset.filter(parent_acl_query | acl_query)
+            return queryset.filter(acl_query)
         else:
             return queryset
 
+    def get_access_query(self, model, stored_permissions, user_roles, _visited=None):
+        """
+        Return a Q object that selects the instances of model to which the
+        roles have been granted any of the stored permissions, either
+        directly or via the model's ACL inheritance chain. Each inheritance
+        level is compiled into a nested subquery so the whole filter is
+        executed as a single SQL statement. Raise FieldDoesNotExist if
+        the inheritance chain can't be expressed as a query.
+        """
+        _visited = (_visited or ()) + (model,)
+
+        acl_query = self._get_direct_access_query(
+            model=model, stored_permissions=stored_permissions,
+            user_roles=user_roles
+        )
+
+        try:
+            parent_model, query_function = ModelPermission.get_inheritance_query(
+                model=model
+            )
+        except KeyError:
+            return acl_query
+
+        if parent_model in _visited:
+            # Self referencing inheritance (ie: the root of a tree), only
+            # the direct ACLs of the parent apply.
+            parent_acl_query = self._get_direct_access_query(
+                model=parent_model, stored_permissions=stored_permissions,
+                user_roles=user_roles
+            )
+        else:
+            parent_acl_query = self.get_access_query(
+                model=parent_model, stored_permissions=stored_permissions,
+                user_roles=user_roles, _visited=_visited
+            )
+
+        return acl_query | query_function(
+            parent_model._default_manager.filter(
+                parent_acl_query
+            ).values('pk')
+        )
+
+    def _get_direct_access_query(self, model, stored_permissions, user_roles):
+        return Q(
+            pk__in=self.filter(
+                content_type=ContentType.objects.get_for_model(model),
+                permissions__in=stored_permissions, role__in=user_roles
+            ).values('object_id')
+        )
+
+    def _get_granted_pks(self, model, pks, stored_permissions, user_roles):
+        """
+        Return the subset of the primary keys of model instances for which
+        the roles have been granted any of the stored permissions, either
+        directly or via the model's ACL inheritance.
+        """
+        pks = set(pks)
+
+        if not pks:
+            return set()
+
+        try:
+            acl_query = self.get_access_query(
+                model=model, stored_permissions=stored_permissions,
+                user_roles=user_roles
+            )
+        except FieldDoesNotExist:
+            pass
+        else:
+            return set(
+                model._default_manager.filter(pk__in=pks).filter(
+                    acl_query
+                ).values_list('pk', flat=True)
+            )
+
+        # Inheritance via an undeclared callable, check the direct ACLs
+        # and then resolve the parents by calling the accessor of each
+        # instance.
+        result = set(
+            self.filter(
+                content_type=ContentType.objects.get_for_model(model),
+                object_id__in=pks, permissions__in=stored_permissions,
+                role__in=user_roles
+            ).values_list('object_id', flat=True)
+        )
+
+        parents = {}
+        for instance in model._default_manager.filter(pk__in=pks - result):
+            parent_object = ModelPermission.get_inherited_object(
+                instance=instance
+            )
+            if parent_object == instance:
+                continue
+
+            try:
+                parents.setdefault(
+                    parent_object._meta.model, {}
+                ).setdefault(parent_object.pk, []).append(instance.pk)
+            except AttributeError:
+                # Not a model instance, can't have ACLs
+                pass
+
+        for parent_model, parent_pks in parents.items():
+            granted_parent_pks = self._get_granted_pks(
+                model=parent_model, pks=parent_pks.keys(),
+                stored_permissions=stored_permissions,
+                user_roles=user_roles
+            )
+            for parent_pk in granted_parent_pks:
+                result.update(parent_pks[parent_pk])
+
+        return result
+
     def get_inherited_permissions(self, role, obj):
         try:
             instance = obj.first()
@@ -179,11 +325,12 @@ class AccessControlListManager(models.Manager):
                 return StoredPermission.objects.none()
 
         try:
-            parent_accessor = ModelPermission.get_inheritance(type(instance))
+            parent_object = ModelPermission.get_inherited_object(
+                instance=instance
+            )
         except KeyError:
             return StoredPermission.objects.none()
         else:
-            parent_object = return_attrib(instance, parent_accessor)
             content_type = ContentType.objects.get_for_model(parent_object)
             try:
                 return self.get(
@@ -1,10 +1,13 @@
 from __future__ import absolute_import, unicode_literals
 
+from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import PermissionDenied
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from common.tests import BaseTestCase
-from documents.models import Document, DocumentType
+from documents.models import Document, DocumentPage, DocumentType
 from documents.permissions import permission_document_view
 from documents.tests import (
     TEST_SMALL_DOCUMENT_PATH, TEST_DOCUMENT_TYPE_LABEL,
@@ -61,6 +64,14 @@ class PermissionTestCase(BaseTestCase):
             ), []
         )
 
+    def test_filtering_anonymous_user(self):
+        self.assertQuerysetEqual(
+            AccessControlList.objects.filter_by_access(
+                permission=permission_document_view, user=AnonymousUser(),
+                queryset=Document.objects.all()
+            ), []
+        )
+
     def test_check_access_with_acl(self):
         acl = AccessControlList.objects.create(
             content_object=self.document_1, role=self.role
@@ -159,3 +170,161 @@ class PermissionTestCase(BaseTestCase):
         self.assertTrue(self.document_1 in result)
         self.assertTrue(self.document_2 in result)
         self.assertTrue(self.document_3 in result)
+
+    def test_check_access_bulk_without_permissions(self):
+        self.assertEqual(
+            AccessControlList.objects.check_access_bulk(
+                permissions=(permission_document_view,), user=self.user,
+                objects=(self.document_1, self.document_2, self.document_3)
+            ), set()
+        )
+
+    def test_check_access_bulk_anonymous_user(self):
+        self.assertEqual(
+            AccessControlList.objects.check_access_bulk(
+                permissions=(permission_document_view,),
+                user=AnonymousUser(),
+                objects=(self.document_1, self.document_2, self.document_3)
+            ), set()
+        )
+
+    def test_check_access_bulk_with_acl(self):
+        acl = AccessControlList.objects.create(
+            content_object=self.document_1, role=self.role
+        )
+        acl.permissions.add(permission_document_view.stored_permission)
+
+        self.assertEqual(
+            AccessControlList.objects.check_access_bulk(
+                permissions=(permission_document_view,), user=self.user,
+                objects=(self.document_1, self.document_2, self.document_3)
+            ), set((self.document_1,))
+        )
+
+    def test_check_access_bulk_with_inherited_acl_and_local_acl(self):
+        acl = AccessControlList.objects.create(
+            content_object=self.document_type_1, role=self.role
+        )
+        acl.permissions.add(permission_document_view.stored_permission)
+
+        acl = AccessControlList.objects.create(
+            content_object=self.document_3, role=self.role
+        )
+        acl.permissions.add(permission_document_view.stored_permission)
+
+        self.assertEqual(
+            AccessControlList.objects.check_access_bulk(
+                permissions=(permission_document_view,), user=self.user,
+                objects=(self.document_1, self.document_2, self.document_3)
+            ), set((self.document_1, self.document_2, self.document_3))
+        )
+
+    def test_check_access_bulk_query_count(self):
+        acl = AccessControlList.objects.create(
+            content_object=self.document_type_1, role=self.role
+        )
+        acl.permissions.add(permission_document_view.stored_permission)
+
+        with CaptureQueriesContext(connection) as single_queries:
+            AccessControlList.objects.check_access_bulk(
+                permissions=(permission_document_view,), user=self.user,
+                objects=(self.document_1,)
+            )
+
+        with CaptureQueriesContext(connection) as bulk_queries:
+            AccessControlList.objects.check_access_bulk(
+                permissions=(permission_document_view,), user=self.user,
+                objects=(self.document_1, self.document_2, self.document_3)
+            )
+
+        self.assertEqual(
+            len(single_queries.captured_queries),
+            len(bulk_queries.captured_queries)
+        )
+
+    def test_filtering_with_inherited_permissions_query_count(self):
+        acl = AccessControlList.objects.create(
+            content_object=self.document_type_1, role=self.role
+        )
+        acl.permissions.add(permission_document_view.stored_permission)
+
+        with CaptureQueriesContext(connection) as queries:
+            list(
+                AccessControlList.objects.filter_by_access(
+                    permission=permission_document_view, user=self.user,
+                    queryset=Document.objects.all()
+                )
+            )
+
+        with open(TEST_SMALL_DOCUMENT_PATH) as file_object:
+            self.document_type_1.new_document(file_object=file_object)
+
+        with open(TEST_SMALL_DOCUMENT_PATH) as file_object:
+            self.document_type_2.new_document(file_object=file_object)
+
+        with CaptureQueriesContext(connection) as more_queries:
+            result = list(
+                AccessControlList.objects.filter_by_access(
+                    permission=permission_document_view, user=self.user,
+                    queryset=Document.objects.all()
+                )
+            )
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(
+            len(queries.captured_queries), len(more_queries.captured_queries)
+        )
+
+    def test_filtering_document_pages_with_inherited_permissions_query_count(self):
+        acl = AccessControlList.objects.create(
+            content_object=self.document_type_1, role=self.role
+        )
+        acl.permissions.add(permission_document_view.stored_permission)
+
+        with CaptureQueriesContext(connection) as queries:
+            list(
+                AccessControlList.objects.filter_by_access(
+                    permission=permission_document_view, user=self.user,
+                    queryset=DocumentPage.objects.all()
+                )
+            )
+
+        with open(TEST_SMALL_DOCUMENT_PATH) as file_object:
+            document = self.document_type_1.new_document(
+                file_object=file_object
+            )
+
+        with open(TEST_SMALL_DOCUMENT_PATH) as file_object:
+            self.document_type_2.new_document(file_object=file_object)
+
+        with CaptureQueriesContext(connection) as more_queries:
+            result = list(
+                AccessControlList.objects.filter_by_access(
+                    permission=permission_document_view, user=self.user,
+                    queryset=DocumentPage.objects.all()
+                )
+            )
+
+        self.assertEqual(
+            set(result), set(
+                DocumentPage.objects.filter(
+                    document_version__document__in=(
+                        self.document_1, self.document_2, document
+                    )
+                )
+            )
+        )
+        self.assertEqual(
+            len(queries.captured_queries), len(more_queries.captured_queries)
+        )
+
+    def test_check_access_document_page_inherited_permission(self):
+        acl = AccessControlList.objects.create(
+            content_object=self.document_type_1, role=self.role
+        )
+        acl.permissions.add(permission_document_view.stored_permission)
+
+        AccessControlList.objects.check_access(
+            permissions=(permission_document_view,), user=self.user,
+            obj=self.document_1.pages.first()
+        )
@@ -205,6 +205,77 @@ MayanImage.prototype.load = function () {
     $.fn.matchHeight._maintainScroll = true;
 };
 
+/* MayanTiledImage class */
+
+var MayanTiledImage = function (options) {
+    this.element = options.element;
+    this.zoom = parseInt(this.element.data('zoom')) || 100;
+    this.load();
+}
+
+MayanTiledImage.intialize = function () {
+    $('.mayan-tiled-image').each(function () {
+        new MayanTiledImage({element: $(this)});
+    });
+}
+
+MayanTiledImage.prototype.load = function () {
+    var self = this;
+
+    $.getJSON(this.element.data('url'), function (data) {
+        self.render(data);
+    }).fail(function () {
+        self.element.html('<span class="fa-stack fa-lg"><i class="fa fa-file-o fa-stack-2x"></i><i class="fa fa-times fa-stack-1x text-danger"></i></span>');
+    });
+};
+
+MayanTiledImage.prototype.render = function (data) {
+    var url = this.element.data('url').split('?');
+    var width = this.element.width() * this.zoom / 100;
+    var level = data.max_level;
+
+    // Use the smallest level that is still as wide as the zoomed page
+    while (level > 0 && Math.ceil(data.width / Math.pow(2, data.max_level - level + 1)) >= width) {
+        level--;
+    }
+
+    var scale = Math.pow(2, data.max_level - level);
+    var levelWidth = Math.ceil(data.width / scale);
+    var levelHeight = Math.ceil(data.height / scale);
+    var ratio = width / levelWidth;
+    var container = this.element.closest('.scrollable');
+    var tiles = $('<div class="tiled-image-tiles"></div>').css({
+        height: levelHeight * ratio,
+        position: 'relative',
+        width: levelWidth * ratio
+    });
+
+    for (var y = 0; y * data.tile_size < levelHeight; y++) {
+        for (var x = 0; x * data.tile_size < levelWidth; x++) {
+            $('<img class="lazy-load-tile" src="#" />').attr(
+                'data-url', url[0] + level + '/' + x + '/' + y + '/?' + (url[1] || '')
+            ).css({
+                height: Math.min(data.tile_size, levelHeight - y * data.tile_size) * ratio,
+                left: x * data.tile_size * ratio,
+                position: 'absolute',
+                top: y * data.tile_size * ratio,
+                width: Math.min(data.tile_size, levelWidth - x * data.tile_size) * ratio
+            }).appendTo(tiles);
+        }
+    }
+
+    this.element.empty().append(tiles);
+
+    // Only the tiles near the visible part of the page are requested
+    tiles.find('img.lazy-load-tile').lazyload({
+        appear: function (elements_left, settings) {
+            $(this).attr('src', $(this).attr('data-url'));
+        },
+        container: container.length ? container : window,
+        threshold: 400
+    });
+};
+
 jQuery(document).ready(function() {
     var app = new App();
 
@@ -212,6 +283,8 @@ jQuery(document).ready(function() {
 
     MayanImage.intialize();
 
+    MayanTiledImage.intialize();
+
     app.doMessages();
 
     app.setupSelect2();
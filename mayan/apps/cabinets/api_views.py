@@ -1,16 +1,22 @@
 from __future__ import absolute_import, unicode_literals
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
+from django.utils.encoding import force_text
+from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from acls.models import AccessControlList
 from documents.models import Document
 from documents.permissions import permission_document_view
+from document_indexing.tasks import task_index_document
 from rest_api.filters import MayanObjectPermissionsFilter
 from rest_api.permissions import MayanPermission
 
+from .events import event_cabinets_add_document
 from .models import Cabinet
 from .permissions import (
     permission_cabinet_add_document, permission_cabinet_create,
@@ -18,7 +24,8 @@ from .permissions import (
     permission_cabinet_remove_document, permission_cabinet_view
 )
 from .serializers import (
-    CabinetDocumentSerializer, CabinetSerializer, NewCabinetDocumentSerializer,
+    CabinetDocumentSerializer, CabinetSerializer,
+    DocumentCabinetBulkSerializer, NewCabinetDocumentSerializer,
     WritableCabinetSerializer
 )
 
@@ -44,6 +51,113 @@ class APIDocumentCabinetListView(generics.ListAPIView):
         return queryset
 
 
+class APIDocumentCabinetBulkView(generics.GenericAPIView):
+    permission_classes = (IsAuthenticated,)
+    serializer_class = DocumentCabinetBulkSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs['many'] = True
+        return super(APIDocumentCabinetBulkView, self).get_serializer(
+            *args, **kwargs
+        )
+
+    def perform_bulk_add(self, items):
+        """
+        Resolve the cabinets, documents, access and existing memberships of
+        all the items up front and add the new ones with a single bulk
+        insert. Every affected document is queued for indexing once.
+        """
+        cabinets = Cabinet.objects.in_bulk(
+            set([item['cabinet_pk'] for item in items])
+        )
+        documents = Document.objects.in_bulk(
+            set([item['document_pk'] for item in items])
+        )
+
+        cabinets_allowed = AccessControlList.objects.check_access_bulk(
+            permissions=permission_cabinet_add_document,
+            user=self.request.user, objects=cabinets.values()
+        )
+        documents_allowed = AccessControlList.objects.check_access_bulk(
+            permissions=permission_cabinet_add_document,
+            user=self.request.user, objects=documents.values()
+        )
+
+        CabinetDocument = Cabinet.documents.through
+
+        existing = set(
+            CabinetDocument.objects.filter(
+                cabinet__in=cabinets.keys(), document__in=documents.keys()
+            ).values_list('cabinet', 'document')
+        )
+
+        results = []
+        to_create = {}
+
+        for item in items:
+            result = {
+                'cabinet_pk': item['cabinet_pk'],
+                'document_pk': item['document_pk']
+            }
+            results.append(result)
+
+            cabinet = cabinets.get(item['cabinet_pk'])
+            document = documents.get(item['document_pk'])
+
+            if not cabinet:
+                result['error'] = _('Cabinet not found.')
+            elif not document:
+                result['error'] = _('Document not found.')
+            elif cabinet not in cabinets_allowed or document not in documents_allowed:
+                result['error'] = _('Insufficient access.')
+            elif (cabinet.pk, document.pk) in existing:
+                result['status'] = 'unchanged'
+            else:
+                existing.add((cabinet.pk, document.pk))
+                to_create[(cabinet.pk, document.pk)] = (cabinet, document)
+                result['status'] = 'added'
+
+        with transaction.atomic():
+            CabinetDocument.objects.bulk_create(
+                [
+                    CabinetDocument(cabinet=cabinet, document=document)
+                    for cabinet, document in to_create.values()
+                ]
+            )
+
+            for cabinet, document in to_create.values():
+                event_cabinets_add_document.commit(
+                    action_object=cabinet, actor=self.request.user,
+                    target=document
+                )
+
+        for result in results:
+            if 'error' in result:
+                result['error'] = force_text(result['error'])
+                result['status'] = 'error'
+
+        for document_pk in sorted(set([key[1] for key in to_create])):
+            task_index_document.apply_async(
+                kwargs=dict(document_id=document_pk)
+            )
+
+        return results
+
+    def post(self, request, *args, **kwargs):
+        """
+        Add documents to cabinets in a single request. Accepts a list of
+        cabinet and document entries and returns the outcome of each entry
+        in the same order.
+        """
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(
+            self.perform_bulk_add(items=serializer.validated_data)
+        )
+
+
 class APICabinetListView(generics.ListCreateAPIView):
     filter_backends = (MayanObjectPermissionsFilter,)
     mayan_object_permissions = {'GET': (permission_cabinet_view,)}
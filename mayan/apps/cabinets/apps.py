@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 from django.apps import apps
+from django.db.models import Q
 from django.utils.translation import ugettext_lazy as _
 
 from acls import ModelPermission
@@ -71,13 +72,19 @@ class CabinetsApp(MayanAppConfig):
             )
         )
         ModelPermission.register_inheritance(
-            model=Cabinet, related='get_root',
+            model=Cabinet, related='get_root', related_model=Cabinet,
+            query_function=lambda queryset: Q(
+                tree_id__in=Cabinet.objects.filter(
+                    parent=None, pk__in=queryset
+                ).values('tree_id')
+            )
         )
 
         SourceColumn(
             source=Document, label=_('Cabinets'),
             func=lambda context: widget_document_cabinets(
-                document=context['object'], user=context['request'].user
+                context=context, document=context['object'],
+                user=context['request'].user
             ), order=1
         )
 
@@ -197,3 +197,12 @@ class NewCabinetDocumentSerializer(serializers.Serializer):
             )
 
         return {'documents_pk_list': documents_pk_list}
+
+
+class DocumentCabinetBulkSerializer(serializers.Serializer):
+    cabinet_pk = serializers.IntegerField(
+        help_text=_('Primary key of the cabinet to which to add the document.')
+    )
+    document_pk = serializers.IntegerField(
+        help_text=_('Primary key of the document to be added.')
+    )
@@ -212,6 +212,47 @@ class CabinetAPITestCase(APITestCase):
             )
         )
 
+    def test_document_cabinet_bulk_add(self):
+        cabinet = Cabinet.objects.create(label=TEST_CABINET_LABEL)
+        cabinet_2 = Cabinet.objects.create(label=TEST_CABINET_EDITED_LABEL)
+
+        response = self.client.post(
+            reverse('rest_api:document-cabinet-bulk'), data=[
+                {'cabinet_pk': cabinet.pk, 'document_pk': self.document.pk},
+                {'cabinet_pk': cabinet.pk, 'document_pk': self.document_2.pk},
+                {'cabinet_pk': cabinet_2.pk, 'document_pk': self.document.pk},
+                {'cabinet_pk': cabinet.pk, 'document_pk': self.document.pk}
+            ], format='json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in response.data],
+            ['added', 'added', 'added', 'unchanged']
+        )
+        self.assertQuerysetEqual(
+            cabinet.documents.all(), map(
+                repr, (self.document, self.document_2)
+            ), ordered=False
+        )
+        self.assertQuerysetEqual(
+            self.document.cabinets.all(), map(repr, (cabinet, cabinet_2)),
+            ordered=False
+        )
+
+    def test_document_cabinet_bulk_add_anonymous(self):
+        cabinet = Cabinet.objects.create(label=TEST_CABINET_LABEL)
+        self.client.logout()
+
+        response = self.client.post(
+            reverse('rest_api:document-cabinet-bulk'), data=[
+                {'cabinet_pk': cabinet.pk, 'document_pk': self.document.pk}
+            ], format='json'
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(cabinet.documents.count(), 0)
+
     def test_cabinet_list_view(self):
         cabinet = Cabinet.objects.create(label=TEST_CABINET_LABEL)
         Cabinet.objects.create(
@@ -1,15 +1,18 @@
 from __future__ import unicode_literals
 
 from django.core.exceptions import ValidationError
-from django.test import override_settings
+from django.test import RequestFactory, override_settings
 
+from acls.models import AccessControlList
 from common.tests import BaseTestCase
 from documents.models import DocumentType
 from documents.tests import TEST_DOCUMENT_TYPE_LABEL, TEST_SMALL_DOCUMENT_PATH
 
 from ..models import Cabinet
+from ..permissions import permission_cabinet_view
+from ..widgets import widget_document_cabinets
 
-from .literals import TEST_CABINET_LABEL
+from .literals import TEST_CABINET_EDITED_LABEL, TEST_CABINET_LABEL
 
 
 @override_settings(OCR_AUTO_OCR=False)
@@ -80,3 +83,57 @@ class CabinetTestCase(BaseTestCase):
 
         self.assertEqual(cabinet.documents.count(), 0)
         self.assertQuerysetEqual(cabinet.documents.all(), ())
+
+    def test_inner_cabinet_access_inheritance(self):
+        cabinet = Cabinet.objects.create(label=TEST_CABINET_LABEL)
+        inner_cabinet = Cabinet.objects.create(
+            parent=cabinet, label=TEST_CABINET_LABEL
+        )
+        other_cabinet = Cabinet.objects.create(
+            label=TEST_CABINET_EDITED_LABEL
+        )
+
+        acl = AccessControlList.objects.create(
+            content_object=cabinet, role=self.role
+        )
+        acl.permissions.add(permission_cabinet_view.stored_permission)
+
+        self.assertQuerysetEqual(
+            AccessControlList.objects.filter_by_access(
+                permission=permission_cabinet_view, user=self.user,
+                queryset=Cabinet.objects.all()
+            ), map(repr, (cabinet, inner_cabinet)), ordered=False
+        )
+        self.assertEqual(
+            AccessControlList.objects.check_access_bulk(
+                permissions=permission_cabinet_view, user=self.user,
+                objects=(cabinet, inner_cabinet, other_cabinet)
+            ), set((cabinet, inner_cabinet))
+        )
+
+    def test_document_cabinets_widget_object_list(self):
+        cabinet = Cabinet.objects.create(label=TEST_CABINET_LABEL)
+        other_cabinet = Cabinet.objects.create(
+            label=TEST_CABINET_EDITED_LABEL
+        )
+        cabinet.documents.add(self.document)
+        other_cabinet.documents.add(self.document)
+
+        self.grant_access(obj=cabinet, permission=permission_cabinet_view)
+
+        context = {
+            'object_list': [self.document],
+            'request': RequestFactory().get('/')
+        }
+
+        result = widget_document_cabinets(
+            context=context, document=self.document, user=self.user
+        )
+
+        self.assertTrue(TEST_CABINET_LABEL in result)
+        self.assertFalse(TEST_CABINET_EDITED_LABEL in result)
+        self.assertEqual(
+            result, widget_document_cabinets(
+                document=self.document, user=self.user
+            )
+        )
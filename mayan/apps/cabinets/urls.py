@@ -3,8 +3,9 @@ from __future__ import unicode_literals
 from django.conf.urls import url
 
 from .api_views import (
-    APIDocumentCabinetListView, APICabinetDocumentListView,
-    APICabinetDocumentView, APICabinetListView, APICabinetView
+    APIDocumentCabinetBulkView, APIDocumentCabinetListView,
+    APICabinetDocumentListView, APICabinetDocumentView, APICabinetListView,
+    APICabinetView
 )
 from .views import (
     DocumentAddToCabinetView, DocumentCabinetListView,
@@ -66,6 +67,10 @@ api_urls = [
         name='cabinet-detail'
     ),
     url(r'^cabinets/$', APICabinetListView.as_view(), name='cabinet-list'),
+    url(
+        r'^documents/cabinets/bulk/$', APIDocumentCabinetBulkView.as_view(),
+        name='document-cabinet-bulk'
+    ),
     url(
         r'^documents/(?P<pk>[0-9]+)/cabinets/$',
         APIDocumentCabinetListView.as_view(), name='document-cabinet-list'
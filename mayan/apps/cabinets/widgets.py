@@ -33,17 +33,91 @@ def jstree_data(node, selected_node):
     return result
 
 
-def widget_document_cabinets(document, user):
+def get_object_list_cabinets(context, user):
     """
-    A cabinet widget that displays the cabinets for the given document
+    Return a dictionary of the cabinets the user can view for each document
+    of the context's object list, by document primary key. The cabinets of
+    the entire list are resolved at once and cached in the request for the
+    following rows. Return None if there is no object list.
     """
     AccessControlList = apps.get_model(
         app_label='acls', model_name='AccessControlList'
     )
+    DocumentCabinet = apps.get_model(
+        app_label='cabinets', model_name='DocumentCabinet'
+    )
+
+    object_list = context.get('object_list')
+    request = context.get('request')
+
+    if object_list is None or request is None:
+        return None
+
+    cabinets_cache = request.__dict__.setdefault(
+        '_document_cabinets_cache', {}
+    )
+
+    try:
+        return cabinets_cache[id(object_list)]
+    except KeyError:
+        pass
+
+    document_pks = [
+        entry.pk for entry in object_list if getattr(entry, 'pk', None)
+    ]
 
     cabinets = AccessControlList.objects.filter_by_access(
-        permission_cabinet_view, user, queryset=document.document_cabinets().all()
+        permission_cabinet_view, user,
+        queryset=DocumentCabinet.objects.filter(
+            documents__in=document_pks
+        ).distinct()
     )
+    cabinets = list(cabinets.order_by('parent__label', 'label'))
+    cabinet_positions = {
+        cabinet.pk: (position, cabinet)
+        for position, cabinet in enumerate(cabinets)
+    }
+
+    memberships = DocumentCabinet.documents.through.objects.filter(
+        cabinet_id__in=cabinet_positions.keys(), document_id__in=document_pks
+    ).values_list('document_id', 'cabinet_id')
+
+    result = {pk: [] for pk in document_pks}
+    for document_id, cabinet_id in memberships:
+        result[document_id].append(cabinet_positions[cabinet_id])
+
+    for document_id, entries in result.items():
+        result[document_id] = [
+            cabinet for position, cabinet in sorted(entries)
+        ]
+
+    cabinets_cache[id(object_list)] = result
+
+    return result
+
+
+def widget_document_cabinets(document, user, context=None):
+    """
+    A cabinet widget that displays the cabinets for the given document
+    """
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+
+    cabinets = None
+
+    if context is not None:
+        object_list_cabinets = get_object_list_cabinets(
+            context=context, user=user
+        )
+        if object_list_cabinets is not None:
+            cabinets = object_list_cabinets.get(document.pk)
+
+    if cabinets is None:
+        cabinets = AccessControlList.objects.filter_by_access(
+            permission_cabinet_view, user,
+            queryset=document.document_cabinets().all()
+        )
 
     return format_html_join(
         '\n', '<div class="cabinet-display">{}</div>',
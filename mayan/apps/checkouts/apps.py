@@ -2,8 +2,6 @@ from __future__ import absolute_import, unicode_literals
 
 from datetime import timedelta
 
-from kombu import Exchange, Queue
-
 from django.apps import apps
 from django.db.models.signals import pre_save
 from django.utils.translation import ugettext_lazy as _
@@ -92,21 +90,6 @@ class CheckoutsApp(MayanAppConfig):
             }
         )
 
-        app.conf.CELERY_QUEUES.append(
-            Queue(
-                'checkouts_periodic', Exchange('checkouts_periodic'),
-                routing_key='checkouts_periodic', delivery_mode=1
-            ),
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'checkouts.tasks.task_check_expired_check_outs': {
-                    'queue': 'checkouts_periodic'
-                },
-            }
-        )
-
         dashboard_main.add_widget(order=-1, widget=widget_checkouts)
 
         menu_facet.bind_links(links=(link_checkout_info,), sources=(Document,))
@@ -17,5 +17,7 @@ def checkedout_documents_queryset():
 widget_checkouts = DashboardWidget(
     label=_('Checkedout documents'),
     link=reverse_lazy('checkouts:checkout_list'),
-    icon='fa fa-shopping-cart', queryset=checkedout_documents_queryset
+    icon='fa fa-shopping-cart',
+    invalidation_models=('checkouts.DocumentCheckout',),
+    name='checkouts_checkouts', queryset=checkedout_documents_queryset
 )
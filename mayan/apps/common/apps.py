@@ -3,8 +3,6 @@ from __future__ import absolute_import, unicode_literals
 from datetime import timedelta
 import logging
 
-from kombu import Exchange, Queue
-
 from django import apps
 from django.conf import settings
 from django.conf.urls import include, url
@@ -17,6 +15,7 @@ from mayan.celery import app
 from navigation.classes import Separator, Text
 from rest_api.classes import APIEndPoint
 
+from .classes import DashboardWidget
 from .handlers import (
     handler_pre_initial_setup, handler_pre_upgrade,
     user_locale_profile_session_config, user_locale_profile_create
@@ -91,6 +90,8 @@ class CommonApp(MayanAppConfig):
 
         APIEndPoint(app=self, version_string='1')
 
+        DashboardWidget.connect_signals()
+
         app.conf.CELERYBEAT_SCHEDULE.update(
             {
                 'task_delete_stale_uploads': {
@@ -102,26 +103,6 @@ class CommonApp(MayanAppConfig):
             }
         )
 
-        app.conf.CELERY_QUEUES.extend(
-            (
-                Queue('default', Exchange('default'), routing_key='default'),
-                Queue('tools', Exchange('tools'), routing_key='tools'),
-                Queue(
-                    'common_periodic', Exchange('common_periodic'),
-                    routing_key='common_periodic', delivery_mode=1
-                ),
-            )
-        )
-
-        app.conf.CELERY_DEFAULT_QUEUE = 'default'
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'common.tasks.task_delete_stale_uploads': {
-                    'queue': 'common_periodic'
-                },
-            }
-        )
         menu_user.bind_links(
             links=(
                 Text(text=CommonApp.get_user_label_text), Separator(),
@@ -1,11 +1,17 @@
 from __future__ import unicode_literals
 
+import uuid
+
 from django.apps import apps
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 from django.urls import reverse
 from django.utils.encoding import force_text, python_2_unicode_compatible
 from django.utils.translation import ugettext
 
+from .literals import DASHBOARD_WIDGET_CACHE_TIMEOUT
+
 
 @python_2_unicode_compatible
 class Collection(object):
@@ -83,22 +89,110 @@ class Dashboard(object):
 
 
 class DashboardWidget(object):
+    """
+    Dashboard counter. Values are cached for cache_timeout seconds and
+    invalidated as soon as an instance of one of the invalidation_models is
+    saved or deleted. When a permission is given the queryset is filtered by
+    the access of the user and the value is cached per user.
+    """
     _registry = []
 
+    @classmethod
+    def connect_signals(cls):
+        for widget in cls._registry:
+            for model in widget.invalidation_models:
+                dispatch_uid = 'dashboard_widget_{}_{}'.format(
+                    widget.name, model
+                )
+                post_delete.connect(
+                    widget.handler_invalidate,
+                    dispatch_uid='{}_delete'.format(dispatch_uid),
+                    sender=apps.get_model(model), weak=False
+                )
+                post_save.connect(
+                    widget.handler_invalidate,
+                    dispatch_uid='{}_save'.format(dispatch_uid),
+                    sender=apps.get_model(model), weak=False
+                )
+
+    @classmethod
+    def get(cls, name):
+        for widget in cls._registry:
+            if widget.name == name:
+                return widget
+
+        raise KeyError(name)
+
     @classmethod
     def get_all(cls):
         return cls._registry
 
-    def __init__(self, label, func=None, icon=None, link=None, queryset=None, statistic_slug=None):
+    def __init__(self, label, func=None, icon=None, link=None, queryset=None, statistic_slug=None, name=None, cache_timeout=DASHBOARD_WIDGET_CACHE_TIMEOUT, invalidation_models=None, permission=None):
         self.label = label
         self.icon = icon
         self.link = link
         self.queryset = queryset
         self.func = func
         self.statistic_slug = statistic_slug
+        self.name = name or 'widget_{}'.format(len(self.__class__._registry))
+        self.cache_timeout = cache_timeout
+        self.invalidation_models = invalidation_models or ()
+        self.permission = permission
 
         self.__class__._registry.append(self)
 
+    def get_cache_key(self, user):
+        # The version token changes on every invalidation, orphaning all the
+        # per user values at once without having to know their keys.
+        version = cache.get(self.get_version_cache_key()) or ''
+
+        if self.permission and not (user.is_superuser or user.is_staff):
+            scope = 'user_{}'.format(user.pk)
+        else:
+            scope = 'all'
+
+        return 'dashboard_widget_{}_{}_{}'.format(self.name, version, scope)
+
+    def get_value(self, user):
+        """
+        Return the cached value of the widget for the user, calculating and
+        storing it on a cache miss.
+        """
+        cache_key = self.get_cache_key(user=user)
+        value = cache.get(cache_key)
+
+        if value is None:
+            value = self.render(user=user)
+            cache.set(cache_key, value, self.cache_timeout)
+
+        return value
+
+    def get_version_cache_key(self):
+        return 'dashboard_widget_{}_version'.format(self.name)
+
+    def handler_invalidate(self, sender, **kwargs):
+        self.invalidate()
+
+    def invalidate(self):
+        cache.set(self.get_version_cache_key(), uuid.uuid4().hex, None)
+
+    def render(self, user):
+        if self.func:
+            return self.func()
+
+        queryset = self.queryset()
+
+        if self.permission:
+            AccessControlList = apps.get_model(
+                app_label='acls', model_name='AccessControlList'
+            )
+
+            queryset = AccessControlList.objects.filter_by_access(
+                self.permission, user, queryset=queryset
+            )
+
+        return queryset.count()
+
 
 @python_2_unicode_compatible
 class ErrorLogNamespace(object):
@@ -1,6 +1,11 @@
 from __future__ import unicode_literals
 
+import binascii
 from io import BytesIO
+import os
+import struct
+import tarfile
+import time
 import zipfile
 
 try:
@@ -9,7 +14,20 @@ try:
 except:
     COMPRESSION = zipfile.ZIP_STORED
 
+from django.core.files import File
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils.encoding import force_bytes
+
+from .literals import COMPRESSED_FILE_CHUNK_SIZE
+
+ZIP_CENTRAL_DIRECTORY_STRUCTURE = b'<4s4B4HL2L5H2L'
+ZIP_DATA_DESCRIPTOR_STRUCTURE = b'<4sLLL'
+ZIP_END_OF_ARCHIVE_STRUCTURE = b'<4s4H2LH'
+ZIP_FLAG_DATA_DESCRIPTOR = 0x08
+ZIP_FLAG_UTF8 = 0x800
+ZIP_LIMIT = 0xFFFFFFFF
+ZIP_LOCAL_HEADER_STRUCTURE = b'<4s2B4HL2L2H'
+ZIP_VERSION = 20
 
 
 class NotACompressedFile(Exception):
@@ -90,19 +108,195 @@ class CompressedFile(object):
         return SimpleUploadedFile(name=filename, content=self.write().read())
 
     def children(self):
+        """
+        Return a generator of the member files of a ZIP or tar (plain,
+        gzip or bzip2) archive. Members are opened lazily and are read from
+        the archive as they are consumed, so they are never held
+        completely in memory.
+        """
         try:
-            # Try for a ZIP file
             zfobj = zipfile.ZipFile(self.file_object)
-            filenames = [
-                filename for filename in zfobj.namelist() if not filename.endswith('/')
-            ]
-            return (
-                SimpleUploadedFile(
-                    name=filename, content=zfobj.read(filename)
-                ) for filename in filenames
-            )
         except zipfile.BadZipfile:
-            raise NotACompressedFile
+            self.file_object.seek(0)
+            try:
+                tfobj = tarfile.open(fileobj=self.file_object, mode='r:*')
+            except tarfile.TarError:
+                raise NotACompressedFile
+            else:
+                return self._children_tar(tfobj=tfobj)
+        else:
+            return self._children_zip(zfobj=zfobj)
+
+    def _children_tar(self, tfobj):
+        for member in tfobj:
+            if member.isfile():
+                child = File(
+                    file=tfobj.extractfile(member),
+                    name=os.path.basename(member.name)
+                )
+                child.size = member.size
+                yield child
+
+    def _children_zip(self, zfobj):
+        for info in zfobj.infolist():
+            if not info.filename.endswith('/'):
+                child = File(
+                    file=zfobj.open(info),
+                    name=os.path.basename(info.filename)
+                )
+                child.size = info.file_size
+                yield child
 
     def close(self):
         self.zf.close()
+
+
+class StreamingZipFile(object):
+    """
+    Write only ZIP archive produced as a stream of bytes from an iterable
+    of (file object, archive name) pairs. Each member is read and
+    compressed one chunk at a time and its CRC and sizes are written after
+    its data in a data descriptor, so the archive is never seeked nor held
+    in memory. The member iterable is only advanced once the previous
+    member has been completely written. ZIP64 is not supported; members
+    and the whole archive must stay under 4 GB.
+    """
+    def __init__(self, members, chunk_size=COMPRESSED_FILE_CHUNK_SIZE, compression=COMPRESSION):
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self._buffer = b''
+        self._iterator = self._generate(members=members)
+
+    def __iter__(self):
+        return self._iterator
+
+    def _compress(self, file_input):
+        crc = 0
+        compressed_size = 0
+        size = 0
+
+        if self.compression == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15
+            )
+        else:
+            compressor = None
+
+        while True:
+            data = file_input.read(self.chunk_size)
+            if not data:
+                break
+
+            crc = binascii.crc32(data, crc) & ZIP_LIMIT
+            size += len(data)
+
+            if compressor:
+                data = compressor.compress(data)
+
+            if data:
+                compressed_size += len(data)
+                yield data
+
+        if compressor:
+            data = compressor.flush()
+            compressed_size += len(data)
+            yield data
+
+        if size > ZIP_LIMIT or compressed_size > ZIP_LIMIT:
+            raise zipfile.LargeZipFile(
+                'Member size exceeds the ZIP format limit.'
+            )
+
+        self._member_values = (crc, compressed_size, size)
+
+    def _generate(self, members):
+        central_directory = []
+        offset = 0
+
+        for file_input, arcname in members:
+            filename = force_bytes(arcname)
+            dos_date, dos_time = self._get_dos_date_time()
+            flags = ZIP_FLAG_DATA_DESCRIPTOR | ZIP_FLAG_UTF8
+
+            header = struct.pack(
+                ZIP_LOCAL_HEADER_STRUCTURE, b'PK\x03\x04', ZIP_VERSION, 0,
+                flags, self.compression, dos_time, dos_date, 0, 0, 0,
+                len(filename), 0
+            )
+            yield header + filename
+
+            member_offset = offset
+            offset += len(header) + len(filename)
+
+            for data in self._compress(file_input=file_input):
+                offset += len(data)
+                yield data
+
+            crc, compressed_size, size = self._member_values
+
+            data_descriptor = struct.pack(
+                ZIP_DATA_DESCRIPTOR_STRUCTURE, b'PK\x07\x08', crc,
+                compressed_size, size
+            )
+            offset += len(data_descriptor)
+            yield data_descriptor
+
+            if offset > ZIP_LIMIT:
+                raise zipfile.LargeZipFile(
+                    'Archive size exceeds the ZIP format limit.'
+                )
+
+            # Create system 0 is used for compatibility with Windows
+            central_directory.append(
+                struct.pack(
+                    ZIP_CENTRAL_DIRECTORY_STRUCTURE, b'PK\x01\x02',
+                    ZIP_VERSION, 0, ZIP_VERSION, 0, flags, self.compression,
+                    dos_time, dos_date, crc, compressed_size, size,
+                    len(filename), 0, 0, 0, 0, 0, member_offset
+                ) + filename
+            )
+
+        central_directory_size = 0
+        for entry in central_directory:
+            central_directory_size += len(entry)
+            yield entry
+
+        yield struct.pack(
+            ZIP_END_OF_ARCHIVE_STRUCTURE, b'PK\x05\x06', 0, 0,
+            len(central_directory), len(central_directory),
+            central_directory_size, offset, 0
+        )
+
+    def _get_dos_date_time(self):
+        year, month, day, hour, minute, second = time.localtime()[:6]
+
+        return (
+            ((year - 1980) << 9) | (month << 5) | day,
+            (hour << 11) | (minute << 5) | (second // 2)
+        )
+
+    def read(self, size=-1):
+        """
+        File like interface to allow the archive to be wrapped by file
+        download classes.
+        """
+        result = []
+        length = 0
+
+        while size is None or size < 0 or length < size:
+            if not self._buffer:
+                try:
+                    self._buffer = next(self._iterator)
+                except StopIteration:
+                    break
+
+            if size is None or size < 0:
+                data, self._buffer = self._buffer, b''
+            else:
+                data = self._buffer[:size - length]
+                self._buffer = self._buffer[len(data):]
+
+            result.append(data)
+            length += len(data)
+
+        return b''.join(result)
@@ -2,6 +2,8 @@ from __future__ import unicode_literals
 
 from django.utils.translation import ugettext_lazy as _
 
+COMPRESSED_FILE_CHUNK_SIZE = 64 * 1024
+DASHBOARD_WIDGET_CACHE_TIMEOUT = 60 * 5  # 5 minutes
 DELETE_STALE_UPLOADS_INTERVAL = 60 * 10  # 10 minutes
 MAYAN_PYPI_NAME = 'mayan-edms'
 PYPI_URL = 'https://pypi.python.org/pypi'
@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 from django.conf import settings
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
+from django.db.models import Q
 from django.db.models.query import QuerySet
 from django.http import HttpResponseRedirect
 from django.shortcuts import resolve_url
@@ -16,8 +17,8 @@ from .forms import DynamicForm
 
 __all__ = (
     'DeleteExtraDataMixin', 'DynamicFormViewMixin', 'ExtraContextMixin',
-    'FormExtraKwargsMixin', 'MultipleObjectMixin', 'ObjectActionMixin',
-    'ObjectListPermissionFilterMixin', 'ObjectNameMixin',
+    'FormExtraKwargsMixin', 'KeysetPaginationMixin', 'MultipleObjectMixin',
+    'ObjectActionMixin', 'ObjectListPermissionFilterMixin', 'ObjectNameMixin',
     'ObjectPermissionCheckMixin', 'RedirectionMixin',
     'ViewPermissionCheckMixin'
 )
@@ -76,6 +77,103 @@ class FormExtraKwargsMixin(object):
         return result
 
 
+class KeysetPaginationMixin(object):
+    """
+    Paginate a list view by seeking from the first or last object shown
+    instead of using an offset and without counting the objects. Meant for
+    very large tables. The objects are shown ordered by the keyset field
+    and the primary key, both in descending order.
+    """
+    keyset_field = 'pk'
+    keyset_next_query_param = 'after'
+    keyset_previous_query_param = 'before'
+
+    def get_context_data(self, **kwargs):
+        context = super(KeysetPaginationMixin, self).get_context_data(
+            **kwargs
+        )
+        context['keyset_page'] = getattr(self, 'keyset_page', None)
+        return context
+
+    def get_keyset_filter(self, queryset, pk, descending):
+        """
+        Return the filter selecting the objects after (descending) or
+        before the object with the primary key, or None when it doesn't
+        exist anymore.
+        """
+        try:
+            value = queryset.model._default_manager.filter(
+                pk=pk
+            ).values_list(self.keyset_field, flat=True)[0]
+        except (IndexError, ValueError):
+            return None
+
+        lookup = 'lt' if descending else 'gt'
+
+        if self.keyset_field == 'pk':
+            return Q(**{'pk__{}'.format(lookup): value})
+        else:
+            return Q(
+                **{'{}__{}'.format(self.keyset_field, lookup): value}
+            ) | Q(
+                **{self.keyset_field: value, 'pk__{}'.format(lookup): pk}
+            )
+
+    def get_keyset_querystring(self, name, value):
+        querystring = self.request.GET.copy()
+        querystring.pop(self.keyset_next_query_param, None)
+        querystring.pop(self.keyset_previous_query_param, None)
+        querystring[name] = value
+        return querystring.urlencode()
+
+    def paginate_queryset(self, queryset, page_size):
+        next_pk = self.request.GET.get(self.keyset_next_query_param)
+        previous_pk = self.request.GET.get(self.keyset_previous_query_param)
+
+        descending = True
+        keyset_filter = None
+
+        if previous_pk:
+            keyset_filter = self.get_keyset_filter(
+                queryset=queryset, pk=previous_pk, descending=False
+            )
+            descending = not keyset_filter
+        elif next_pk:
+            keyset_filter = self.get_keyset_filter(
+                queryset=queryset, pk=next_pk, descending=True
+            )
+
+        if keyset_filter:
+            queryset = queryset.filter(keyset_filter)
+
+        ordering = (self.keyset_field, 'pk')
+        if descending:
+            ordering = ['-{}'.format(field) for field in ordering]
+
+        object_list = list(queryset.order_by(*ordering)[:page_size + 1])
+        has_more = len(object_list) > page_size
+        object_list = object_list[:page_size]
+
+        if descending:
+            has_next = has_more
+            has_previous = bool(keyset_filter)
+        else:
+            object_list.reverse()
+            has_next = True
+            has_previous = has_more
+
+        self.keyset_page = {
+            'next_querystring': self.get_keyset_querystring(
+                name=self.keyset_next_query_param, value=object_list[-1].pk
+            ) if has_next and object_list else None,
+            'previous_querystring': self.get_keyset_querystring(
+                name=self.keyset_previous_query_param, value=object_list[0].pk
+            ) if has_previous and object_list else None,
+        }
+
+        return (None, None, object_list, False)
+
+
 class MultipleInstanceActionMixin(object):
     # TODO: Deprecated, replace views using this with
     # MultipleObjectFormActionView or MultipleObjectConfirmActionView
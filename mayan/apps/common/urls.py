@@ -7,10 +7,10 @@ from .api_views import APIContentTypeList
 from .views import (
     AboutView, CheckVersionView, CurrentUserDetailsView, CurrentUserEditView,
     CurrentUserLocaleProfileDetailsView, CurrentUserLocaleProfileEditView,
-    FaviconRedirectView, FilterResultListView, FilterSelectView, HomeView,
-    LicenseView, ObjectErrorLogEntryListClearView, ObjectErrorLogEntryListView,
-    PackagesLicensesView, SetupListView, ToolsListView,
-    multi_object_action_view
+    DashboardWidgetValueView, FaviconRedirectView, FilterResultListView,
+    FilterSelectView, HomeView, LicenseView, ObjectErrorLogEntryListClearView,
+    ObjectErrorLogEntryListView, PackagesLicensesView, SetupListView,
+    ToolsListView, multi_object_action_view
 )
 
 urlpatterns = [
@@ -20,6 +20,10 @@ urlpatterns = [
         r'^check_version/$', CheckVersionView.as_view(),
         name='check_version_view'
     ),
+    url(
+        r'^dashboard/widgets/(?P<name>[-\w]+)/value/$',
+        DashboardWidgetValueView.as_view(), name='dashboard_widget_value'
+    ),
     url(r'^license/$', LicenseView.as_view(), name='license_view'),
     url(
         r'^packages/licenses/$', PackagesLicensesView.as_view(),
@@ -7,6 +7,7 @@ import tempfile
 import types
 
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.urls import resolve as django_resolve
 from django.urls.base import get_script_prefix
 from django.utils.datastructures import MultiValueDict
@@ -98,6 +99,23 @@ def get_descriptor(file_input, read=True):
         return file_input
 
 
+def get_related_model(model, path):
+    """
+    Follow a double underscore separated ORM field path starting at model
+    and return the model at the end of the path. Raise FieldDoesNotExist
+    if any part of the path is not a relation field.
+    """
+    for part in path.split('__'):
+        field = model._meta.get_field(part)
+        if not field.related_model:
+            raise FieldDoesNotExist(
+                '"{}" is not a relation field of {}'.format(part, model)
+            )
+        model = field.related_model
+
+    return model
+
+
 def index_or_default(instance, index, default):
     try:
         return instance[index]
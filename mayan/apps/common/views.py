@@ -5,18 +5,18 @@ from json import dumps
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
-from django.http import Http404, HttpResponseRedirect
+from django.http import Http404, HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, resolve_url
 from django.template import RequestContext
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone, translation
 from django.utils.http import urlencode
 from django.utils.translation import ugettext_lazy as _, ugettext
-from django.views.generic import RedirectView, TemplateView
+from django.views.generic import RedirectView, TemplateView, View
 
 from acls.models import AccessControlList
 
-from .classes import Filter
+from .classes import DashboardWidget, Filter
 from .exceptions import NotLatestVersion
 from .forms import (
     FilterForm, LicenseForm, LocaleProfileForm, LocaleProfileForm_view,
@@ -185,6 +185,24 @@ class FilterResultListView(SingleObjectListView):
         return self.get_filter().get_queryset(user=self.request.user)
 
 
+class DashboardWidgetValueView(View):
+    """
+    Return the cached value of a dashboard widget. Used by the dashboard to
+    load the widgets after the page is rendered.
+    """
+    def get(self, request, *args, **kwargs):
+        try:
+            widget = DashboardWidget.get(name=self.kwargs['name'])
+        except KeyError:
+            raise Http404(
+                ugettext('Unknown dashboard widget: %s') % self.kwargs['name']
+            )
+
+        return JsonResponse(
+            {'value': widget.get_value(user=request.user)}
+        )
+
+
 class HomeView(TemplateView):
     template_name = 'appearance/home.html'
 
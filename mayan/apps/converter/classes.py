@@ -18,9 +18,10 @@ from mimetype.api import get_mimetype
 
 from .exceptions import InvalidOfficeFormat, OfficeConversionError
 from .literals import (
-    DEFAULT_LIBREOFFICE_PATH, DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT
+    DEFAULT_LIBREOFFICE_PATH, DEFAULT_PAGE_NUMBER, OUTPUT_PROFILE_BASE
 )
 from .settings import setting_graphics_backend_config
+from .utils import get_output_format, get_save_options
 
 CHUNK_SIZE = 1024
 logger = logging.getLogger(__name__)
@@ -180,12 +181,9 @@ class ConverterBase(object):
         fs_cleanup(input_filepath)
         fs_cleanup(converted_output)
 
-    def get_page(self, output_format=None, as_base64=False):
-        output_format = output_format or yaml.load(
-            setting_graphics_backend_config.value
-        ).get(
-            'pillow_format', DEFAULT_PILLOW_FORMAT
-        )
+    def get_page(self, output_format=None, as_base64=False,
+                 profile=OUTPUT_PROFILE_BASE):
+        output_format = output_format or get_output_format(profile=profile)
 
         if not self.image:
             self.seek(0)
@@ -193,15 +191,21 @@ class ConverterBase(object):
         image_buffer = BytesIO()
         new_mode = self.image.mode
 
-        if output_format.upper() == 'JPEG':
+        if output_format.upper() == 'JPEG' and new_mode != 'L':
             # JPEG doesn't support transparency channel, convert the image to
             # RGB. Removes modes: P and RGBA
             new_mode = 'RGB'
+        elif output_format.upper() == 'WEBP' and new_mode not in ('RGB', 'RGBA'):
+            new_mode = 'RGBA' if new_mode.endswith('A') else 'RGB'
 
-        self.image.convert(new_mode).save(image_buffer, format=output_format)
+        self.image.convert(new_mode).save(
+            image_buffer, format=output_format, **get_save_options(
+                output_format=output_format.upper(), profile=profile
+            )
+        )
 
         if as_base64:
-            return 'data:{};base64,{}'.format(Image.MIME[output_format], base64.b64encode(image_buffer.getvalue()))
+            return 'data:{};base64,{}'.format(Image.MIME[output_format.upper()], base64.b64encode(image_buffer.getvalue()))
         else:
             image_buffer.seek(0)
 
@@ -3,12 +3,23 @@ from __future__ import unicode_literals
 DEFAULT_ZOOM_LEVEL = 100
 DEFAULT_ROTATION = 0
 DEFAULT_PAGE_NUMBER = 1
-DEFAULT_PILLOW_FORMAT = 'JPEG'
 DEFAULT_LIBREOFFICE_PATH = '/usr/bin/libreoffice'
 
 DEFAULT_PDFTOPPM_DPI = 300
-DEFAULT_PDFTOPPM_FORMAT = 'jpeg'  # Possible values jpeg, png, tiff
+DEFAULT_PDFTOPPM_FORMAT = 'png'  # Possible values jpeg, png, tiff
 DEFAULT_PDFTOPPM_PATH = '/usr/bin/pdftoppm'
 DEFAULT_PDFINFO_PATH = '/usr/bin/pdfinfo'
 
 DIMENSION_SEPARATOR = 'x'
+
+# Output profiles, the image formats used for each use of the page images
+OUTPUT_PROFILE_BASE = 'base'
+OUTPUT_PROFILE_PREVIEW = 'preview'
+
+DEFAULT_OUTPUT_QUALITY = 85
+DEFAULT_OUTPUT_PROFILES = {
+    OUTPUT_PROFILE_BASE: {'formats': ['PNG']},
+    OUTPUT_PROFILE_PREVIEW: {
+        'formats': ['JPEG', 'WEBP'], 'quality': DEFAULT_OUTPUT_QUALITY
+    },
+}
@@ -5,8 +5,8 @@ from django.utils.translation import ugettext_lazy as _
 from smart_settings import Namespace
 
 from .literals import (
-    DEFAULT_LIBREOFFICE_PATH, DEFAULT_PDFTOPPM_DPI, DEFAULT_PDFTOPPM_FORMAT,
-    DEFAULT_PDFTOPPM_PATH, DEFAULT_PDFINFO_PATH, DEFAULT_PILLOW_FORMAT
+    DEFAULT_LIBREOFFICE_PATH, DEFAULT_OUTPUT_PROFILES, DEFAULT_PDFTOPPM_DPI,
+    DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH, DEFAULT_PDFINFO_PATH
 )
 
 namespace = Namespace(name='converter', label=_('Converter'))
@@ -22,15 +22,22 @@ setting_graphics_backend_config = namespace.add_setting(
             pdftoppm_dpi: {},
             pdftoppm_format: {},
             pdftoppm_path: {},
-            pdfinfo_path: {},
-            pillow_format: {}
-
+            pdfinfo_path: {}
         }}
     '''.replace('\n', '').format(
         DEFAULT_LIBREOFFICE_PATH, DEFAULT_PDFTOPPM_DPI,
-        DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH, DEFAULT_PDFINFO_PATH,
-        DEFAULT_PILLOW_FORMAT
+        DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH, DEFAULT_PDFINFO_PATH
     ), help_text=_(
         'Configuration options for the graphics conversion backend.'
     ), global_name='CONVERTER_GRAPHICS_BACKEND_CONFIG',
 )
+setting_output_profiles = namespace.add_setting(
+    default=DEFAULT_OUTPUT_PROFILES, help_text=_(
+        'Image formats used for each use of the page images. The "base" '
+        'profile is used for the cached page images and the OCR input and '
+        'should be lossless. The "preview" profile is used for the '
+        'thumbnails, previews and tiles. The first format of a profile '
+        'accepted by the client is used. Quality, from 1 to 100, applies '
+        'to the JPEG and WEBP formats.'
+    ), global_name='CONVERTER_OUTPUT_PROFILES',
+)
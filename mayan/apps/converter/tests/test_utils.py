@@ -0,0 +1,58 @@
+from __future__ import unicode_literals
+
+from django.test import TestCase
+
+from ..literals import OUTPUT_PROFILE_BASE, OUTPUT_PROFILE_PREVIEW
+from ..utils import get_accepted_formats, get_output_format, get_save_options
+
+
+class OutputFormatTestCase(TestCase):
+    def test_accepted_formats_exact_match(self):
+        self.assertEqual(
+            get_accepted_formats(
+                formats=('JPEG', 'PNG'), accept='image/png,image/*;q=0.8'
+            ), ['PNG', 'JPEG']
+        )
+
+    def test_accepted_formats_specificity(self):
+        self.assertEqual(
+            get_accepted_formats(
+                formats=('JPEG', 'PNG'), accept='image/*,image/png'
+            ), ['PNG', 'JPEG']
+        )
+
+    def test_accepted_formats_wildcard_keeps_order(self):
+        self.assertEqual(
+            get_accepted_formats(formats=('JPEG', 'PNG'), accept='*/*'),
+            ['JPEG', 'PNG']
+        )
+
+    def test_accepted_formats_excluded(self):
+        self.assertEqual(
+            get_accepted_formats(
+                formats=('JPEG', 'PNG'), accept='image/png,image/jpeg;q=0'
+            ), ['PNG']
+        )
+
+    def test_output_format_not_accepted(self):
+        self.assertEqual(
+            get_output_format(
+                profile=OUTPUT_PROFILE_PREVIEW, accept='application/json'
+            ), 'JPEG'
+        )
+
+    def test_output_format_base_profile(self):
+        self.assertEqual(
+            get_output_format(profile=OUTPUT_PROFILE_BASE), 'PNG'
+        )
+
+    def test_save_options(self):
+        self.assertTrue(
+            get_save_options(
+                output_format='JPEG', profile=OUTPUT_PROFILE_PREVIEW
+            )['progressive']
+        )
+        self.assertEqual(
+            get_save_options(output_format='PNG', profile=OUTPUT_PROFILE_BASE),
+            {}
+        )
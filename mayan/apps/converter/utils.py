@@ -0,0 +1,110 @@
+from __future__ import unicode_literals
+
+from PIL import Image
+
+from .literals import DEFAULT_OUTPUT_QUALITY
+from .settings import setting_output_profiles
+
+# Load all the format plugins, populates Image.MIME and Image.SAVE
+Image.init()
+
+
+def get_accepted_formats(formats, accept):
+    """
+    Return the formats the client accepts according to the value of an HTTP
+    Accept header, most preferred first. Formats matched by their exact
+    media type rank before the ones matched by a wildcard and ties keep the
+    order of the formats.
+    """
+    media_ranges = []
+
+    for media_range in accept.split(','):
+        parts = media_range.split(';')
+        quality = 1.0
+
+        for parameter in parts[1:]:
+            name, separator, value = parameter.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        media_ranges.append((parts[0].strip().lower(), quality))
+
+    result = []
+
+    for index, output_format in enumerate(formats):
+        mime_type = Image.MIME.get(output_format, '').lower()
+        match = None
+
+        for media_range, quality in media_ranges:
+            if media_range == mime_type:
+                specificity = 2
+            elif media_range == 'image/*':
+                specificity = 1
+            elif media_range == '*/*':
+                specificity = 0
+            else:
+                continue
+
+            # The most specific media range sets the quality
+            if not match or specificity > match[0]:
+                match = (specificity, quality)
+
+        if match and match[1] > 0:
+            result.append((-match[1], -match[0], index, output_format))
+
+    return [entry[-1] for entry in sorted(result)]
+
+
+def get_output_format(profile, accept=None):
+    """
+    Return the format to use for an output profile. The first format of the
+    profile that Pillow can save is used unless the value of an HTTP Accept
+    header is provided, then the format preferred by the client is used.
+    """
+    formats = get_output_formats(profile=profile)
+
+    if accept:
+        formats = get_accepted_formats(
+            formats=formats, accept=accept
+        ) or formats
+
+    if formats:
+        return formats[0]
+    else:
+        return 'PNG'
+
+
+def get_output_formats(profile):
+    """
+    Return the formats of an output profile that Pillow can save.
+    """
+    return [
+        output_format.upper() for output_format in get_output_profile(
+            profile=profile
+        )['formats'] if output_format.upper() in Image.SAVE
+    ]
+
+
+def get_output_profile(profile):
+    return setting_output_profiles.value[profile]
+
+
+def get_save_options(output_format, profile):
+    """
+    Return the Pillow save options of a format, lossy formats use the
+    quality of the profile. JPEG images are progressive so that previews
+    are displayed while they load.
+    """
+    quality = get_output_profile(profile=profile).get(
+        'quality', DEFAULT_OUTPUT_QUALITY
+    )
+
+    if output_format == 'JPEG':
+        return {'optimize': True, 'progressive': True, 'quality': quality}
+    elif output_format == 'WEBP':
+        return {'quality': quality}
+    else:
+        return {}
@@ -1,13 +1,23 @@
 from __future__ import absolute_import, unicode_literals
 
 from datetime import date
+import hashlib
+import logging
 import os
 import shutil
+import tempfile
+import time
 
 import gnupg
 
+from django.apps import apps
+
 from common.utils import mkdtemp
 
+from .literals import KEYRING_PURGE_AGE
+
+logger = logging.getLogger(__name__)
+
 
 class GPGBackend(object):
     def __init__(self, **kwargs):
@@ -19,6 +29,11 @@ class PythonGNUPGBackend(GPGBackend):
     def _import_key(gpg, **kwargs):
         return gpg.import_keys(**kwargs)
 
+    @staticmethod
+    def _import_keys(gpg, keys):
+        for key in keys:
+            gpg.import_keys(key_data=key['key_data'])
+
     @staticmethod
     def _list_keys(gpg, **kwargs):
         return gpg.list_keys(**kwargs)
@@ -71,7 +86,15 @@ class PythonGNUPGBackend(GPGBackend):
             keyserver=keyserver, query=query
         )
 
-    def gpg_command(self, function, **kwargs):
+    def gpg_command(self, function, gnupghome=None, **kwargs):
+        if gnupghome:
+            # Persistent home, used as is
+            gpg = gnupg.GPG(
+                gnupghome=gnupghome, gpgbinary=self.kwargs['binary_path']
+            )
+
+            return function(gpg=gpg, **kwargs)
+
         temporary_directory = mkdtemp()
         os.chmod(temporary_directory, 0x1C0)
 
@@ -90,6 +113,12 @@ class PythonGNUPGBackend(GPGBackend):
             function=PythonGNUPGBackend._import_key, key_data=key_data
         )
 
+    def import_keys(self, keys, gnupghome):
+        return self.gpg_command(
+            function=PythonGNUPGBackend._import_keys, gnupghome=gnupghome,
+            keys=keys
+        )
+
     def list_keys(self, keys):
         return self.gpg_command(
             function=PythonGNUPGBackend._list_keys, keys=keys
@@ -108,16 +137,16 @@ class PythonGNUPGBackend(GPGBackend):
             detached=detached, binary=binary, output=output
         )
 
-    def decrypt_file(self, file_object, keys):
+    def decrypt_file(self, file_object, keys, gnupghome=None):
         return self.gpg_command(
             function=PythonGNUPGBackend._decrypt_file, file_object=file_object,
-            keys=keys
+            gnupghome=gnupghome, keys=keys
         )
 
-    def verify_file(self, file_object, keys, data_filename=None):
+    def verify_file(self, file_object, keys, data_filename=None, gnupghome=None):
         return self.gpg_command(
             function=PythonGNUPGBackend._verify_file, file_object=file_object,
-            keys=keys, data_filename=data_filename
+            gnupghome=gnupghome, keys=keys, data_filename=data_filename
         )
 
     def recv_keys(self, keyserver, key_id):
@@ -133,6 +162,103 @@ class PythonGNUPGBackend(GPGBackend):
         )
 
 
+class KeyRing(object):
+    """
+    Persistent GnuPG home with all the stored keys imported. The version of
+    the keyring is a hash of the stored keys and each version is built once
+    in its own directory, so keys are only imported again after keys are
+    added or deleted.
+    """
+    def __init__(self, backend, path):
+        self.backend = backend
+        self.path = path
+
+    def build(self, key_ids, path):
+        Key = apps.get_model(app_label='django_gpg', model_name='Key')
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        # Build next to the final directory and rename, other processes
+        # never see a partially imported keyring.
+        temporary_directory = tempfile.mkdtemp(dir=self.path, prefix='build-')
+        os.chmod(temporary_directory, 0o700)
+
+        try:
+            self.backend.import_keys(
+                gnupghome=temporary_directory,
+                keys=Key.objects.filter(pk__in=key_ids).values('key_data')
+            )
+            os.rename(temporary_directory, path)
+        except OSError:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
+            if not os.path.isdir(path):
+                raise
+
+            # Already built by another process
+            logger.debug('Keyring "%s" already exists', path)
+        except Exception:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+            raise
+        else:
+            logger.info('Built keyring: %s', path)
+            self.purge(keep=path)
+
+    def _get_key_ids_and_version(self):
+        Key = apps.get_model(app_label='django_gpg', model_name='Key')
+
+        hash_object = hashlib.sha256()
+        key_ids = []
+
+        queryset = Key.objects.order_by('pk').values_list('pk', 'fingerprint')
+
+        for pk, fingerprint in queryset:
+            key_ids.append(pk)
+            hash_object.update('{}:{};'.format(pk, fingerprint).encode('utf-8'))
+
+        return key_ids, hash_object.hexdigest()[:16]
+
+    def get_home(self, version=None):
+        """
+        Return the GnuPG home of the current version of the keyring,
+        building it if it doesn't exist yet
+        """
+        key_ids = None
+
+        if not version:
+            key_ids, version = self._get_key_ids_and_version()
+
+        path = os.path.join(self.path, 'keyring-{}'.format(version))
+
+        if not os.path.exists(path):
+            if key_ids is None:
+                key_ids, version = self._get_key_ids_and_version()
+                path = os.path.join(self.path, 'keyring-{}'.format(version))
+
+            self.build(key_ids=key_ids, path=path)
+
+        return path
+
+    def get_version(self):
+        return self._get_key_ids_and_version()[1]
+
+    def purge(self, keep):
+        """
+        Remove the keyrings of previous versions. Keyrings are only removed
+        after KEYRING_PURGE_AGE seconds to not pull them from under
+        verifications still in progress.
+        """
+        for name in os.listdir(self.path):
+            path = os.path.join(self.path, name)
+
+            if path == keep or not name.startswith(('build-', 'keyring-')):
+                continue
+
+            if time.time() - os.path.getmtime(path) > KEYRING_PURGE_AGE:
+                shutil.rmtree(path, ignore_errors=True)
+
+
 class KeyStub(object):
     def __init__(self, raw):
         self.fingerprint = raw['keyid']
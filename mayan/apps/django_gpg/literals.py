@@ -29,6 +29,7 @@ KEY_SECONDARY_CLASSES = (
     ((KEY_CLASS_ELG), _('Elgamal')),
 )
 
+KEYRING_PURGE_AGE = 60 * 60  # 1 hour
 KEYSERVER_DEFAULT_PORT = 11371
 
 SIGNATURE_STATE_BAD = 'signature bad'
@@ -66,3 +67,5 @@ ERROR_MSG_NEED_PASSPHRASE = 'NEED_PASSPHRASE'
 ERROR_MSG_BAD_PASSPHRASE = 'BAD_PASSPHRASE'
 ERROR_MSG_GOOD_PASSPHRASE = 'GOOD_PASSPHRASE'
 OUTPUT_MESSAGE_CONTAINS_PRIVATE_KEY = 'Contains private key'
+
+VERIFICATION_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 7 days
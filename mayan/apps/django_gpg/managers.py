@@ -1,9 +1,11 @@
 from __future__ import absolute_import, unicode_literals
 
+import hashlib
 import io
 import logging
 import os
 
+from django.core.cache import cache
 from django.db import models
 
 from common.utils import mkstemp
@@ -12,20 +14,25 @@ from .classes import KeyStub, SignatureVerification
 from .exceptions import (
     DecryptionError, KeyDoesNotExist, KeyFetchingError, VerificationError
 )
-from .literals import KEY_TYPE_PUBLIC, KEY_TYPE_SECRET
-from .runtime import gpg_backend
+from .literals import (
+    KEY_TYPE_PUBLIC, KEY_TYPE_SECRET, VERIFICATION_CACHE_TIMEOUT
+)
+from .runtime import gpg_backend, keyring
 from .settings import setting_keyserver
 
 logger = logging.getLogger(__name__)
 
 
 class KeyManager(models.Manager):
-    def _preload_keys(self, all_keys=False, key_fingerprint=None, key_id=None):
+    def _get_verification(self, result):
+        if result['verification']:
+            return result['verification']
+        else:
+            raise VerificationError('File not signed')
+
+    def _preload_keys(self, key_fingerprint=None, key_id=None):
         # Preload keys
-        if all_keys:
-            logger.debug('preloading all keys')
-            keys = self.values()
-        elif key_fingerprint:
+        if key_fingerprint:
             logger.debug('preloading key fingerprint: %s', key_fingerprint)
             keys = self.filter(fingerprint=key_fingerprint).values()
             if not keys:
@@ -46,12 +53,17 @@ class KeyManager(models.Manager):
         return keys
 
     def decrypt_file(self, file_object, all_keys=False, key_fingerprint=None, key_id=None):
-        keys = self._preload_keys(
-            all_keys=all_keys, key_fingerprint=key_fingerprint, key_id=key_id
-        )
+        if key_fingerprint or key_id:
+            keys = self._preload_keys(
+                key_fingerprint=key_fingerprint, key_id=key_id
+            )
+            gnupghome = None
+        else:
+            keys = ()
+            gnupghome = keyring.get_home()
 
         decrypt_result = gpg_backend.decrypt_file(
-            file_object=file_object, keys=keys
+            file_object=file_object, gnupghome=gnupghome, keys=keys
         )
 
         logger.debug('decrypt_result.status: %s', decrypt_result.status)
@@ -90,10 +102,42 @@ class KeyManager(models.Manager):
     def private_keys(self):
         return self.filter(key_type=KEY_TYPE_SECRET)
 
-    def verify_file(self, file_object, signature_file=None, all_keys=False, key_fingerprint=None, key_id=None):
-        keys = self._preload_keys(
-            all_keys=all_keys, key_fingerprint=key_fingerprint, key_id=key_id
-        )
+    def verify_file(self, file_object, signature_file=None, all_keys=False, key_fingerprint=None, key_id=None, checksum=None):
+        """
+        Verify a signed file or a file and its detached signature. Unless a
+        key is specified, the keyring of all the stored keys is used.
+        Results are cached when a checksum identifying the file is given,
+        until the stored keys change. all_keys is accepted for compatibility,
+        the keyring always includes all the keys.
+        """
+        cache_key = None
+
+        if key_fingerprint or key_id:
+            keys = self._preload_keys(
+                key_fingerprint=key_fingerprint, key_id=key_id
+            )
+            gnupghome = None
+        else:
+            keys = ()
+            keyring_version = keyring.get_version()
+            gnupghome = keyring.get_home(version=keyring_version)
+
+            if checksum:
+                if signature_file:
+                    checksum = '{}-{}'.format(
+                        checksum,
+                        hashlib.sha256(signature_file.read()).hexdigest()
+                    )
+                    signature_file.seek(0)
+
+                cache_key = 'django_gpg_verification_{}_{}'.format(
+                    checksum, keyring_version
+                )
+                result = cache.get(cache_key)
+
+                if result is not None:
+                    logger.debug('cached verification result: %s', cache_key)
+                    return self._get_verification(result=result)
 
         if signature_file:
             # Save the original data and invert the argument order
@@ -108,13 +152,14 @@ class KeyManager(models.Manager):
             signature_file.seek(0)
             verify_result = gpg_backend.verify_file(
                 file_object=signature_file_buffer,
-                data_filename=temporary_filename, keys=keys
+                data_filename=temporary_filename, gnupghome=gnupghome,
+                keys=keys
             )
             signature_file_buffer.close()
             os.unlink(temporary_filename)
         else:
             verify_result = gpg_backend.verify_file(
-                file_object=file_object, keys=keys
+                file_object=file_object, gnupghome=gnupghome, keys=keys
             )
 
         logger.debug('verify_result.status: %s', verify_result.status)
@@ -122,16 +167,20 @@ class KeyManager(models.Manager):
         if verify_result:
             # Signed and key present
             logger.debug('signed and key present')
-            return SignatureVerification(verify_result.__dict__)
-        elif verify_result.status == 'no public key' and not (key_fingerprint or all_keys or key_id):
-            # Signed but key not present, retry with key fetch
-            logger.debug('no public key')
-            file_object.seek(0)
-            return self.verify_file(file_object=file_object, signature_file=signature_file, key_id=verify_result.key_id)
+            result = {
+                'verification': SignatureVerification(verify_result.__dict__)
+            }
         elif verify_result.key_id:
-            # Signed, retried and key still not found
-            logger.debug('signed, retried and key still not found')
-            return SignatureVerification(verify_result.__dict__)
+            # Signed and key not found
+            logger.debug('signed and key not found')
+            result = {
+                'verification': SignatureVerification(verify_result.__dict__)
+            }
         else:
             logger.debug('file not signed')
-            raise VerificationError('File not signed')
+            result = {'verification': None}
+
+        if cache_key:
+            cache.set(cache_key, result, VERIFICATION_CACHE_TIMEOUT)
+
+        return self._get_verification(result=result)
@@ -1,6 +1,7 @@
 from django.utils.module_loading import import_string
 
-from .settings import setting_gpg_path
+from .classes import KeyRing
+from .settings import setting_gpg_home, setting_gpg_path
 
 # TODO: This will become an setting option in 2.2
 SETTING_GPG_BACKEND = 'django_gpg.classes.PythonGNUPGBackend'
@@ -8,3 +9,4 @@ SETTING_GPG_BACKEND = 'django_gpg.classes.PythonGNUPGBackend'
 gpg_backend = import_string(SETTING_GPG_BACKEND)(
     binary_path=setting_gpg_path.value
 )
+keyring = KeyRing(backend=gpg_backend, path=setting_gpg_home.value)
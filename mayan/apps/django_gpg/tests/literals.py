@@ -88,6 +88,7 @@ TEST_SIGNED_FILE = os.path.join(
     'test_files', 'test_file.txt.gpg'
 )
 TEST_SIGNED_FILE_CONTENT = 'test_file.txt\n'
+TEST_SIGNED_FILE_CHECKSUM = 'test_signed_file_checksum'
 
 TEST_RECEIVE_KEY = '''-----BEGIN PGP PUBLIC KEY BLOCK-----
 Version: SKS 1.1.5
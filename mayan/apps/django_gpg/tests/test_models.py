@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+import os
 import StringIO
 
 import gnupg
@@ -13,11 +14,13 @@ from ..exceptions import (
     VerificationError
 )
 from ..models import Key
+from ..runtime import gpg_backend, keyring
 
 from .literals import (
     TEST_DETACHED_SIGNATURE, TEST_FILE, TEST_KEY_DATA, TEST_KEY_FINGERPRINT,
     TEST_KEY_PASSPHRASE, TEST_RECEIVE_KEY, TEST_SEARCH_FINGERPRINT,
-    TEST_SEARCH_UID, TEST_SIGNED_FILE, TEST_SIGNED_FILE_CONTENT
+    TEST_SEARCH_UID, TEST_SIGNED_FILE, TEST_SIGNED_FILE_CHECKSUM,
+    TEST_SIGNED_FILE_CONTENT
 )
 
 MOCK_SEARCH_KEYS_RESPONSE = [
@@ -194,3 +197,47 @@ class KeyTestCase(BaseTestCase):
         signature_file.close()
         self.assertTrue(result)
         self.assertEqual(result.fingerprint, TEST_KEY_FINGERPRINT)
+
+    def test_keyring_version_change(self):
+        version = keyring.get_version()
+
+        Key.objects.create(key_data=TEST_KEY_DATA)
+
+        self.assertNotEqual(keyring.get_version(), version)
+        self.assertTrue(os.path.exists(keyring.get_home()))
+
+    def test_keyring_concurrent_build(self):
+        path = keyring.get_home()
+
+        # Another process already renamed its build into place
+        with mock.patch('os.rename', side_effect=OSError):
+            keyring.build(key_ids=(), path=path)
+
+        self.assertTrue(os.path.isdir(path))
+
+    def test_keyring_build_error(self):
+        path = os.path.join(keyring.path, 'keyring-error')
+
+        with mock.patch('os.rename', side_effect=OSError):
+            with self.assertRaises(OSError):
+                keyring.build(key_ids=(), path=path)
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_embedded_verification_cache(self):
+        Key.objects.create(key_data=TEST_KEY_DATA)
+
+        with open(TEST_SIGNED_FILE) as signed_file:
+            Key.objects.verify_file(
+                checksum=TEST_SIGNED_FILE_CHECKSUM, file_object=signed_file
+            )
+
+        with mock.patch.object(gpg_backend, 'verify_file') as mock_verify_file:
+            with open(TEST_SIGNED_FILE) as signed_file:
+                result = Key.objects.verify_file(
+                    checksum=TEST_SIGNED_FILE_CHECKSUM,
+                    file_object=signed_file
+                )
+
+        self.assertFalse(mock_verify_file.called)
+        self.assertEqual(result.fingerprint, TEST_KEY_FINGERPRINT)
@@ -1,7 +1,5 @@
 from __future__ import absolute_import, unicode_literals
 
-from kombu import Exchange, Queue
-
 from django.apps import apps
 from django.db.models.signals import post_delete, pre_delete
 from django.utils.translation import ugettext_lazy as _
@@ -16,7 +14,6 @@ from common import (
 )
 from common.widgets import two_state_template
 from documents.signals import post_document_created, post_initial_document_type
-from mayan.celery import app
 from navigation import SourceColumn
 from rest_api.classes import APIEndPoint
 
@@ -155,27 +152,6 @@ class DocumentIndexingApp(MayanAppConfig):
             )
         )
 
-        app.conf.CELERY_QUEUES.append(
-            Queue('indexing', Exchange('indexing'), routing_key='indexing'),
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'document_indexing.tasks.task_delete_empty': {
-                    'queue': 'indexing'
-                },
-                'document_indexing.tasks.task_remove_document': {
-                    'queue': 'indexing'
-                },
-                'document_indexing.tasks.task_index_document': {
-                    'queue': 'indexing'
-                },
-                'document_indexing.tasks.task_rebuild_index': {
-                    'queue': 'tools'
-                },
-            }
-        )
-
         menu_facet.bind_links(
             links=(link_document_index_list,), sources=(Document,)
         )
@@ -3,8 +3,6 @@ from __future__ import unicode_literals
 from datetime import timedelta
 import logging
 
-from kombu import Exchange, Queue
-
 from django.apps import apps
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
@@ -18,7 +16,6 @@ from common.settings import settings_db_sync_task_delay
 from documents.search import document_search, document_page_search
 from documents.signals import post_version_upload
 from documents.widgets import document_link
-from mayan.celery import app
 from navigation import SourceColumn
 from rest_api.classes import APIEndPoint
 
@@ -30,6 +27,7 @@ from .links import (
     link_document_submit, link_document_type_submit, link_error_list
 )
 from .permissions import permission_content_view
+from .queues import *  # NOQA
 from .utils import get_document_content
 
 logger = logging.getLogger(__name__)
@@ -100,18 +98,6 @@ class DocumentParsingApp(MayanAppConfig):
             attribute='result'
         )
 
-        app.conf.CELERY_QUEUES.append(
-            Queue('parsing', Exchange('parsing'), routing_key='parsing'),
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'document_parsing.tasks.task_parse_document_version': {
-                    'queue': 'parsing'
-                },
-            }
-        )
-
         document_search.add_model_field(
             field='versions__pages__content__content', label=_('Content')
         )
@@ -2,8 +2,6 @@ from __future__ import unicode_literals
 
 import logging
 
-from kombu import Exchange, Queue
-
 from django.apps import apps
 from django.db.models.signals import post_save, post_delete
 from django.utils.translation import ugettext_lazy as _
@@ -13,7 +11,6 @@ from common import (
     MayanAppConfig, menu_facet, menu_object, menu_sidebar, menu_tools
 )
 from common.signals import post_upgrade
-from mayan.celery import app
 from navigation import SourceColumn
 
 from .handlers import (
@@ -106,29 +103,6 @@ class DocumentSignaturesApp(MayanAppConfig):
             ).get_signature_type_display()
         )
 
-        app.conf.CELERY_QUEUES.append(
-            Queue(
-                'signatures', Exchange('signatures'), routing_key='signatures'
-            ),
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'document_signatures.tasks.task_verify_key_signatures': {
-                    'queue': 'signatures'
-                },
-                'document_signatures.tasks.task_unverify_key_signatures': {
-                    'queue': 'signatures'
-                },
-                'document_signatures.tasks.task_verify_document_version': {
-                    'queue': 'signatures'
-                },
-                'document_signatures.tasks.task_verify_missing_embedded_signature': {
-                    'queue': 'tools'
-                },
-            }
-        )
-
         menu_facet.bind_links(
             links=(link_document_signature_list,), sources=(Document,)
         )
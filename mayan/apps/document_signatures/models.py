@@ -109,7 +109,10 @@ class EmbeddedSignature(SignatureBaseModel):
         with self.document_version.open(raw=raw) as file_object:
             try:
                 verify_result = Key.objects.verify_file(
-                    file_object=file_object
+                    checksum='{}-{}'.format(
+                        self.document_version.checksum,
+                        raw and 'raw' or 'decoded'
+                    ), file_object=file_object
                 )
             except VerificationError as exception:
                 # Not signed
@@ -148,6 +151,7 @@ class DetachedSignature(SignatureBaseModel):
         with self.document_version.open() as file_object:
             try:
                 verify_result = Key.objects.verify_file(
+                    checksum=self.document_version.checksum,
                     file_object=file_object, signature_file=self.signature_file
                 )
             except VerificationError as exception:
@@ -18,6 +18,14 @@ queue_signatures.add_task_type(
     name='document_signatures.tasks.task_verify_document_version',
     label=_('Verify document version')
 )
+queue_signatures.add_task_type(
+    name='document_signatures.tasks.task_verify_document_versions',
+    label=_('Verify document versions')
+)
+queue_signatures.add_task_type(
+    name='document_signatures.tasks.task_verify_signatures',
+    label=_('Verify signatures')
+)
 
 queue_tools.add_task_type(
     name='document_signatures.tasks.task_verify_missing_embedded_signature',
@@ -6,25 +6,52 @@ from django.apps import apps
 
 from mayan.celery import app
 
+from .literals import VERIFICATION_CHUNK_SIZE
+
 RETRY_DELAY = 10
 logger = logging.getLogger(__name__)
 
 
+def dispatch_chunks(task, argument_name, id_queryset):
+    """
+    Split the IDs of a queryset into chunks and queue a task for each chunk
+    so the work is spread among the available workers.
+    """
+    chunk = []
+    chunk_count = 0
+
+    for pk in id_queryset.order_by('pk').iterator():
+        chunk.append(pk)
+
+        if len(chunk) >= VERIFICATION_CHUNK_SIZE:
+            task.apply_async(kwargs={argument_name: chunk})
+            chunk = []
+            chunk_count += 1
+
+    if chunk:
+        task.apply_async(kwargs={argument_name: chunk})
+        chunk_count += 1
+
+    return chunk_count
+
+
 @app.task(bind=True, ignore_result=True)
 def task_unverify_key_signatures(self, key_id):
-    DetachedSignature = apps.get_model(
-        app_label='document_signatures', model_name='DetachedSignature'
+    SignatureBaseModel = apps.get_model(
+        app_label='document_signatures', model_name='SignatureBaseModel'
     )
 
-    EmbeddedSignature = apps.get_model(
-        app_label='document_signatures', model_name='EmbeddedSignature'
+    chunk_count = dispatch_chunks(
+        task=task_verify_signatures, argument_name='signature_ids',
+        id_queryset=SignatureBaseModel.objects.filter(
+            key_id__endswith=key_id, signature_id__isnull=False
+        ).values_list('pk', flat=True)
     )
 
-    for signature in DetachedSignature.objects.filter(key_id__endswith=key_id).filter(signature_id__isnull=False):
-        signature.save()
-
-    for signature in EmbeddedSignature.objects.filter(key_id__endswith=key_id).filter(signature_id__isnull=False):
-        signature.save()
+    logger.info(
+        'Queued %d chunks of signatures to unverify for key: %s',
+        chunk_count, key_id
+    )
 
 
 @app.task(bind=True, ignore_result=True)
@@ -33,21 +60,23 @@ def task_verify_key_signatures(self, key_pk):
         app_label='django_gpg', model_name='Key'
     )
 
-    DetachedSignature = apps.get_model(
-        app_label='document_signatures', model_name='DetachedSignature'
-    )
-
-    EmbeddedSignature = apps.get_model(
-        app_label='document_signatures', model_name='EmbeddedSignature'
+    SignatureBaseModel = apps.get_model(
+        app_label='document_signatures', model_name='SignatureBaseModel'
     )
 
     key = Key.objects.get(pk=key_pk)
 
-    for signature in DetachedSignature.objects.filter(key_id__endswith=key.key_id).filter(signature_id__isnull=True):
-        signature.save()
+    chunk_count = dispatch_chunks(
+        task=task_verify_signatures, argument_name='signature_ids',
+        id_queryset=SignatureBaseModel.objects.filter(
+            key_id__endswith=key.key_id, signature_id__isnull=True
+        ).values_list('pk', flat=True)
+    )
 
-    for signature in EmbeddedSignature.objects.filter(key_id__endswith=key.key_id).filter(signature_id__isnull=True):
-        signature.save()
+    logger.info(
+        'Queued %d chunks of signatures to verify for key: %s',
+        chunk_count, key.key_id
+    )
 
 
 @app.task(bind=True, ignore_result=True)
@@ -56,10 +85,16 @@ def task_verify_missing_embedded_signature(self):
         app_label='document_signatures', model_name='EmbeddedSignature'
     )
 
-    for document_version in EmbeddedSignature.objects.unsigned_document_versions():
-        task_verify_document_version.apply_async(
-            kwargs=dict(document_version_pk=document_version.pk)
-        )
+    chunk_count = dispatch_chunks(
+        task=task_verify_document_versions,
+        argument_name='document_version_ids',
+        id_queryset=EmbeddedSignature.objects.unsigned_document_versions(
+        ).values_list('pk', flat=True)
+    )
+
+    logger.info(
+        'Queued %d chunks of document versions to verify', chunk_count
+    )
 
 
 @app.task(bind=True, ignore_result=True)
@@ -81,3 +116,43 @@ def task_verify_document_version(self, document_version_pk):
         )
         logger.error(error_message)
         raise IOError(error_message)
+
+
+@app.task(bind=True, ignore_result=True)
+def task_verify_document_versions(self, document_version_ids):
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+
+    EmbeddedSignature = apps.get_model(
+        app_label='document_signatures', model_name='EmbeddedSignature'
+    )
+
+    queryset = DocumentVersion.objects.filter(
+        pk__in=document_version_ids
+    ).select_related('document')
+
+    for document_version in queryset:
+        try:
+            EmbeddedSignature.objects.create(
+                document_version=document_version
+            )
+        except IOError as exception:
+            logger.error(
+                'File missing for document version ID %d; %s',
+                document_version.pk, exception
+            )
+
+
+@app.task(bind=True, ignore_result=True)
+def task_verify_signatures(self, signature_ids):
+    SignatureBaseModel = apps.get_model(
+        app_label='document_signatures', model_name='SignatureBaseModel'
+    )
+
+    queryset = SignatureBaseModel.objects.filter(
+        pk__in=signature_ids
+    ).select_subclasses()
+
+    for signature in queryset:
+        signature.save()
@@ -515,7 +515,10 @@ class APIWorkflowInstanceListView(generics.ListAPIView):
         return document
 
     def get_queryset(self):
-        return self.get_document().workflows.all()
+        return self.get_document().workflows.select_related(
+            'current_state', 'last_log_entry__transition',
+            'last_log_entry__user', 'workflow'
+        )
 
 
 class APIWorkflowInstanceView(generics.RetrieveAPIView):
@@ -540,7 +543,10 @@ class APIWorkflowInstanceView(generics.RetrieveAPIView):
         return document
 
     def get_queryset(self):
-        return self.get_document().workflows.all()
+        return self.get_document().workflows.select_related(
+            'current_state', 'last_log_entry__transition',
+            'last_log_entry__user', 'workflow'
+        )
 
 
 class APIWorkflowInstanceLogEntryListView(generics.ListCreateAPIView):
@@ -1,11 +1,9 @@
 from __future__ import unicode_literals
 
 from django.apps import apps
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
 
-from kombu import Exchange, Queue
-
 from acls import ModelPermission
 from acls.links import link_acl_list
 from common import (
@@ -16,13 +14,14 @@ from common.classes import ModelAttribute
 from common.links import link_object_error_list
 from common.permissions_runtime import permission_error_log_view
 from common.widgets import two_state_template
-from mayan.celery import app
 from navigation import SourceColumn
 from rest_api.classes import APIEndPoint
 
 from .classes import DocumentStateHelper, WorkflowAction
 from .handlers import (
-    handler_index_document, handler_trigger_transition, launch_workflow
+    handler_index_document, handler_trigger_events_changed,
+    handler_trigger_transition, handler_update_current_state,
+    launch_workflow
 )
 from .links import (
     link_document_workflow_instance_list, link_setup_workflow_document_types,
@@ -234,23 +233,6 @@ class DocumentStatesApp(MayanAppConfig):
             )
         )
 
-        app.conf.CELERY_QUEUES.extend(
-            (
-                Queue(
-                    'document_states', Exchange('document_states'),
-                    routing_key='document_states'
-                ),
-            )
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'document_states.tasks.task_launch_all_workflows': {
-                    'queue': 'document_states'
-                },
-            }
-        )
-
         menu_facet.bind_links(
             links=(link_document_workflow_instance_list,), sources=(Document,)
         )
@@ -345,3 +327,18 @@ class DocumentStatesApp(MayanAppConfig):
             dispatch_uid='document_states_handler_trigger_transition',
             sender=Action
         )
+        post_delete.connect(
+            handler_trigger_events_changed,
+            dispatch_uid='document_states_handler_trigger_events_delete',
+            sender=WorkflowTransitionTriggerEvent
+        )
+        post_save.connect(
+            handler_trigger_events_changed,
+            dispatch_uid='document_states_handler_trigger_events_save',
+            sender=WorkflowTransitionTriggerEvent
+        )
+        post_delete.connect(
+            handler_update_current_state,
+            dispatch_uid='document_states_handler_update_current_state',
+            sender=WorkflowInstanceLogEntry
+        )
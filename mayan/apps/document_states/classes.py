@@ -2,14 +2,19 @@ from __future__ import unicode_literals
 
 from importlib import import_module
 import logging
+import threading
+import time
 
 from django.apps import apps
+from django.db import transaction
 from django.utils import six
 from django.utils.encoding import force_text
 
 from common.classes import PropertyHelper
 
-__all__ = ('WorkflowAction',)
+from .literals import TRIGGER_EVENTS_REFRESH_INTERVAL
+
+__all__ = ('TriggerEvents', 'WorkflowAction')
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +28,80 @@ class DocumentStateHelper(PropertyHelper):
         return self.instance.workflows.get(workflow__internal_name=name)
 
 
+class TriggerEventBatch(list):
+    """
+    List of (event name, document ID) tuples registered as a transaction
+    commit callback. Dispatches all the events of the transaction to a
+    single task.
+    """
+    def __call__(self):
+        from .tasks import task_trigger_transitions
+
+        task_trigger_transitions.apply_async(kwargs={'events': list(self)})
+
+
+class TriggerEvents(object):
+    """
+    Keep in memory the names of the events that trigger workflow
+    transitions so that the other events can be ignored without querying
+    the database. The names are reloaded when trigger events are changed
+    in this process and after an interval, to see the changes done by
+    other processes.
+    """
+    _event_names = None
+    _expiration = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def add(event_name, document_id):
+        """
+        Queue a matching event to be evaluated once the current
+        transaction commits, together with the other events of the
+        transaction.
+        """
+        connection = transaction.get_connection()
+
+        if not connection.in_atomic_block:
+            TriggerEventBatch(((event_name, document_id),))()
+            return
+
+        for savepoint_ids, function in connection.run_on_commit:
+            if isinstance(function, TriggerEventBatch):
+                batch = function
+                break
+        else:
+            batch = TriggerEventBatch()
+            transaction.on_commit(batch)
+
+        batch.append((event_name, document_id))
+
+    @classmethod
+    def get_event_names(cls):
+        if cls._event_names is None or time.time() > cls._expiration:
+            WorkflowTransitionTriggerEvent = apps.get_model(
+                app_label='document_states',
+                model_name='WorkflowTransitionTriggerEvent'
+            )
+
+            with cls._lock:
+                cls._event_names = frozenset(
+                    WorkflowTransitionTriggerEvent.objects.values_list(
+                        'event_type__name', flat=True
+                    ).distinct()
+                )
+                cls._expiration = time.time() + TRIGGER_EVENTS_REFRESH_INTERVAL
+
+        return cls._event_names
+
+    @classmethod
+    def invalidate(cls):
+        cls._event_names = None
+
+    @classmethod
+    def is_trigger(cls, event_name):
+        return event_name in cls.get_event_names()
+
+
 class WorkflowActionMetaclass(type):
     _registry = {}
 
@@ -1,10 +1,28 @@
 from __future__ import unicode_literals
 
 from django.apps import apps
-from django.utils.translation import ugettext_lazy as _
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 
 from document_indexing.tasks import task_index_document
-from events.classes import Event
+
+from .classes import TriggerEvents
+
+
+def handler_update_current_state(sender, **kwargs):
+    WorkflowInstance = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstance'
+    )
+
+    try:
+        workflow_instance = WorkflowInstance.objects.get(
+            pk=kwargs['instance'].workflow_instance_id
+        )
+    except WorkflowInstance.DoesNotExist:
+        # The log entry was deleted along with its workflow instance
+        pass
+    else:
+        workflow_instance.update_current_state()
 
 
 def handler_index_document(sender, **kwargs):
@@ -15,36 +33,33 @@ def handler_index_document(sender, **kwargs):
     )
 
 
+def handler_trigger_events_changed(sender, **kwargs):
+    TriggerEvents.invalidate()
+    # Reload again once committed in case another thread reloaded the
+    # event names before the change was visible
+    transaction.on_commit(TriggerEvents.invalidate)
+
+
 def handler_trigger_transition(sender, **kwargs):
     action = kwargs['instance']
 
+    if not TriggerEvents.is_trigger(event_name=action.verb):
+        return
+
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
-    WorkflowInstance = apps.get_model(
-        app_label='document_states', model_name='WorkflowInstance'
-    )
-    WorkflowTransition = apps.get_model(
-        app_label='document_states', model_name='WorkflowTransition'
-    )
 
-    trigger_transitions = WorkflowTransition.objects.filter(trigger_events__event_type__name=kwargs['instance'].verb)
+    content_type = ContentType.objects.get_for_model(model=Document)
 
-    if isinstance(action.target, Document):
-        workflow_instances = WorkflowInstance.objects.filter(workflow__transitions__in=trigger_transitions, document=action.target).distinct()
-    elif isinstance(action.action_object, Document):
-        workflow_instances = WorkflowInstance.objects.filter(workflow__transitions__in=trigger_transitions, document=action.action_object).distinct()
+    if action.target_content_type_id == content_type.pk:
+        document_id = action.target_object_id
+    elif action.action_object_content_type_id == content_type.pk:
+        document_id = action.action_object_object_id
     else:
-        workflow_instances = WorkflowInstance.objects.none()
+        return
 
-    for workflow_instance in workflow_instances:
-        # Select the first transition that is valid for this workflow state
-        transition = list(set(trigger_transitions) & set(workflow_instance.get_transition_choices()))[0]
-
-        workflow_instance.do_transition(
-            comment=_('Event trigger: %s') % Event.get(name=action.verb).label,
-            transition=transition
-        )
+    TriggerEvents.add(event_name=action.verb, document_id=int(document_id))
 
 
 def launch_workflow(sender, instance, created, **kwargs):
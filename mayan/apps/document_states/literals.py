@@ -5,6 +5,10 @@ from django.utils.translation import ugettext_lazy as _
 WORKFLOW_ACTION_ON_ENTRY = 1
 WORKFLOW_ACTION_ON_EXIT = 2
 
+WORKFLOW_LAUNCH_CHUNK_SIZE = 1000
+
+TRIGGER_EVENTS_REFRESH_INTERVAL = 60
+
 WORKFLOW_ACTION_WHEN_CHOICES = (
     (WORKFLOW_ACTION_ON_ENTRY, _('On entry')),
     (WORKFLOW_ACTION_ON_EXIT, _('On exit')),
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def operation_update_current_state(apps, schema_editor):
+    WorkflowInstance = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstance'
+    )
+    WorkflowInstanceLogEntry = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstanceLogEntry'
+    )
+
+    last_log_entries = {}
+
+    queryset = WorkflowInstanceLogEntry.objects.using(
+        schema_editor.connection.alias
+    ).select_related('transition').order_by(
+        'workflow_instance', 'datetime', 'pk'
+    )
+
+    for log_entry in queryset.iterator():
+        last_log_entries[log_entry.workflow_instance_id] = log_entry
+
+    for workflow_instance_id, log_entry in last_log_entries.items():
+        WorkflowInstance.objects.using(
+            schema_editor.connection.alias
+        ).filter(pk=workflow_instance_id).update(
+            current_state=log_entry.transition.destination_state_id,
+            last_log_entry=log_entry.pk
+        )
+
+
+def operation_noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document_states', '0009_auto_20170807_0612'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflowinstance',
+            name='current_state',
+            field=models.ForeignKey(
+                blank=True, editable=False, null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='current_instances',
+                to='document_states.WorkflowState',
+                verbose_name='Current state'
+            ),
+        ),
+        migrations.AddField(
+            model_name='workflowinstance',
+            name='last_log_entry',
+            field=models.ForeignKey(
+                blank=True, editable=False, null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='+',
+                to='document_states.WorkflowInstanceLogEntry',
+                verbose_name='Last log entry'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_update_current_state,
+            reverse_code=operation_noop
+        ),
+    ]
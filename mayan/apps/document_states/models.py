@@ -7,11 +7,12 @@ from graphviz import Digraph
 
 from django.conf import settings
 from django.core.exceptions import PermissionDenied, ValidationError
-from django.db import IntegrityError, models
-from django.db.models import F, Max, Q
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
 from django.urls import reverse
 from django.utils.encoding import force_text, python_2_unicode_compatible
 from django.utils.module_loading import import_string
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
 from acls.models import AccessControlList
@@ -23,7 +24,7 @@ from permissions import Permission
 from .error_logs import error_log_state_actions
 from .literals import (
     WORKFLOW_ACTION_WHEN_CHOICES, WORKFLOW_ACTION_ON_ENTRY,
-    WORKFLOW_ACTION_ON_EXIT
+    WORKFLOW_ACTION_ON_EXIT, WORKFLOW_LAUNCH_CHUNK_SIZE
 )
 from .managers import WorkflowManager
 from .permissions import permission_workflow_transition
@@ -66,6 +67,15 @@ class Workflow(models.Model):
         except self.states.model.DoesNotExist:
             return None
 
+    def get_documents_not_launched(self, document_type):
+        """
+        Return the documents of a document type that don't have an
+        instance of this workflow yet.
+        """
+        return Document.objects.filter(document_type=document_type).exclude(
+            workflows__workflow=self
+        )
+
     def launch_for(self, document):
         try:
             logger.info(
@@ -81,6 +91,61 @@ class Workflow(models.Model):
                 'Workflow %s launched for document %s', self, document
             )
 
+    def launch_for_all(self, chunk_size=WORKFLOW_LAUNCH_CHUNK_SIZE):
+        """
+        Launch the workflow for all the documents of its document types
+        that don't have an instance yet. The missing documents are found
+        per document type and the instances inserted in chunks. Yields the
+        list of document IDs launched with each chunk.
+        """
+        for document_type in self.document_types.all():
+            last_document_id = 0
+
+            while True:
+                document_ids = list(
+                    self.get_documents_not_launched(
+                        document_type=document_type
+                    ).filter(pk__gt=last_document_id).order_by(
+                        'pk'
+                    ).values_list('pk', flat=True)[:chunk_size]
+                )
+
+                if not document_ids:
+                    break
+
+                last_document_id = document_ids[-1]
+                yield self.launch_for_documents(document_ids=document_ids)
+
+    def launch_for_documents(self, document_ids):
+        """
+        Create the instances of this workflow for a list of document IDs
+        with a single insert. Falls back to creating them one by one when
+        some were launched concurrently. Returns the IDs of the documents
+        for which an instance was created.
+        """
+        try:
+            with transaction.atomic():
+                WorkflowInstance.objects.bulk_create(
+                    [
+                        WorkflowInstance(
+                            document_id=document_id, workflow=self
+                        ) for document_id in document_ids
+                    ]
+                )
+        except IntegrityError:
+            launched_document_ids = []
+
+            for document_id in document_ids:
+                workflow_instance, created = self.instances.get_or_create(
+                    document_id=document_id
+                )
+                if created:
+                    launched_document_ids.append(document_id)
+
+            return launched_document_ids
+        else:
+            return document_ids
+
     def render(self):
         diagram = Digraph(
             name='finite_state_machine', graph_attr={
@@ -183,29 +248,15 @@ class WorkflowState(models.Model):
         return self.actions.filter(when=WORKFLOW_ACTION_ON_EXIT)
 
     def get_documents(self):
-        latest_entries = WorkflowInstanceLogEntry.objects.annotate(
-            max_datetime=Max(
-                'workflow_instance__log_entries__datetime'
-            )
-        ).filter(
-            datetime=F('max_datetime')
-        )
+        query = Q(workflows__current_state=self)
 
-        state_latest_entries = latest_entries.filter(
-            transition__destination_state=self
-        )
-
-        return Document.objects.filter(
-            Q(
-                workflows__pk__in=state_latest_entries.values_list(
-                    'workflow_instance', flat=True
-                )
-            ) | Q(
-                workflows__log_entries__isnull=True,
-                workflows__workflow__states=self,
-                workflows__workflow__states__initial=True
+        if self.initial:
+            query = query | Q(
+                workflows__current_state__isnull=True,
+                workflows__workflow=self.workflow
             )
-        ).distinct()
+
+        return Document.objects.filter(query)
 
 
 @python_2_unicode_compatible
@@ -327,6 +378,16 @@ class WorkflowInstance(models.Model):
         Document, on_delete=models.CASCADE, related_name='workflows',
         verbose_name=_('Document')
     )
+    current_state = models.ForeignKey(
+        WorkflowState, blank=True, editable=False, null=True,
+        on_delete=models.SET_NULL, related_name='current_instances',
+        verbose_name=_('Current state')
+    )
+    last_log_entry = models.ForeignKey(
+        'WorkflowInstanceLogEntry', blank=True, editable=False, null=True,
+        on_delete=models.SET_NULL, related_name='+',
+        verbose_name=_('Last log entry')
+    )
 
     def __str__(self):
         return force_text(self.workflow)
@@ -336,12 +397,42 @@ class WorkflowInstance(models.Model):
             'document_states:workflow_instance_detail', args=(str(self.pk),)
         )
 
+    def do_initial_state_actions(self, actions=None):
+        """
+        Execute the entry actions of the workflow's initial state for an
+        instance launched in bulk. The actions can be passed in to avoid
+        querying them again for each instance. There is no log entry yet,
+        the actions receive an unsaved one without a transition so that
+        their templates can keep using "entry_log".
+        """
+        if actions is None:
+            initial_state = self.workflow.get_initial_state()
+
+            if not initial_state:
+                return
+
+            actions = initial_state.entry_actions.filter(enabled=True)
+
+        entry_log = WorkflowInstanceLogEntry(
+            datetime=now(), workflow_instance=self
+        )
+
+        for action in actions:
+            action.execute(
+                context={
+                    'action': action, 'document': self.document,
+                    'entry_log': entry_log, 'workflow_instance': self
+                }
+            )
+
     def do_transition(self, transition, user=None, comment=None):
         try:
-            if transition in self.get_current_state().origin_transitions.all():
-                self.log_entries.create(
-                    comment=comment or '', transition=transition, user=user
-                )
+            with transaction.atomic():
+                if transition in self.get_current_state().origin_transitions.all():
+                    self.log_entries.create(
+                        comment=comment or '', transition=transition,
+                        user=user
+                    )
         except AttributeError:
             # No initial state has been set for this workflow
             pass
@@ -353,16 +444,13 @@ class WorkflowInstance(models.Model):
         archived; this field will tell at the current state where the
         document is right now.
         """
-        try:
-            return self.get_last_transition().destination_state
-        except AttributeError:
+        if self.current_state_id:
+            return self.current_state
+        else:
             return self.workflow.get_initial_state()
 
     def get_last_log_entry(self):
-        try:
-            return self.log_entries.order_by('datetime').last()
-        except AttributeError:
-            return None
+        return self.last_log_entry
 
     def get_last_transition(self):
         """
@@ -423,6 +511,25 @@ class WorkflowInstance(models.Model):
         verbose_name = _('Workflow instance')
         verbose_name_plural = _('Workflow instances')
 
+    def update_current_state(self):
+        """
+        Recalculate the stored current state and last log entry from the
+        log. Used when log entries are removed.
+        """
+        self.last_log_entry = self.log_entries.order_by(
+            'datetime', 'pk'
+        ).last()
+
+        try:
+            self.current_state = self.last_log_entry.transition.destination_state
+        except AttributeError:
+            self.current_state = None
+
+        WorkflowInstance.objects.filter(pk=self.pk).update(
+            current_state=self.current_state,
+            last_log_entry=self.last_log_entry
+        )
+
 
 @python_2_unicode_compatible
 class WorkflowInstanceLogEntry(models.Model):
@@ -462,13 +569,34 @@ class WorkflowInstanceLogEntry(models.Model):
             raise ValidationError(_('Not a valid transition choice.'))
 
     def save(self, *args, **kwargs):
-        result = super(WorkflowInstanceLogEntry, self).save(*args, **kwargs)
+        is_new = not self.pk
+
+        with transaction.atomic():
+            result = super(WorkflowInstanceLogEntry, self).save(*args, **kwargs)
+
+            if is_new:
+                # Keep the instance's materialized current state in sync
+                self.workflow_instance.current_state = self.transition.destination_state
+                self.workflow_instance.last_log_entry = self
+                WorkflowInstance.objects.filter(
+                    pk=self.workflow_instance.pk
+                ).update(
+                    current_state=self.transition.destination_state,
+                    last_log_entry=self
+                )
+
+        context = {
+            'document': self.workflow_instance.document, 'entry_log': self,
+            'workflow_instance': self.workflow_instance
+        }
 
         for action in self.transition.origin_state.exit_actions.filter(enabled=True):
-            action.execute(context={'action': action, 'entry_log': self})
+            context['action'] = action
+            action.execute(context=context)
 
         for action in self.transition.destination_state.entry_actions.filter(enabled=True):
-            action.execute(context={'action': action, 'entry_log': self})
+            context['action'] = action
+            action.execute(context=context)
 
         return result
 
@@ -11,3 +11,11 @@ queue_document_states.add_task_type(
     name='document_states.tasks.task_launch_all_workflows',
     label=_('Launch all workflows')
 )
+queue_document_states.add_task_type(
+    name='document_states.tasks.task_do_initial_state_actions',
+    label=_('Execute the initial state actions of launched workflows')
+)
+queue_document_states.add_task_type(
+    name='document_states.tasks.task_trigger_transitions',
+    label=_('Perform the transitions triggered by events')
+)
@@ -3,12 +3,40 @@ from __future__ import unicode_literals
 import logging
 
 from django.apps import apps
+from django.utils.translation import ugettext_lazy as _
 
+from events.classes import Event
 from mayan.celery import app
 
 logger = logging.getLogger(__name__)
 
 
+@app.task(ignore_result=True)
+def task_do_initial_state_actions(workflow_id, document_ids):
+    Workflow = apps.get_model(
+        app_label='document_states', model_name='Workflow'
+    )
+
+    workflow = Workflow.objects.get(pk=workflow_id)
+    initial_state = workflow.get_initial_state()
+
+    if not initial_state:
+        return
+
+    actions = list(initial_state.entry_actions.filter(enabled=True))
+
+    if not actions:
+        return
+
+    # Skip instances that already moved out of the initial state
+    queryset = workflow.instances.filter(
+        current_state__isnull=True, document_id__in=document_ids
+    ).select_related('document', 'workflow')
+
+    for workflow_instance in queryset:
+        workflow_instance.do_initial_state_actions(actions=actions)
+
+
 @app.task(ignore_result=True)
 def task_launch_all_workflows():
     Document = apps.get_model(app_label='documents', model_name='Document')
@@ -17,8 +45,114 @@ def task_launch_all_workflows():
     )
 
     logger.info('Start launching workflows')
-    for document in Document.objects.all():
-        logger.debug('Lauching workflows for document ID: %d', document.pk)
-        Workflow.objects.launch_for(document=document)
+
+    for workflow in Workflow.objects.all():
+        document_count = Document.objects.filter(
+            document_type__in=workflow.document_types.all()
+        ).count()
+        launched_count = 0
+        initial_state = workflow.get_initial_state()
+        has_initial_state_actions = initial_state and initial_state.entry_actions.filter(
+            enabled=True
+        ).exists()
+
+        logger.info(
+            'Launching workflow %s for the documents of %d document types',
+            workflow, workflow.document_types.count()
+        )
+
+        for document_ids in workflow.launch_for_all():
+            launched_count += len(document_ids)
+
+            if has_initial_state_actions and document_ids:
+                task_do_initial_state_actions.apply_async(
+                    kwargs={
+                        'workflow_id': workflow.pk,
+                        'document_ids': document_ids
+                    }
+                )
+
+            logger.info(
+                'Workflow %s: launched for %d new documents; %d documents '
+                'in its document types', workflow, launched_count,
+                document_count
+            )
+
+        logger.info(
+            'Finished launching workflow %s; launched for %d new documents',
+            workflow, launched_count
+        )
 
     logger.info('Finished launching workflows')
+
+
+@app.task(ignore_result=True)
+def task_trigger_transitions(events):
+    """
+    Perform the transitions triggered by a batch of (event name,
+    document ID) pairs.
+    """
+    WorkflowInstance = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstance'
+    )
+    WorkflowState = apps.get_model(
+        app_label='document_states', model_name='WorkflowState'
+    )
+    WorkflowTransitionTriggerEvent = apps.get_model(
+        app_label='document_states',
+        model_name='WorkflowTransitionTriggerEvent'
+    )
+
+    event_transitions = {}
+
+    event_names = set([event_name for event_name, document_id in events])
+    document_ids = set([document_id for event_name, document_id in events])
+
+    queryset = WorkflowTransitionTriggerEvent.objects.filter(
+        event_type__name__in=event_names
+    ).select_related('event_type', 'transition').order_by('transition__pk')
+
+    for trigger_event in queryset:
+        event_transitions.setdefault(
+            trigger_event.event_type.name, []
+        ).append(trigger_event.transition)
+
+    workflow_ids = set()
+    for transitions in event_transitions.values():
+        workflow_ids.update(
+            [transition.workflow_id for transition in transitions]
+        )
+
+    initial_states = dict(
+        WorkflowState.objects.filter(
+            initial=True, workflow_id__in=workflow_ids
+        ).values_list('workflow_id', 'pk')
+    )
+
+    document_workflow_instances = {}
+
+    queryset = WorkflowInstance.objects.filter(
+        document_id__in=document_ids, workflow_id__in=workflow_ids
+    ).select_related('current_state', 'document', 'workflow')
+
+    for workflow_instance in queryset:
+        document_workflow_instances.setdefault(
+            workflow_instance.document_id, []
+        ).append(workflow_instance)
+
+    for event_name, document_id in events:
+        for workflow_instance in document_workflow_instances.get(document_id, ()):
+            current_state_id = workflow_instance.current_state_id or initial_states.get(
+                workflow_instance.workflow_id
+            )
+
+            # Select the first transition that is valid for this workflow
+            # state
+            for transition in event_transitions.get(event_name, ()):
+                if transition.workflow_id == workflow_instance.workflow_id and transition.origin_state_id == current_state_id:
+                    workflow_instance.do_transition(
+                        comment=_('Event trigger: %s') % Event.get(
+                            name=event_name
+                        ).label, transition=transition
+                    )
+                    break
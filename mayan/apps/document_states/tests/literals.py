@@ -8,6 +8,8 @@ TEST_WORKFLOW_LABEL_EDITED = 'test workflow label edited'
 TEST_WORKFLOW_INITIAL_STATE_LABEL = 'test initial state'
 TEST_WORKFLOW_INITIAL_STATE_COMPLETION = 33
 TEST_WORKFLOW_INSTANCE_LOG_ENTRY_COMMENT = 'test workflow instance log entry comment'
+TEST_WORKFLOW_STATE_ACTION_LABEL = 'test state action label'
+TEST_WORKFLOW_STATE_ACTION_PATH = 'document_states.workflow_actions.HTTPPostAction'
 TEST_WORKFLOW_STATE_LABEL = 'test state label'
 TEST_WORKFLOW_STATE_LABEL_EDITED = 'test state label edited'
 TEST_WORKFLOW_STATE_COMPLETION = 66
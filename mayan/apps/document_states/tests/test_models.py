@@ -1,66 +1,28 @@
 from __future__ import unicode_literals
 
+import mock
+
 from django.test import override_settings
 
 from common.tests import BaseTestCase
-from documents.models import DocumentType
-from documents.tests import TEST_SMALL_DOCUMENT_PATH, TEST_DOCUMENT_TYPE_LABEL
+from documents.events import event_document_properties_edit
 from document_indexing.models import Index, IndexInstanceNode
+from events.models import EventType
 
-from ..models import Workflow
+from ..classes import TriggerEvents
+from ..models import WorkflowStateAction
+from ..tasks import task_launch_all_workflows, task_trigger_transitions
 
 from .literals import (
     TEST_INDEX_LABEL, TEST_INDEX_TEMPLATE_METADATA_EXPRESSION,
-    TEST_WORKFLOW_INTERNAL_NAME, TEST_WORKFLOW_INITIAL_STATE_LABEL,
-    TEST_WORKFLOW_INITIAL_STATE_COMPLETION, TEST_WORKFLOW_LABEL,
-    TEST_WORKFLOW_STATE_LABEL, TEST_WORKFLOW_STATE_COMPLETION,
-    TEST_WORKFLOW_TRANSITION_LABEL
+    TEST_WORKFLOW_INITIAL_STATE_LABEL, TEST_WORKFLOW_STATE_ACTION_LABEL,
+    TEST_WORKFLOW_STATE_ACTION_PATH, TEST_WORKFLOW_STATE_LABEL
 )
+from .mixins import WorkflowTestMixin
 
 
 @override_settings(OCR_AUTO_OCR=False)
-class DocumentStateIndexingTestCase(BaseTestCase):
-    def tearDown(self):
-        self.document_type.delete()
-        super(DocumentStateIndexingTestCase, self).tearDown()
-
-    def _create_document_type(self):
-        self.document_type = DocumentType.objects.create(
-            label=TEST_DOCUMENT_TYPE_LABEL
-        )
-
-    def _create_document(self):
-        with open(TEST_SMALL_DOCUMENT_PATH) as file_object:
-            self.document = self.document_type.new_document(
-                file_object=file_object
-            )
-
-    def _create_workflow(self):
-        self.workflow = Workflow.objects.create(
-            label=TEST_WORKFLOW_LABEL,
-            internal_name=TEST_WORKFLOW_INTERNAL_NAME
-        )
-        self.workflow.document_types.add(self.document_type)
-
-    def _create_workflow_states(self):
-        self._create_workflow()
-        self.workflow_state_1 = self.workflow.states.create(
-            completion=TEST_WORKFLOW_INITIAL_STATE_COMPLETION,
-            initial=True, label=TEST_WORKFLOW_INITIAL_STATE_LABEL
-        )
-        self.workflow_state_2 = self.workflow.states.create(
-            completion=TEST_WORKFLOW_STATE_COMPLETION,
-            label=TEST_WORKFLOW_STATE_LABEL
-        )
-
-    def _create_workflow_transition(self):
-        self._create_workflow_states()
-        self.workflow_transition = self.workflow.transitions.create(
-            label=TEST_WORKFLOW_TRANSITION_LABEL,
-            origin_state=self.workflow_state_1,
-            destination_state=self.workflow_state_2,
-        )
-
+class DocumentStateIndexingTestCase(WorkflowTestMixin, BaseTestCase):
     def _create_index(self):
         # Create empty index
         index = Index.objects.create(label=TEST_INDEX_LABEL)
@@ -122,3 +84,183 @@ class DocumentStateIndexingTestCase(BaseTestCase):
                 IndexInstanceNode.objects.values_list('value', flat=True)
             ), ['']
         )
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class WorkflowInstanceCurrentStateTestCase(WorkflowTestMixin, BaseTestCase):
+    def test_workflow_instance_initial_state(self):
+        self._create_document_type()
+        self._create_workflow_transition()
+        self._create_document()
+
+        workflow_instance = self.document.workflows.first()
+
+        self.assertEqual(workflow_instance.current_state, None)
+        self.assertEqual(
+            workflow_instance.get_current_state(), self.workflow_state_1
+        )
+        self.assertEqual(
+            list(self.workflow_state_1.get_documents()), [self.document]
+        )
+        self.assertEqual(list(self.workflow_state_2.get_documents()), [])
+
+    def test_workflow_instance_transition_current_state(self):
+        self._create_document_type()
+        self._create_workflow_transition()
+        self._create_document()
+
+        self.document.workflows.first().do_transition(
+            transition=self.workflow_transition,
+            user=self.admin_user
+        )
+
+        workflow_instance = self.document.workflows.first()
+
+        self.assertEqual(
+            workflow_instance.current_state, self.workflow_state_2
+        )
+        self.assertEqual(
+            workflow_instance.last_log_entry,
+            workflow_instance.log_entries.first()
+        )
+        self.assertEqual(list(self.workflow_state_1.get_documents()), [])
+        self.assertEqual(
+            list(self.workflow_state_2.get_documents()), [self.document]
+        )
+
+    def test_workflow_instance_log_entry_delete_current_state(self):
+        self._create_document_type()
+        self._create_workflow_transition()
+        self._create_document()
+
+        self.document.workflows.first().do_transition(
+            transition=self.workflow_transition,
+            user=self.admin_user
+        )
+
+        self.document.workflows.first().log_entries.all().delete()
+
+        workflow_instance = self.document.workflows.first()
+
+        self.assertEqual(workflow_instance.current_state, None)
+        self.assertEqual(workflow_instance.last_log_entry, None)
+        self.assertEqual(
+            workflow_instance.get_current_state(), self.workflow_state_1
+        )
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class WorkflowLaunchTestCase(WorkflowTestMixin, BaseTestCase):
+    def test_workflow_launch_for_all(self):
+        self._create_document_type()
+        self._create_document()
+        self._create_workflow_transition()
+
+        self.assertEqual(self.document.workflows.count(), 0)
+
+        task_launch_all_workflows.apply_async()
+
+        self.assertEqual(self.document.workflows.count(), 1)
+        self.assertEqual(
+            self.document.workflows.first().get_current_state(),
+            self.workflow_state_1
+        )
+
+    def test_workflow_launch_for_all_existing_instances(self):
+        self._create_document_type()
+        self._create_workflow_transition()
+        self._create_document()
+
+        self.assertEqual(self.document.workflows.count(), 1)
+
+        task_launch_all_workflows.apply_async()
+
+        self.assertEqual(self.document.workflows.count(), 1)
+
+    def _create_initial_state_action(self):
+        self.workflow_state_1.actions.create(
+            action_path=TEST_WORKFLOW_STATE_ACTION_PATH,
+            label=TEST_WORKFLOW_STATE_ACTION_LABEL
+        )
+
+    @mock.patch.object(WorkflowStateAction, 'execute')
+    def test_workflow_launch_for_upload_skips_initial_state_actions(self, execute):
+        self._create_document_type()
+        self._create_workflow_transition()
+        self._create_initial_state_action()
+        self._create_document()
+
+        self.assertEqual(self.document.workflows.count(), 1)
+        self.assertFalse(execute.called)
+
+    @mock.patch.object(WorkflowStateAction, 'execute')
+    def test_workflow_launch_for_all_initial_state_actions(self, execute):
+        self._create_document_type()
+        self._create_document()
+        self._create_workflow_transition()
+        self._create_initial_state_action()
+
+        task_launch_all_workflows.apply_async()
+
+        self.assertEqual(execute.call_count, 1)
+        context = execute.call_args[1]['context']
+        self.assertEqual(
+            context['entry_log'].workflow_instance.document, self.document
+        )
+        self.assertEqual(context['document'], self.document)
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class WorkflowTriggerEventTestCase(WorkflowTestMixin, BaseTestCase):
+    def _create_trigger_event(self):
+        self.event_type, created = EventType.objects.get_or_create(
+            name=event_document_properties_edit.name
+        )
+        self.workflow_transition.trigger_events.create(
+            event_type=self.event_type
+        )
+
+    def test_trigger_events_registry(self):
+        self._create_document_type()
+        self._create_workflow_transition()
+
+        self.assertFalse(
+            TriggerEvents.is_trigger(
+                event_name=event_document_properties_edit.name
+            )
+        )
+
+        self._create_trigger_event()
+
+        self.assertTrue(
+            TriggerEvents.is_trigger(
+                event_name=event_document_properties_edit.name
+            )
+        )
+
+        self.workflow_transition.trigger_events.all().delete()
+
+        self.assertFalse(
+            TriggerEvents.is_trigger(
+                event_name=event_document_properties_edit.name
+            )
+        )
+
+    def test_trigger_transitions_task(self):
+        self._create_document_type()
+        self._create_workflow_transition()
+        self._create_trigger_event()
+        self._create_document()
+
+        task_trigger_transitions.apply_async(
+            kwargs={
+                'events': [
+                    (event_document_properties_edit.name, self.document.pk)
+                ]
+            }
+        )
+
+        self.assertEqual(
+            self.document.workflows.first().get_current_state(),
+            self.workflow_state_2
+        )
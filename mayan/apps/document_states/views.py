@@ -62,7 +62,10 @@ class DocumentWorkflowInstanceListView(SingleObjectListView):
         }
 
     def get_object_list(self):
-        return self.get_document().workflows.all()
+        return self.get_document().workflows.select_related(
+            'current_state', 'last_log_entry__transition',
+            'last_log_entry__user', 'workflow'
+        )
 
 
 class WorkflowInstanceDetailView(SingleObjectListView):
@@ -27,7 +27,11 @@ class HTTPPostAction(WorkflowAction):
                     'their context via the variable "entry_log". '
                     'The "entry_log" in turn provides the '
                     '"workflow_instance", "datetime", "transition", "user", '
-                    'and "comment" attributes.'
+                    'and "comment" attributes. The "document" and '
+                    '"workflow_instance" variables are also available. The '
+                    'actions of the initial state, executed when launching '
+                    'workflows for existing documents, receive an '
+                    '"entry_log" without a transition.'
                 ),
                 'required': True
             },
@@ -47,7 +51,11 @@ class HTTPPostAction(WorkflowAction):
                     'their context via the variable "entry_log". '
                     'The "entry_log" in turn provides the '
                     '"workflow_instance", "datetime", "transition", "user", '
-                    'and "comment" attributes.'
+                    'and "comment" attributes. The "document" and '
+                    '"workflow_instance" variables are also available. The '
+                    'actions of the initial state, executed when launching '
+                    'workflows for existing documents, receive an '
+                    '"entry_log" without a transition.'
                 ), 'required': False
             }
 
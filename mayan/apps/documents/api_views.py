@@ -2,15 +2,24 @@ from __future__ import absolute_import, unicode_literals
 
 import logging
 
+from django.db.models import Prefetch
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
 
 from django_downloadview import DownloadMixin, VirtualFile
+from PIL import Image
 from rest_framework import generics, status
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
 from acls.models import AccessControlList
-from rest_api.filters import MayanObjectPermissionsFilter
+from converter.literals import OUTPUT_PROFILE_PREVIEW
+from converter.utils import get_output_format
+from rest_api.filters import (
+    MayanExpandPrefetchFilter, MayanObjectPermissionsFilter
+)
+from rest_api.negotiation import IgnoreClientContentNegotiation
 from rest_api.permissions import MayanPermission
 
 from .literals import DOCUMENT_IMAGE_TASK_TIMEOUT
@@ -34,7 +43,10 @@ from .serializers import (
     RecentDocumentSerializer, WritableDocumentSerializer,
     WritableDocumentTypeSerializer, WritableDocumentVersionSerializer
 )
-from .tasks import task_generate_document_page_image
+from .tasks import (
+    task_generate_document_page_image, task_generate_document_page_tile,
+    task_get_document_page_tiles_info
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +59,7 @@ class APIDeletedDocumentListView(generics.ListAPIView):
     filter_backends = (MayanObjectPermissionsFilter,)
     mayan_object_permissions = {'GET': (permission_document_view,)}
     permission_classes = (MayanPermission,)
-    queryset = Document.trash.all()
+    queryset = Document.trash.select_related('document_type')
     serializer_class = DeletedDocumentSerializer
 
 
@@ -126,11 +138,20 @@ class APIDocumentDownloadView(DownloadMixin, generics.RetrieveAPIView):
 
 
 class APIDocumentListView(generics.ListCreateAPIView):
-    filter_backends = (MayanObjectPermissionsFilter,)
+    filter_backends = (
+        MayanObjectPermissionsFilter, MayanExpandPrefetchFilter
+    )
     mayan_object_permissions = {'GET': (permission_document_view,)}
     mayan_view_permissions = {'POST': (permission_document_create,)}
     permission_classes = (MayanPermission,)
-    queryset = Document.objects.all()
+    queryset = Document.objects.prefetch_related(
+        Prefetch(
+            'document_type',
+            queryset=DocumentType.objects.with_documents_count().prefetch_related(
+                'filenames'
+            )
+        ), 'versions'
+    )
 
     def get(self, *args, **kwargs):
         """
@@ -242,6 +263,7 @@ class APIDocumentView(generics.RetrieveUpdateDestroyAPIView):
     Returns the selected document details.
     """
 
+    filter_backends = (MayanExpandPrefetchFilter,)
     mayan_object_permissions = {
         'GET': (permission_document_view,),
         'PUT': (permission_document_properties_edit,),
@@ -310,6 +332,9 @@ class APIDocumentPageImageView(generics.RetrieveAPIView):
               type: number
     """
 
+    # The image format is negotiated by the view, DRF would reject image
+    # only Accept headers with a 406.
+    content_negotiation_class = IgnoreClientContentNegotiation
     lookup_url_kwarg = 'page_pk'
 
     def get_document(self):
@@ -348,16 +373,136 @@ class APIDocumentPageImageView(generics.RetrieveAPIView):
         if rotation:
             rotation = int(rotation)
 
+        output_format = get_output_format(
+            profile=OUTPUT_PROFILE_PREVIEW,
+            accept=request.META.get('HTTP_ACCEPT')
+        )
+
         task = task_generate_document_page_image.apply_async(
             kwargs=dict(
                 document_page_id=self.kwargs['page_pk'], size=size, zoom=zoom,
-                rotation=rotation
+                rotation=rotation, output_format=output_format
             )
         )
 
         cache_filename = task.get(timeout=DOCUMENT_IMAGE_TASK_TIMEOUT)
         with cache_storage_backend.open(cache_filename) as file_object:
-            return HttpResponse(file_object.read(), content_type='image')
+            response = HttpResponse(
+                file_object.read(), content_type=Image.MIME[output_format]
+            )
+
+        patch_vary_headers(response, ('Accept',))
+        return response
+
+
+class APIDocumentPageTilesView(generics.RetrieveAPIView):
+    """
+    Returns the size of the full resolution image of the selected document
+    page and the layout of its deep zoom tile pyramid.
+    ---
+    GET:
+        omit_serializer: true
+        parameters:
+            - name: rotation
+              description: Rotation of the page in degrees, numeric value only.
+              paramType: query
+              type: number
+    """
+
+    lookup_url_kwarg = 'page_pk'
+
+    def get_document(self):
+        document = get_object_or_404(Document, pk=self.kwargs['pk'])
+
+        AccessControlList.objects.check_access(
+            permission_document_view, self.request.user, document
+        )
+        return document
+
+    def get_document_version(self):
+        return get_object_or_404(
+            self.get_document().versions.all(), pk=self.kwargs['version_pk']
+        )
+
+    def get_queryset(self):
+        return self.get_document_version().pages.all()
+
+    def get_rotation(self):
+        rotation = self.request.GET.get('rotation')
+
+        if rotation:
+            return int(rotation)
+
+    def get_serializer_class(self):
+        return None
+
+    def retrieve(self, request, *args, **kwargs):
+        task = task_get_document_page_tiles_info.apply_async(
+            kwargs=dict(
+                document_page_id=self.get_object().pk,
+                rotation=self.get_rotation()
+            )
+        )
+
+        return Response(task.get(timeout=DOCUMENT_IMAGE_TASK_TIMEOUT))
+
+
+class APIDocumentPageTileView(APIDocumentPageTilesView):
+    """
+    Returns a tile of the deep zoom pyramid of the selected document page.
+    Level 0 is a single pixel and each level doubles the size of the one
+    above, up to the full resolution page image.
+    ---
+    GET:
+        omit_serializer: true
+        parameters:
+            - name: rotation
+              description: Rotation of the page in degrees, numeric value only.
+              paramType: query
+              type: number
+    """
+
+    content_negotiation_class = IgnoreClientContentNegotiation
+
+    def retrieve(self, request, *args, **kwargs):
+        document_page = self.get_object()
+        rotation = self.get_rotation()
+        level = int(self.kwargs['level'])
+        x = int(self.kwargs['x'])
+        y = int(self.kwargs['y'])
+        output_format = get_output_format(
+            profile=OUTPUT_PROFILE_PREVIEW,
+            accept=request.META.get('HTTP_ACCEPT')
+        )
+
+        cache_filename = document_page.get_tile_filename(
+            level=level, x=x, y=y,
+            transformations=document_page.get_tile_transformations(
+                rotation=rotation
+            ), output_format=output_format
+        )
+
+        # Tiles already cut are served without a round trip to the workers
+        if not cache_storage_backend.exists(cache_filename):
+            task = task_generate_document_page_tile.apply_async(
+                kwargs=dict(
+                    document_page_id=document_page.pk, level=level, x=x,
+                    y=y, rotation=rotation, output_format=output_format
+                )
+            )
+
+            cache_filename = task.get(timeout=DOCUMENT_IMAGE_TASK_TIMEOUT)
+
+            if not cache_filename:
+                raise NotFound
+
+        with cache_storage_backend.open(cache_filename) as file_object:
+            response = HttpResponse(
+                file_object.read(), content_type=Image.MIME[output_format]
+            )
+
+        patch_vary_headers(response, ('Accept',))
+        return response
 
 
 class APIDocumentPageView(generics.RetrieveUpdateAPIView):
@@ -416,7 +561,9 @@ class APIDocumentTypeListView(generics.ListCreateAPIView):
     mayan_object_permissions = {'GET': (permission_document_type_view,)}
     mayan_view_permissions = {'POST': (permission_document_type_create,)}
     permission_classes = (MayanPermission,)
-    queryset = DocumentType.objects.all()
+    queryset = DocumentType.objects.with_documents_count().prefetch_related(
+        'filenames'
+    )
     serializer_class = DocumentTypeSerializer
 
     def get(self, *args, **kwargs):
@@ -494,7 +641,9 @@ class APIDocumentTypeDocumentListView(generics.ListAPIView):
     Returns a list of all the documents of a particular document type.
     """
 
-    filter_backends = (MayanObjectPermissionsFilter,)
+    filter_backends = (
+        MayanObjectPermissionsFilter, MayanExpandPrefetchFilter
+    )
     mayan_object_permissions = {'GET': (permission_document_view,)}
     serializer_class = DocumentSerializer
 
@@ -505,7 +654,14 @@ class APIDocumentTypeDocumentListView(generics.ListAPIView):
             obj=document_type
         )
 
-        return document_type.documents.all()
+        return document_type.documents.prefetch_related(
+            Prefetch(
+                'document_type',
+                queryset=DocumentType.objects.with_documents_count().prefetch_related(
+                    'filenames'
+                )
+            ), 'versions'
+        )
 
 
 class APIRecentDocumentListView(generics.ListAPIView):
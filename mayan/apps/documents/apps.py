@@ -2,8 +2,6 @@ from __future__ import absolute_import, unicode_literals
 
 from datetime import timedelta
 
-from kombu import Exchange, Queue
-
 from django.utils.translation import ugettext_lazy as _
 
 from acls import ModelPermission
@@ -37,7 +35,8 @@ from .dashboard_widgets import (
     widget_total_documents
 )
 from .handlers import (
-    create_default_document_type, handler_scan_duplicates_for
+    create_default_document_type, handler_pregenerate_page_images,
+    handler_scan_duplicates_for, handler_update_page_hashes
 )
 from .links import (
     link_clear_image_cache, link_document_clear_transformations,
@@ -56,7 +55,8 @@ from .links import (
     link_document_page_view_reset, link_document_page_zoom_in,
     link_document_page_zoom_out, link_document_pages, link_document_preview,
     link_document_print, link_document_properties, link_document_restore,
-    link_document_trash, link_document_type_create, link_document_type_delete,
+    link_document_similar_list, link_document_trash,
+    link_document_type_create, link_document_type_delete,
     link_document_type_edit, link_document_type_filename_create,
     link_document_type_filename_delete, link_document_type_filename_edit,
     link_document_type_filename_list, link_document_type_list,
@@ -65,7 +65,7 @@ from .links import (
     link_document_version_return_document, link_document_version_return_list,
     link_document_version_revert, link_document_version_view,
     link_duplicated_document_list, link_duplicated_document_scan,
-    link_trash_can_empty
+    link_page_hashes_update, link_trash_can_empty
 )
 from .literals import (
     CHECK_DELETE_PERIOD_INTERVAL, CHECK_TRASH_PERIOD_INTERVAL,
@@ -186,7 +186,7 @@ class DocumentsApp(MayanAppConfig):
             model=Document, related='document_type',
         )
         ModelPermission.register_inheritance(
-            model=DocumentPage, related='document',
+            model=DocumentPage, related='document_version__document',
         )
         ModelPermission.register_inheritance(
             model=DocumentTypeFilename, related='document_type',
@@ -315,58 +315,6 @@ class DocumentsApp(MayanAppConfig):
             }
         )
 
-        app.conf.CELERY_QUEUES.extend(
-            (
-                Queue(
-                    'converter', Exchange('converter'),
-                    routing_key='converter', delivery_mode=1
-                ),
-                Queue(
-                    'documents_periodic', Exchange('documents_periodic'),
-                    routing_key='documents_periodic', delivery_mode=1
-                ),
-                Queue('uploads', Exchange('uploads'), routing_key='uploads'),
-                Queue(
-                    'documents', Exchange('documents'), routing_key='documents'
-                ),
-            )
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'documents.tasks.task_check_delete_periods': {
-                    'queue': 'documents_periodic'
-                },
-                'documents.tasks.task_check_trash_periods': {
-                    'queue': 'documents_periodic'
-                },
-                'documents.tasks.task_delete_stubs': {
-                    'queue': 'documents_periodic'
-                },
-                'documents.tasks.task_clear_image_cache': {
-                    'queue': 'tools'
-                },
-                'documents.tasks.task_generate_document_page_image': {
-                    'queue': 'converter'
-                },
-                'documents.tasks.task_update_page_count': {
-                    'queue': 'uploads'
-                },
-                'documents.tasks.task_upload_new_version': {
-                    'queue': 'uploads'
-                },
-                'documents.tasks.task_scan_duplicates_all': {
-                    'queue': 'tools'
-                },
-                'documents.tasks.task_scan_duplicates_for': {
-                    'queue': 'uploads'
-                },
-                'documents.tasks.task_delete_document': {
-                    'queue': 'documents'
-                },
-            }
-        )
-
         dashboard_main.add_widget(widget=widget_document_types)
         dashboard_main.add_widget(widget=widget_documents_in_trash)
         dashboard_main.add_widget(widget=widget_new_documents_this_month)
@@ -384,7 +332,10 @@ class DocumentsApp(MayanAppConfig):
 
         menu_setup.bind_links(links=(link_document_type_setup,))
         menu_tools.bind_links(
-            links=(link_clear_image_cache, link_duplicated_document_scan)
+            links=(
+                link_clear_image_cache, link_duplicated_document_scan,
+                link_page_hashes_update
+            )
         )
 
         # Document type links
@@ -438,7 +389,10 @@ class DocumentsApp(MayanAppConfig):
 
         # Document facet links
         menu_facet.bind_links(
-            links=(link_document_duplicates_list, link_acl_list_with_icon,),
+            links=(
+                link_document_duplicates_list, link_document_similar_list,
+                link_acl_list_with_icon,
+            ),
             sources=(Document,)
         )
         menu_facet.bind_links(
@@ -557,10 +511,18 @@ class DocumentsApp(MayanAppConfig):
             create_default_document_type,
             dispatch_uid='create_default_document_type'
         )
+        post_version_upload.connect(
+            handler_pregenerate_page_images,
+            dispatch_uid='handler_pregenerate_page_images',
+        )
         post_version_upload.connect(
             handler_scan_duplicates_for,
             dispatch_uid='handler_scan_duplicates_for',
         )
+        post_version_upload.connect(
+            handler_update_page_hashes,
+            dispatch_uid='handler_update_page_hashes',
+        )
 
         registry.register(DeletedDocument)
         registry.register(Document)
@@ -6,6 +6,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from common.classes import DashboardWidget
 
+from .permissions import permission_document_type_view, permission_document_view
 from .statistics import (
     new_document_pages_this_month, new_documents_this_month,
 )
@@ -34,7 +35,7 @@ def get_deleted_documents_queryset():
 
 widget_pages_per_month = DashboardWidget(
     func=new_document_pages_this_month, icon='fa fa-calendar',
-    label=_('New pages this month'),
+    label=_('New pages this month'), name='documents_pages_per_month',
     link=reverse_lazy(
         'statistics:statistic_detail',
         args=('new-document-pages-per-month',)
@@ -44,6 +45,7 @@ widget_pages_per_month = DashboardWidget(
 widget_new_documents_this_month = DashboardWidget(
     func=new_documents_this_month, icon='fa fa-calendar',
     label=_('New documents this month'),
+    name='documents_new_documents_this_month',
     link=reverse_lazy(
         'statistics:statistic_detail',
         args=('new-documents-per-month',)
@@ -51,21 +53,27 @@ widget_new_documents_this_month = DashboardWidget(
 )
 
 widget_total_documents = DashboardWidget(
-    icon='fa fa-file', queryset=get_total_documents_queryset,
-    label=_('Total documents'),
+    icon='fa fa-file', invalidation_models=('documents.Document',),
+    label=_('Total documents'), name='documents_total_documents',
+    permission=permission_document_view,
+    queryset=get_total_documents_queryset,
     link=reverse_lazy('documents:document_list')
 )
 
 
 widget_document_types = DashboardWidget(
-    icon='fa fa-book', queryset=get_document_types_queryset,
-    label=_('Document types'),
+    icon='fa fa-book', invalidation_models=('documents.DocumentType',),
+    label=_('Document types'), name='documents_document_types',
+    permission=permission_document_type_view,
+    queryset=get_document_types_queryset,
     link=reverse_lazy('documents:document_type_list')
 )
 
 
 widget_documents_in_trash = DashboardWidget(
-    icon='fa fa-trash', queryset=get_deleted_documents_queryset,
-    label=_('Documents in trash'),
+    icon='fa fa-trash', invalidation_models=('documents.Document',),
+    label=_('Documents in trash'), name='documents_documents_in_trash',
+    permission=permission_document_view,
+    queryset=get_deleted_documents_queryset,
     link=reverse_lazy('documents:document_list_deleted')
 )
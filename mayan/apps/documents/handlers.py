@@ -1,10 +1,18 @@
 from __future__ import unicode_literals
 
 from django.apps import apps
+from django.core.cache import cache
 
-from .literals import DEFAULT_DOCUMENT_TYPE_LABEL
+from .literals import (
+    DEFAULT_DOCUMENT_TYPE_LABEL, PAGE_IMAGE_PREGENERATION_CACHE_KEY,
+    PAGE_IMAGE_PREGENERATION_TIMEOUT
+)
+from .settings import setting_display_size, setting_thumbnail_size
 from .signals import post_initial_document_type
-from .tasks import task_scan_duplicates_for
+from .tasks import (
+    task_pregenerate_document_page_image, task_scan_duplicates_for,
+    task_update_page_hashes
+)
 
 
 def create_default_document_type(sender, **kwargs):
@@ -21,7 +29,37 @@ def create_default_document_type(sender, **kwargs):
         )
 
 
+def handler_pregenerate_page_images(sender, instance, **kwargs):
+    """
+    Queue the rendering of the images the document views request first: the
+    thumbnail of the first page and every page at the display size.
+    """
+    for document_page in instance.pages.all():
+        sizes = set((setting_display_size.value,))
+        if document_page.page_number == 1:
+            sizes.add(setting_thumbnail_size.value)
+
+        for size in sizes:
+            # Skip pages and sizes already waiting in the queue
+            if cache.add(
+                PAGE_IMAGE_PREGENERATION_CACHE_KEY.format(
+                    document_page.pk, size
+                ), True, PAGE_IMAGE_PREGENERATION_TIMEOUT
+            ):
+                task_pregenerate_document_page_image.apply_async(
+                    kwargs={
+                        'document_page_id': document_page.pk, 'size': size
+                    }
+                )
+
+
 def handler_scan_duplicates_for(sender, instance, **kwargs):
     task_scan_duplicates_for.apply_async(
         kwargs={'document_id': instance.document.pk}
     )
+
+
+def handler_update_page_hashes(sender, instance, **kwargs):
+    task_update_page_hashes.apply_async(
+        kwargs={'version_id': instance.pk}
+    )
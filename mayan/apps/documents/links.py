@@ -310,7 +310,16 @@ link_document_duplicates_list = Link(
     permissions=(permission_document_view,), text=_('Duplicates'),
     view='documents:document_duplicates_list',
 )
+link_document_similar_list = Link(
+    args='resolved_object.id', icon='fa fa-clone',
+    permissions=(permission_document_view,), text=_('Similar'),
+    view='documents:document_similar_list',
+)
 link_duplicated_document_scan = Link(
     icon='fa fa-clone', text=_('Duplicated document scan'),
     view='documents:duplicated_document_scan'
 )
+link_page_hashes_update = Link(
+    icon='fa fa-refresh', permissions=(permission_document_tools,),
+    text=_('Update page hashes'), view='documents:page_hashes_update'
+)
@@ -13,6 +13,17 @@ DEFAULT_DELETE_TIME_UNIT = TIME_DELTA_UNIT_DAYS
 DEFAULT_ZIP_FILENAME = 'document_bundle.zip'
 DEFAULT_DOCUMENT_TYPE_LABEL = _('Default')
 DOCUMENT_IMAGE_TASK_TIMEOUT = 20
+# Perceptual page hashes are PAGE_HASH_SIZE * PAGE_HASH_SIZE bits long and
+# are split into PAGE_HASH_SEGMENT_COUNT indexed segments. Two hashes within
+# PAGE_HASH_SEGMENT_COUNT - 1 bits of each other share at least one segment.
+PAGE_HASH_MAX_DISTANCE = 3
+PAGE_HASH_SEGMENT_COUNT = 4
+PAGE_HASH_SIZE = 8
+PAGE_IMAGE_PREGENERATION_CACHE_KEY = 'documents_page_image_pregeneration_{}_{}'
+PAGE_IMAGE_PREGENERATION_TIMEOUT = 60 * 60  # 1 hour
+# Pages are cut into PAGE_TILE_SIZE pixels square tiles at each deep zoom
+# level, the tiles at the right and bottom edges can be smaller.
+PAGE_TILE_SIZE = 256
 STUB_EXPIRATION_INTERVAL = 60 * 60 * 24  # 24 hours
 UPDATE_PAGE_COUNT_RETRY_DELAY = 10
 UPLOAD_NEW_VERSION_RETRY_DELAY = 10
@@ -5,11 +5,14 @@ import logging
 
 from django.apps import apps
 from django.db import models
-from django.db.models import F, Max
+from django.db.models import Case, Count, F, Q, When
 from django.utils.timezone import now
 
-from .literals import STUB_EXPIRATION_INTERVAL
+from .literals import (
+    PAGE_HASH_MAX_DISTANCE, PAGE_HASH_SEGMENT_COUNT, STUB_EXPIRATION_INTERVAL
+)
 from .settings import setting_recent_count
+from .utils import get_hamming_distance, get_image_hash_segments
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,75 @@ class DocumentManager(models.Manager):
             document.invalidate_cache()
 
 
+class DocumentPageHashManager(models.Manager):
+    def get_similar(self, value, distance=PAGE_HASH_MAX_DISTANCE):
+        """
+        Return the page hashes within distance bits of value. Candidates
+        are the rows sharing at least one indexed segment with value, their
+        exact distance is checked afterwards.
+        """
+        if distance >= PAGE_HASH_SEGMENT_COUNT:
+            raise ValueError(
+                'Distance must be lower than the number of hash segments '
+                '({}).'.format(PAGE_HASH_SEGMENT_COUNT)
+            )
+
+        query = Q()
+        for index, segment in enumerate(get_image_hash_segments(value)):
+            query |= Q(**{'segment_{}'.format(index): segment})
+
+        queryset = self.filter(query).select_related(
+            'document_page__document_version'
+        )
+
+        return [
+            page_hash for page_hash in queryset if
+            get_hamming_distance(value, page_hash.get_value()) <= distance
+        ]
+
+    def get_similar_documents(self, document, distance=PAGE_HASH_MAX_DISTANCE):
+        """
+        Return the documents with at least one page similar to a page of
+        the latest version of document
+        """
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        document_ids = set()
+
+        queryset = self.filter(
+            document_page__document_version=document.latest_version
+        )
+
+        for page_hash in queryset:
+            value = page_hash.get_value()
+            # Blank and uniform pages hash to zero and would match every
+            # other blank page.
+            if not value:
+                continue
+
+            for entry in self.get_similar(value=value, distance=distance):
+                document_ids.add(
+                    entry.document_page.document_version.document_id
+                )
+
+        document_ids.discard(document.pk)
+
+        return Document.objects.filter(pk__in=document_ids)
+
+    def set_for(self, document_page, value):
+        defaults = {
+            'segment_{}'.format(index): segment for index, segment in
+            enumerate(get_image_hash_segments(value))
+        }
+        defaults['value'] = '{:016x}'.format(value)
+
+        return self.update_or_create(
+            document_page=document_page, defaults=defaults
+        )[0]
+
+
 class DocumentTypeManager(models.Manager):
     def check_delete_periods(self):
         logger.info('Executing')
@@ -98,19 +170,59 @@ class DocumentTypeManager(models.Manager):
     def get_by_natural_key(self, label):
         return self.get(label=label)
 
+    def with_documents_count(self):
+        """
+        Annotate each document type with the number of documents not in
+        the trash to avoid a count query per document type
+        """
+        return self.annotate(
+            documents_count=Count(
+                Case(
+                    When(
+                        documents__in_trash=False, then=F('documents__pk')
+                    )
+                )
+            )
+        )
+
 
 class DuplicatedDocumentManager(models.Manager):
+    def add_duplicates(self, document_id, duplicate_ids):
+        instance, created = self.get_or_create(document_id=document_id)
+        instance.documents.add(*duplicate_ids)
+
     def scan(self):
         """
-        Find duplicates by iterating over all documents and then
-        find matching latest version checksums
+        Find all the duplicates with a single grouping query over the stored
+        latest version checksums
         """
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
 
-        for document in Document.objects.all():
-            self.scan_for(document=document, scan_children=False)
+        # Clear the default ordering, it would be added to the GROUP BY
+        duplicated_checksums = Document.objects.exclude(
+            latest_version_checksum=None
+        ).order_by().values('latest_version_checksum').annotate(
+            count=Count('pk')
+        ).filter(count__gt=1).values('latest_version_checksum')
+
+        groups = {}
+        queryset = Document.objects.filter(
+            latest_version_checksum__in=duplicated_checksums
+        ).values_list('pk', 'latest_version_checksum')
+
+        for document_id, checksum in queryset.iterator():
+            groups.setdefault(checksum, []).append(document_id)
+
+        for document_ids in groups.values():
+            for document_id in document_ids:
+                self.add_duplicates(
+                    document_id=document_id, duplicate_ids=[
+                        duplicate_id for duplicate_id in document_ids
+                        if duplicate_id != document_id
+                    ]
+                )
 
     def scan_for(self, document, scan_children=True):
         """
@@ -120,22 +232,25 @@ class DuplicatedDocumentManager(models.Manager):
             app_label='documents', model_name='Document'
         )
 
-        # Get the documents whose latest version matches the checksum
-        # of the current document and exclude the current document
-        duplicates = Document.objects.annotate(
-            max_timestamp=Max('versions__timestamp')
-        ).filter(
-            versions__timestamp=F('max_timestamp'),
-            versions__checksum=document.checksum
-        ).exclude(pk=document.pk)
+        if not document.latest_version_checksum:
+            return
 
-        if duplicates.exists():
-            instance, created = self.get_or_create(document=document)
-            instance.documents.add(*duplicates)
+        duplicate_ids = list(
+            Document.objects.filter(
+                latest_version_checksum=document.latest_version_checksum
+            ).exclude(pk=document.pk).values_list('pk', flat=True)
+        )
+
+        if duplicate_ids:
+            self.add_duplicates(
+                document_id=document.pk, duplicate_ids=duplicate_ids
+            )
 
         if scan_children:
-            for document in duplicates:
-                self.scan_for(document=document, scan_children=False)
+            for duplicate_id in duplicate_ids:
+                self.add_duplicates(
+                    document_id=duplicate_id, duplicate_ids=(document.pk,)
+                )
 
 
 class PassthroughManager(models.Manager):
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def operation_store_document_version_sizes(apps, schema_editor):
+    from documents.runtime import storage_backend
+
+    DocumentVersion = apps.get_model('documents', 'DocumentVersion')
+
+    for document_version in DocumentVersion.objects.using(schema_editor.connection.alias).all():
+        if storage_backend.exists(document_version.file.name):
+            document_version.size = storage_backend.size(
+                document_version.file.name
+            )
+            document_version.save(update_fields=('size',))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0041_auto_20170823_1855'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentversion',
+            name='size',
+            field=models.BigIntegerField(
+                blank=True, editable=False, null=True, verbose_name='Size'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_store_document_version_sizes,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def operation_store_latest_version_checksums(apps, schema_editor):
+    Document = apps.get_model(app_label='documents', model_name='Document')
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+
+    latest_checksums = {}
+
+    queryset = DocumentVersion.objects.using(
+        schema_editor.connection.alias
+    ).order_by('document', 'timestamp', 'pk').values_list(
+        'document_id', 'checksum'
+    )
+
+    for document_id, checksum in queryset.iterator():
+        latest_checksums[document_id] = checksum
+
+    for document_id, checksum in latest_checksums.items():
+        Document.objects.using(schema_editor.connection.alias).filter(
+            pk=document_id
+        ).update(latest_version_checksum=checksum)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0042_documentversion_size'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='latest_version_checksum',
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, help_text=(
+                    'Checksum of the latest version of the document. Kept in '
+                    'sync with the versions to find duplicated documents '
+                    'with an indexed lookup.'
+                ), max_length=64, null=True,
+                verbose_name='Latest version checksum'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_store_latest_version_checksums,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0043_document_latest_version_checksum'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentPageHash',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                ('value', models.CharField(max_length=16, verbose_name='Value')),
+                ('segment_0', models.PositiveIntegerField(db_index=True)),
+                ('segment_1', models.PositiveIntegerField(db_index=True)),
+                ('segment_2', models.PositiveIntegerField(db_index=True)),
+                ('segment_3', models.PositiveIntegerField(db_index=True)),
+                (
+                    'document_page', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='hash', to='documents.DocumentPage',
+                        verbose_name='Document page'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Document page hash',
+                'verbose_name_plural': 'Document page hashes',
+            },
+        ),
+    ]
@@ -5,6 +5,8 @@ import logging
 import os
 import uuid
 
+from PIL import Image
+
 from django.conf import settings
 from django.core.files import File
 from django.db import models, transaction
@@ -21,8 +23,12 @@ from converter import (
     TransformationRotate, TransformationZoom
 )
 from converter.exceptions import InvalidOfficeFormat, PageCountError
-from converter.literals import DEFAULT_ZOOM_LEVEL, DEFAULT_ROTATION
+from converter.literals import (
+    DEFAULT_ZOOM_LEVEL, DEFAULT_ROTATION, OUTPUT_PROFILE_BASE,
+    OUTPUT_PROFILE_PREVIEW
+)
 from converter.models import Transformation
+from converter.utils import get_output_format, get_save_options
 from mimetype.api import get_mimetype
 
 from .events import (
@@ -30,10 +36,13 @@ from .events import (
     event_document_properties_edit, event_document_type_change,
     event_document_version_revert
 )
-from .literals import DEFAULT_DELETE_PERIOD, DEFAULT_DELETE_TIME_UNIT
+from .literals import (
+    DEFAULT_DELETE_PERIOD, DEFAULT_DELETE_TIME_UNIT, PAGE_TILE_SIZE
+)
 from .managers import (
-    DocumentManager, DocumentTypeManager, DuplicatedDocumentManager,
-    PassthroughManager, RecentDocumentManager, TrashCanManager
+    DocumentManager, DocumentPageHashManager, DocumentTypeManager,
+    DuplicatedDocumentManager, PassthroughManager, RecentDocumentManager,
+    TrashCanManager
 )
 from .permissions import permission_document_view
 from .runtime import cache_storage_backend, storage_backend
@@ -45,6 +54,7 @@ from .settings import (
 from .signals import (
     post_document_created, post_document_type_change, post_version_upload
 )
+from .utils import get_image_hash, get_tile_box, get_tile_max_level
 
 logger = logging.getLogger(__name__)
 
@@ -185,6 +195,14 @@ class Document(models.Model):
             'deferred upload via the API.'
         ), verbose_name=_('Is stub?')
     )
+    latest_version_checksum = models.CharField(
+        blank=True, db_index=True, editable=False, help_text=_(
+            'Checksum of the latest version of the document. Kept in sync '
+            'with the versions to find duplicated documents with an indexed '
+            'lookup.'
+        ), max_length=64, null=True,
+        verbose_name=_('Latest version checksum')
+    )
 
     objects = DocumentManager()
     passthrough = PassthroughManager()
@@ -291,6 +309,22 @@ class Document(models.Model):
             if _user:
                 self.add_as_recent_document_for_user(user=_user)
 
+    def update_latest_version_checksum(self):
+        """
+        Copy the checksum of the latest version to the document. Updates the
+        row directly to avoid triggering the document save events.
+        """
+        latest_version = self.versions.order_by('timestamp').last()
+
+        if latest_version:
+            self.latest_version_checksum = latest_version.checksum
+        else:
+            self.latest_version_checksum = None
+
+        Document.passthrough.filter(pk=self.pk).update(
+            latest_version_checksum=self.latest_version_checksum
+        )
+
     @property
     def size(self):
         return self.latest_version.size
@@ -316,6 +350,15 @@ class Document(models.Model):
 
     @property
     def latest_version(self):
+        if 'versions' in getattr(self, '_prefetched_objects_cache', {}):
+            # Use the versions prefetched by list views, they are already
+            # ordered by timestamp.
+            versions = self.versions.all()
+            if versions:
+                return versions[len(versions) - 1]
+            else:
+                return None
+
         return self.versions.order_by('timestamp').last()
 
     @property
@@ -392,6 +435,9 @@ class DocumentVersion(models.Model):
         blank=True, db_index=True, editable=False, max_length=64, null=True,
         verbose_name=_('Checksum')
     )
+    size = models.BigIntegerField(
+        blank=True, editable=False, null=True, verbose_name=_('Size')
+    )
 
     class Meta:
         ordering = ('timestamp',)
@@ -407,7 +453,10 @@ class DocumentVersion(models.Model):
 
         self.file.storage.delete(self.file.name)
 
-        return super(DocumentVersion, self).delete(*args, **kwargs)
+        result = super(DocumentVersion, self).delete(*args, **kwargs)
+        self.document.update_latest_version_checksum()
+
+        return result
 
     def get_absolute_url(self):
         return reverse('documents:document_version_view', args=(self.pk,))
@@ -452,7 +501,9 @@ class DocumentVersion(models.Model):
                     # Only do this for new documents
                     self.update_checksum(save=False)
                     self.update_mimetype(save=False)
+                    self.update_size(save=False)
                     self.save()
+                    self.document.update_latest_version_checksum()
                     self.update_page_count(save=False)
                     self.fix_orientation()
 
@@ -596,13 +647,6 @@ class DocumentVersion(models.Model):
         input_descriptor.close()
         return filepath
 
-    @property
-    def size(self):
-        if self.exists():
-            return self.file.storage.size(self.file.name)
-        else:
-            return None
-
     def update_checksum(self, save=True):
         """
         Open a document version's file and update the checksum field using
@@ -614,6 +658,7 @@ class DocumentVersion(models.Model):
             source.close()
             if save:
                 self.save()
+                self.document.update_latest_version_checksum()
 
     def update_mimetype(self, save=True):
         """
@@ -659,6 +704,19 @@ class DocumentVersion(models.Model):
 
             return detected_pages
 
+    def update_size(self, save=True):
+        """
+        Store the size of the document version's file so that it doesn't
+        need to be requested from the storage backend each time
+        """
+        if self.exists():
+            self.size = self.file.storage.size(self.file.name)
+        else:
+            self.size = None
+
+        if save:
+            self.save()
+
     @property
     def uuid(self):
         # Make cache UUID a mix of document UUID, version ID
@@ -752,6 +810,9 @@ class DocumentPage(models.Model):
         size = kwargs.get('size', setting_display_size.value) or setting_display_size.value
         rotation = kwargs.get('rotation', DEFAULT_ROTATION) or DEFAULT_ROTATION
         zoom_level = kwargs.get('zoom', DEFAULT_ZOOM_LEVEL) or DEFAULT_ZOOM_LEVEL
+        output_format = kwargs.get('output_format') or get_output_format(
+            profile=OUTPUT_PROFILE_PREVIEW
+        )
 
         if zoom_level < setting_zoom_min_level.value:
             zoom_level = setting_zoom_min_level.value
@@ -786,8 +847,9 @@ class DocumentPage(models.Model):
         if zoom_level:
             transformation_list.append(TransformationZoom(percent=zoom_level))
 
-        cache_filename = '{}-{}'.format(
-            self.cache_filename, BaseTransformation.combine(transformation_list)
+        cache_filename = '{}-{}-{}'.format(
+            self.cache_filename, BaseTransformation.combine(transformation_list),
+            output_format.lower()
         )
 
         # Check is transformed image is available
@@ -801,7 +863,10 @@ class DocumentPage(models.Model):
             logger.debug(
                 'transformations cache file "%s" not found', cache_filename
             )
-            image = self.get_image(transformations=transformation_list)
+            image = self.get_image(
+                transformations=transformation_list,
+                output_format=output_format, profile=OUTPUT_PROFILE_PREVIEW
+            )
             with cache_storage_backend.open(cache_filename, 'wb+') as file_object:
                 file_object.write(image.getvalue())
 
@@ -809,7 +874,65 @@ class DocumentPage(models.Model):
 
         return cache_filename
 
-    def get_image(self, transformations=None):
+    def generate_tile(self, level, x, y, rotation=None, output_format=None):
+        """
+        Cut a tile of the deep zoom pyramid of the page from the full
+        resolution page image. Return the tile cache filename or None if
+        the tile is outside of the page.
+        """
+        output_format = output_format or get_output_format(
+            profile=OUTPUT_PROFILE_PREVIEW
+        )
+        transformations = self.get_tile_transformations(rotation=rotation)
+        cache_filename = self.get_tile_filename(
+            level=level, x=x, y=y, transformations=transformations,
+            output_format=output_format
+        )
+
+        if cache_storage_backend.exists(cache_filename):
+            logger.debug('Tile cache file "%s" found', cache_filename)
+            return cache_filename
+
+        logger.debug('Tile cache file "%s" not found', cache_filename)
+
+        source_filename = self.get_tile_source(transformations=transformations)
+
+        with cache_storage_backend.open(source_filename) as file_object:
+            image = Image.open(file_object)
+            result = get_tile_box(
+                width=image.size[0], height=image.size[1], level=level, x=x,
+                y=y, tile_size=PAGE_TILE_SIZE
+            )
+
+            if not result:
+                return None
+
+            box, size = result
+
+            # Only the region of the tile is scaled, not the whole page
+            tile = image.crop(box)
+
+        # WEBP only supports color images
+        if tile.mode not in ('L', 'RGB') or output_format == 'WEBP':
+            tile = tile.convert('RGB')
+
+        if tile.size != size:
+            tile = tile.resize(size, Image.ANTIALIAS)
+
+        with cache_storage_backend.open(cache_filename, 'wb+') as file_object:
+            tile.save(
+                file_object, format=output_format, **get_save_options(
+                    output_format=output_format,
+                    profile=OUTPUT_PROFILE_PREVIEW
+                )
+            )
+
+        self.cached_images.create(filename=cache_filename)
+
+        return cache_filename
+
+    def get_image(self, transformations=None, output_format=None,
+                  profile=OUTPUT_PROFILE_BASE):
         cache_filename = self.cache_filename
         logger.debug('Page cache filename: %s', cache_filename)
 
@@ -845,7 +968,76 @@ class DocumentPage(models.Model):
         for transformation in transformations:
             converter.transform(transformation=transformation)
 
-        return converter.get_page()
+        return converter.get_page(
+            output_format=output_format, profile=profile
+        )
+
+    def get_tile_filename(self, level, x, y, transformations,
+                          output_format):
+        return '{}-{}-{}-{}-{}'.format(
+            self.get_tile_source_filename(transformations=transformations),
+            level, x, y, output_format.lower()
+        )
+
+    def get_tile_source(self, transformations):
+        """
+        Return the filename of the full resolution page image the tiles are
+        cut from, creating it the first time for each set of
+        transformations.
+        """
+        cache_filename = self.get_tile_source_filename(
+            transformations=transformations
+        )
+
+        if not cache_storage_backend.exists(cache_filename):
+            image = self.get_image(transformations=transformations)
+            with cache_storage_backend.open(cache_filename, 'wb+') as file_object:
+                file_object.write(image.getvalue())
+
+            self.cached_images.create(filename=cache_filename)
+
+        return cache_filename
+
+    def get_tile_source_filename(self, transformations):
+        if transformations:
+            return '{}-tiles-{}'.format(
+                self.cache_filename,
+                BaseTransformation.combine(transformations)
+            )
+        else:
+            return '{}-tiles'.format(self.cache_filename)
+
+    def get_tile_transformations(self, rotation=None):
+        transformation_list = list(
+            Transformation.objects.get_for_model(self, as_classes=True)
+        )
+
+        if rotation:
+            transformation_list.append(
+                TransformationRotate(degrees=rotation)
+            )
+
+        return transformation_list
+
+    def get_tiles_info(self, rotation=None):
+        """
+        Return the size of the full resolution page image and the layout of
+        its deep zoom pyramid.
+        """
+        source_filename = self.get_tile_source(
+            transformations=self.get_tile_transformations(rotation=rotation)
+        )
+
+        with cache_storage_backend.open(source_filename) as file_object:
+            # Only the image header is read to get the size
+            width, height = Image.open(file_object).size
+
+        return {
+            'height': height,
+            'max_level': get_tile_max_level(width=width, height=height),
+            'tile_size': PAGE_TILE_SIZE,
+            'width': width,
+        }
 
     def invalidate_cache(self):
         cache_storage_backend.delete(self.cache_filename)
@@ -866,6 +1058,17 @@ class DocumentPage(models.Model):
         """
         return '{}-{}'.format(self.document_version.uuid, self.pk)
 
+    def update_hash(self):
+        """
+        Store the perceptual hash of the page calculated from the base page
+        image, used to find visually similar pages
+        """
+        return DocumentPageHash.objects.set_for(
+            document_page=self, value=get_image_hash(
+                file_object=self.get_image(transformations=())
+            )
+        )
+
 
 class DocumentPageCachedImage(models.Model):
     document_page = models.ForeignKey(
@@ -883,6 +1086,32 @@ class DocumentPageCachedImage(models.Model):
         return super(DocumentPageCachedImage, self).delete(*args, **kwargs)
 
 
+class DocumentPageHash(models.Model):
+    """
+    Perceptual hash of a document page. The hash is also stored split into
+    indexed segments, which allows finding the hashes within a few bits of
+    each other with indexed equality lookups.
+    """
+    document_page = models.OneToOneField(
+        DocumentPage, on_delete=models.CASCADE, related_name='hash',
+        verbose_name=_('Document page')
+    )
+    value = models.CharField(max_length=16, verbose_name=_('Value'))
+    segment_0 = models.PositiveIntegerField(db_index=True)
+    segment_1 = models.PositiveIntegerField(db_index=True)
+    segment_2 = models.PositiveIntegerField(db_index=True)
+    segment_3 = models.PositiveIntegerField(db_index=True)
+
+    objects = DocumentPageHashManager()
+
+    class Meta:
+        verbose_name = _('Document page hash')
+        verbose_name_plural = _('Document page hashes')
+
+    def get_value(self):
+        return int(self.value, 16)
+
+
 class DocumentPageResult(DocumentPage):
     class Meta:
         ordering = ('document_version__document', 'page_number')
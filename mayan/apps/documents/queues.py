@@ -4,18 +4,25 @@ from django.utils.translation import ugettext_lazy as _
 
 from common.queues import queue_tools
 from task_manager.classes import CeleryQueue
+from task_manager.literals import TASK_CLASS_INTERACTIVE, TASK_CLASS_PERIODIC
 
 queue_converter = CeleryQueue(
-    name='converter', label=_('Converter'), transient=True
+    name='converter', label=_('Converter'),
+    task_class=TASK_CLASS_INTERACTIVE, transient=True
+)
+queue_converter_background = CeleryQueue(
+    name='converter_background', label=_('Converter background'),
+    transient=True
 )
 queue_documents_periodic = CeleryQueue(
-    name='documents_periodic', label=_('Documents periodic'), transient=True
+    name='documents_periodic', label=_('Documents periodic'),
+    task_class=TASK_CLASS_PERIODIC, transient=True
 )
-queue_uploads = CeleryQueue(
-    name='uploads', label=_('Uploads')
+queue_documents = CeleryQueue(
+    name='documents', label=_('Documents')
 )
 queue_uploads = CeleryQueue(
-    name='documents', label=_('Documents')
+    name='uploads', label=_('Uploads')
 )
 
 queue_documents_periodic.add_task_type(
@@ -35,12 +42,46 @@ queue_tools.add_task_type(
     name='documents.tasks.task_clear_image_cache',
     label=_('Clear image cache')
 )
+queue_tools.add_task_type(
+    name='documents.tasks.task_scan_duplicates_all',
+    label=_('Scan all documents for duplicates')
+)
+queue_tools.add_task_type(
+    name='documents.tasks.task_update_page_hashes_all',
+    label=_('Update the hashes of all document pages')
+)
 
 queue_converter.add_task_type(
     name='documents.tasks.task_generate_document_page_image',
     label=_('Generate document page image')
 )
+queue_converter.add_task_type(
+    name='documents.tasks.task_generate_document_page_tile',
+    label=_('Generate document page tile')
+)
+queue_converter.add_task_type(
+    name='documents.tasks.task_get_document_page_tiles_info',
+    label=_('Get document page tiles information')
+)
+
+queue_converter_background.add_task_type(
+    name='documents.tasks.task_pregenerate_document_page_image',
+    label=_('Pregenerate document page image')
+)
+queue_converter_background.add_task_type(
+    name='documents.tasks.task_update_page_hashes',
+    label=_('Update document page hashes')
+)
+
+queue_documents.add_task_type(
+    name='documents.tasks.task_delete_document',
+    label=_('Delete a document')
+)
 
+queue_uploads.add_task_type(
+    name='documents.tasks.task_scan_duplicates_for',
+    label=_('Scan document for duplicates')
+)
 queue_uploads.add_task_type(
     name='documents.tasks.task_update_page_count',
     label=_('Update document page count')
@@ -49,7 +90,3 @@ queue_uploads.add_task_type(
     name='documents.tasks.task_upload_new_version',
     label=_('Upload new document version')
 )
-queue_uploads.add_task_type(
-    name='documents.tasks.task_delete_document',
-    label=_('Delete a document')
-)
@@ -6,6 +6,7 @@ from rest_framework import serializers
 from rest_framework.reverse import reverse
 
 from common.models import SharedUploadedFile
+from rest_api.mixins import DynamicFieldsSerializerMixin
 
 from .models import (
     Document, DocumentVersion, DocumentPage, DocumentType,
@@ -15,7 +16,7 @@ from .settings import setting_language
 from .tasks import task_upload_new_version
 
 
-class DocumentPageSerializer(serializers.HyperlinkedModelSerializer):
+class DocumentPageSerializer(DynamicFieldsSerializerMixin, serializers.HyperlinkedModelSerializer):
     document_version_url = serializers.SerializerMethodField()
     image_url = serializers.SerializerMethodField()
     url = serializers.SerializerMethodField()
@@ -54,7 +55,7 @@ class DocumentTypeFilenameSerializer(serializers.ModelSerializer):
         fields = ('filename',)
 
 
-class DocumentTypeSerializer(serializers.HyperlinkedModelSerializer):
+class DocumentTypeSerializer(DynamicFieldsSerializerMixin, serializers.HyperlinkedModelSerializer):
     documents_url = serializers.HyperlinkedIdentityField(
         view_name='rest_api:documenttype-document-list',
     )
@@ -73,7 +74,11 @@ class DocumentTypeSerializer(serializers.HyperlinkedModelSerializer):
         model = DocumentType
 
     def get_documents_count(self, obj):
-        return obj.documents.count()
+        try:
+            # Annotated by DocumentTypeManager.with_documents_count
+            return obj.documents_count
+        except AttributeError:
+            return obj.documents.count()
 
 
 class WritableDocumentTypeSerializer(serializers.ModelSerializer):
@@ -94,14 +99,17 @@ class WritableDocumentTypeSerializer(serializers.ModelSerializer):
         model = DocumentType
 
     def get_documents_count(self, obj):
-        return obj.documents.count()
+        try:
+            # Annotated by DocumentTypeManager.with_documents_count
+            return obj.documents_count
+        except AttributeError:
+            return obj.documents.count()
 
 
-class DocumentVersionSerializer(serializers.HyperlinkedModelSerializer):
+class DocumentVersionSerializer(DynamicFieldsSerializerMixin, serializers.HyperlinkedModelSerializer):
     document_url = serializers.SerializerMethodField()
     download_url = serializers.SerializerMethodField()
     pages_url = serializers.SerializerMethodField()
-    size = serializers.SerializerMethodField()
     url = serializers.SerializerMethodField()
 
     class Meta:
@@ -116,9 +124,6 @@ class DocumentVersionSerializer(serializers.HyperlinkedModelSerializer):
         model = DocumentVersion
         read_only_fields = ('document', 'file', 'size')
 
-    def get_size(self, instance):
-        return instance.size
-
     def get_document_url(self, instance):
         return reverse(
             'rest_api:document-detail', args=(
@@ -210,7 +215,7 @@ class NewDocumentVersionSerializer(serializers.Serializer):
         )
 
 
-class DeletedDocumentSerializer(serializers.HyperlinkedModelSerializer):
+class DeletedDocumentSerializer(DynamicFieldsSerializerMixin, serializers.HyperlinkedModelSerializer):
     document_type_label = serializers.SerializerMethodField()
     restore = serializers.HyperlinkedIdentityField(
         view_name='rest_api:trasheddocument-restore'
@@ -236,7 +241,7 @@ class DeletedDocumentSerializer(serializers.HyperlinkedModelSerializer):
         return instance.document_type.label
 
 
-class DocumentSerializer(serializers.HyperlinkedModelSerializer):
+class DocumentSerializer(DynamicFieldsSerializerMixin, serializers.HyperlinkedModelSerializer):
     document_type = DocumentTypeSerializer()
     latest_version = DocumentVersionSerializer(many=False, read_only=True)
     versions_url = serializers.HyperlinkedIdentityField(
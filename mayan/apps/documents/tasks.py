@@ -4,12 +4,16 @@ import logging
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import OperationalError
 
+from converter.literals import OUTPUT_PROFILE_PREVIEW
+from converter.utils import get_output_formats
 from mayan.celery import app
 
 from .literals import (
-    UPDATE_PAGE_COUNT_RETRY_DELAY, UPLOAD_NEW_VERSION_RETRY_DELAY
+    PAGE_IMAGE_PREGENERATION_CACHE_KEY, UPDATE_PAGE_COUNT_RETRY_DELAY,
+    UPLOAD_NEW_VERSION_RETRY_DELAY
 )
 
 logger = logging.getLogger(__name__)
@@ -78,6 +82,60 @@ def task_generate_document_page_image(document_page_id, *args, **kwargs):
     return document_page.generate_image(*args, **kwargs)
 
 
+@app.task()
+def task_generate_document_page_tile(document_page_id, level, x, y,
+                                     rotation=None, output_format=None):
+    DocumentPage = apps.get_model(
+        app_label='documents', model_name='DocumentPage'
+    )
+
+    document_page = DocumentPage.objects.get(pk=document_page_id)
+
+    return document_page.generate_tile(
+        level=level, x=x, y=y, rotation=rotation, output_format=output_format
+    )
+
+
+@app.task()
+def task_get_document_page_tiles_info(document_page_id, rotation=None):
+    DocumentPage = apps.get_model(
+        app_label='documents', model_name='DocumentPage'
+    )
+
+    document_page = DocumentPage.objects.get(pk=document_page_id)
+
+    return document_page.get_tiles_info(rotation=rotation)
+
+
+@app.task(ignore_result=True)
+def task_pregenerate_document_page_image(document_page_id, size):
+    DocumentPage = apps.get_model(
+        app_label='documents', model_name='DocumentPage'
+    )
+
+    try:
+        document_page = DocumentPage.objects.get(pk=document_page_id)
+
+        # The format of a request depends on the client, render them all
+        output_formats = get_output_formats(profile=OUTPUT_PROFILE_PREVIEW)
+
+        for output_format in output_formats:
+            document_page.generate_image(
+                size=size, output_format=output_format
+            )
+    except DocumentPage.DoesNotExist:
+        logger.debug('Page deleted before pregeneration: %s', document_page_id)
+    except Exception as exception:
+        logger.error(
+            'Error pregenerating the images of page: %s; %s',
+            document_page_id, exception
+        )
+    finally:
+        cache.delete(
+            PAGE_IMAGE_PREGENERATION_CACHE_KEY.format(document_page_id, size)
+        )
+
+
 @app.task(ignore_result=True)
 def task_scan_duplicates_all():
     DuplicatedDocument = apps.get_model(
@@ -101,6 +159,41 @@ def task_scan_duplicates_for(document_id):
     DuplicatedDocument.objects.scan_for(document=document)
 
 
+@app.task(ignore_result=True)
+def task_update_page_hashes(version_id):
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+
+    document_version = DocumentVersion.objects.get(pk=version_id)
+
+    for document_page in document_version.pages.all():
+        try:
+            document_page.update_hash()
+        except Exception as exception:
+            logger.error(
+                'Error calculating the hash of page: %s; %s', document_page,
+                exception
+            )
+
+
+@app.task(ignore_result=True)
+def task_update_page_hashes_all():
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+
+    # Versions uploaded before page hashes existed
+    queryset = DocumentVersion.objects.filter(
+        pages__hash__isnull=True
+    ).distinct()
+
+    for version_id in queryset.values_list('pk', flat=True):
+        task_update_page_hashes.apply_async(
+            kwargs={'version_id': version_id}
+        )
+
+
 @app.task(bind=True, default_retry_delay=UPDATE_PAGE_COUNT_RETRY_DELAY, ignore_result=True)
 def task_update_page_count(self, version_id):
     DocumentVersion = apps.get_model(
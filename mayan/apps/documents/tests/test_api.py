@@ -7,7 +7,9 @@ import time
 from json import loads
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.encoding import force_text
 
@@ -362,6 +364,97 @@ class DocumentAPITestCase(BaseAPITestCase):
             TEST_DOCUMENT_DESCRIPTION_EDITED
         )
 
+    def test_document_page_image_image_accept_header(self):
+        document = self._create_document()
+        document_page = document.pages.first()
+
+        response = self.client.get(
+            reverse(
+                'rest_api:documentpage-image', args=(
+                    document.pk, document.latest_version.pk, document_page.pk
+                )
+            ), HTTP_ACCEPT='image/webp,image/*'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('image/'))
+
+    def test_document_page_tile_image_accept_header(self):
+        document = self._create_document()
+        document_page = document.pages.first()
+
+        response = self.client.get(
+            reverse(
+                'rest_api:documentpage-tile', args=(
+                    document.pk, document.latest_version.pk,
+                    document_page.pk, 0, 0, 0
+                )
+            ), HTTP_ACCEPT='image/jpeg'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+
+    def test_document_list_query_count(self):
+        for count in range(3):
+            self._create_document()
+
+        with CaptureQueriesContext(connection) as single_page_queries:
+            response = self.client.get(
+                reverse('rest_api:document-list'), data={'page_size': 1}
+            )
+
+        self.assertEqual(len(response.data['results']), 1)
+
+        with CaptureQueriesContext(connection) as full_page_queries:
+            response = self.client.get(
+                reverse('rest_api:document-list'), data={'page_size': 3}
+            )
+
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(
+            response.data['results'][0]['latest_version']['size'],
+            self.document.size
+        )
+        self.assertEqual(
+            len(single_page_queries.captured_queries),
+            len(full_page_queries.captured_queries)
+        )
+
+    def test_document_list_sparse_fieldset(self):
+        self._create_document()
+
+        response = self.client.get(
+            reverse('rest_api:document-list'), data={
+                'fields': 'id,label,latest_version.checksum'
+            }
+        )
+
+        self.assertEqual(
+            response.data['results'][0], {
+                'id': self.document.pk, 'label': self.document.label,
+                'latest_version': {'checksum': self.document.checksum}
+            }
+        )
+
+    def test_document_list_cursor_pagination(self):
+        for count in range(3):
+            self._create_document()
+
+        response = self.client.get(
+            reverse('rest_api:document-list'), data={
+                'cursor': '', 'page_size': 2
+            }
+        )
+
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(response.data['results'][0]['id'], self.document.pk)
+
+        response = self.client.get(response.data['next'])
+
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['next'], None)
+
 
 @override_settings(OCR_AUTO_OCR=False)
 class TrashedDocumentAPITestCase(BaseAPITestCase):
@@ -4,13 +4,26 @@ from datetime import timedelta
 import os
 import time
 
+from PIL import Image
+
 from django.conf import settings
+from django.core.cache import cache
 from django.test import override_settings
 
 from common.tests import BaseTestCase
 
-from ..literals import STUB_EXPIRATION_INTERVAL
-from ..models import DeletedDocument, Document, DocumentType
+from ..handlers import handler_pregenerate_page_images
+from ..literals import (
+    PAGE_IMAGE_PREGENERATION_CACHE_KEY, PAGE_TILE_SIZE,
+    STUB_EXPIRATION_INTERVAL
+)
+from ..models import (
+    DeletedDocument, Document, DocumentPageHash, DocumentType,
+    DocumentVersion, DuplicatedDocument
+)
+from ..runtime import cache_storage_backend
+from ..settings import setting_display_size, setting_thumbnail_size
+from ..tasks import task_update_page_hashes_all
 
 from .literals import (
     TEST_DOCUMENT_TYPE_LABEL, TEST_DOCUMENT_PATH, TEST_MULTI_PAGE_TIFF_PATH,
@@ -274,6 +287,201 @@ class DocumentVersionTestCase(GenericDocumentTestCase):
 
         self.assertEqual(self.document.versions.count(), 1)
 
+    def test_latest_version_checksum(self):
+        first_checksum = self.document.latest_version.checksum
+
+        self.assertEqual(
+            Document.objects.get(pk=self.document.pk).latest_version_checksum,
+            first_checksum
+        )
+
+        time.sleep(2)
+
+        with open(TEST_DOCUMENT_PATH) as file_object:
+            self.document.new_version(
+                file_object=file_object
+            )
+
+        self.assertEqual(
+            Document.objects.get(pk=self.document.pk).latest_version_checksum,
+            self.document.latest_version.checksum
+        )
+
+        self.document.versions.first().revert()
+
+        self.assertEqual(
+            Document.objects.get(pk=self.document.pk).latest_version_checksum,
+            first_checksum
+        )
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class DuplicatedDocumentTestCase(GenericDocumentTestCase):
+    def setUp(self):
+        super(DuplicatedDocumentTestCase, self).setUp()
+
+        with open(self.test_document_path) as file_object:
+            self.document_duplicate = self.document_type.new_document(
+                file_object=file_object, label=self.test_document_filename
+            )
+
+        with open(TEST_DOCUMENT_PATH) as file_object:
+            self.document_other = self.document_type.new_document(
+                file_object=file_object, label='other'
+            )
+
+    def _assert_duplicates(self):
+        self.assertQuerysetEqual(
+            DuplicatedDocument.objects.get(
+                document=self.document
+            ).documents.all(), (repr(self.document_duplicate),)
+        )
+        self.assertQuerysetEqual(
+            DuplicatedDocument.objects.get(
+                document=self.document_duplicate
+            ).documents.all(), (repr(self.document),)
+        )
+        self.assertFalse(
+            DuplicatedDocument.objects.filter(
+                document=self.document_other
+            ).exists()
+        )
+
+    def test_scan_for(self):
+        self._assert_duplicates()
+
+    def test_scan(self):
+        DuplicatedDocument.objects.all().delete()
+
+        DuplicatedDocument.objects.scan()
+
+        self._assert_duplicates()
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class DocumentPageHashTestCase(GenericDocumentTestCase):
+    def test_page_hash_creation(self):
+        self.assertTrue(
+            DocumentPageHash.objects.filter(
+                document_page=self.document.pages.first()
+            ).exists()
+        )
+
+    def test_similar_documents(self):
+        with open(self.test_document_path) as file_object:
+            document_similar = self.document_type.new_document(
+                file_object=file_object, label=self.test_document_filename
+            )
+
+        similar_documents = DocumentPageHash.objects.get_similar_documents(
+            document=self.document
+        )
+
+        self.assertTrue(document_similar in similar_documents)
+        self.assertFalse(self.document in similar_documents)
+
+    def test_page_hash_backfill(self):
+        DocumentPageHash.objects.all().delete()
+
+        task_update_page_hashes_all()
+
+        self.assertTrue(
+            DocumentPageHash.objects.filter(
+                document_page=self.document.pages.first()
+            ).exists()
+        )
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class DocumentPageImagePregenerationTestCase(GenericDocumentTestCase):
+    def test_thumbnail_pregeneration(self):
+        document_page = self.document.pages.first()
+        cached_image_count = document_page.cached_images.count()
+
+        cache_filename = document_page.generate_image(
+            size=setting_thumbnail_size.value
+        )
+
+        self.assertTrue(cache_storage_backend.exists(cache_filename))
+        self.assertEqual(
+            document_page.cached_images.count(), cached_image_count
+        )
+
+    def test_pregeneration_deduplication(self):
+        document_page = self.document.pages.first()
+        document_page.invalidate_cache()
+        cache_keys = [
+            PAGE_IMAGE_PREGENERATION_CACHE_KEY.format(document_page.pk, size)
+            for size in (
+                setting_display_size.value, setting_thumbnail_size.value
+            )
+        ]
+
+        # Mark the page as already queued
+        for cache_key in cache_keys:
+            cache.add(cache_key, True)
+
+        handler_pregenerate_page_images(
+            sender=DocumentVersion, instance=self.document.latest_version
+        )
+
+        for cache_key in cache_keys:
+            cache.delete(cache_key)
+
+        self.assertFalse(document_page.cached_images.exists())
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class DocumentPageTileTestCase(GenericDocumentTestCase):
+    def setUp(self):
+        super(DocumentPageTileTestCase, self).setUp()
+        self.document_page = self.document.pages.first()
+
+    def _get_tile_size(self, cache_filename):
+        with cache_storage_backend.open(cache_filename) as file_object:
+            return Image.open(file_object).size
+
+    def test_tiles_info(self):
+        tiles_info = self.document_page.get_tiles_info()
+
+        self.assertEqual(tiles_info['tile_size'], PAGE_TILE_SIZE)
+        self.assertTrue(
+            2 ** tiles_info['max_level'] >= max(
+                tiles_info['width'], tiles_info['height']
+            )
+        )
+
+    def test_tile_generation(self):
+        tiles_info = self.document_page.get_tiles_info()
+
+        self.assertEqual(
+            self._get_tile_size(
+                self.document_page.generate_tile(level=0, x=0, y=0)
+            ), (1, 1)
+        )
+        self.assertEqual(
+            self._get_tile_size(
+                self.document_page.generate_tile(
+                    level=tiles_info['max_level'], x=0, y=0
+                )
+            ), (
+                min(PAGE_TILE_SIZE, tiles_info['width']),
+                min(PAGE_TILE_SIZE, tiles_info['height'])
+            )
+        )
+
+    def test_tile_outside_of_page(self):
+        self.assertEqual(
+            self.document_page.generate_tile(level=0, x=1, y=0), None
+        )
+
+    def test_tile_invalidation(self):
+        cache_filename = self.document_page.generate_tile(level=0, x=0, y=0)
+
+        self.document_page.invalidate_cache()
+
+        self.assertFalse(cache_storage_backend.exists(cache_filename))
+
 
 @override_settings(OCR_AUTO_OCR=False)
 class DocumentManagerTestCase(BaseTestCase):
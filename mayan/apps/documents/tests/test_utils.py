@@ -1,11 +1,80 @@
 from __future__ import unicode_literals
 
+from io import BytesIO
+
+from PIL import Image, ImageEnhance
+
 from common.tests import BaseTestCase
 
-from ..utils import parse_range
+from ..utils import (
+    get_hamming_distance, get_image_hash, get_image_hash_segments,
+    get_tile_box, get_tile_max_level, parse_range
+)
+
+from .literals import TEST_SMALL_DOCUMENT_PATH
 
 
 class DocumentUtilsTestCase(BaseTestCase):
+    def test_image_hash_segments(self):
+        self.assertEqual(
+            get_image_hash_segments(0x0123456789abcdef),
+            [0x0123, 0x4567, 0x89ab, 0xcdef]
+        )
+
+    def test_image_hash_similar_images(self):
+        with open(TEST_SMALL_DOCUMENT_PATH, 'rb') as file_object:
+            value = get_image_hash(file_object=file_object)
+            file_object.seek(0)
+            image = Image.open(file_object).convert('RGB')
+
+        # Simulate a rescan: slightly darker and resized
+        image = ImageEnhance.Brightness(image).enhance(0.9)
+        image = image.resize((image.size[0] // 2, image.size[1] // 2))
+        image_buffer = BytesIO()
+        image.save(image_buffer, format='PNG')
+        image_buffer.seek(0)
+
+        self.assertLessEqual(
+            get_hamming_distance(
+                value, get_image_hash(file_object=image_buffer)
+            ), 3
+        )
+
+    def test_tile_box(self):
+        self.assertEqual(
+            get_tile_box(
+                width=1000, height=600, level=10, x=3, y=2, tile_size=256
+            ), ((768, 512, 1000, 600), (232, 88))
+        )
+        self.assertEqual(
+            get_tile_box(
+                width=1000, height=600, level=9, x=0, y=0, tile_size=256
+            ), ((0, 0, 512, 512), (256, 256))
+        )
+        self.assertEqual(
+            get_tile_box(
+                width=1000, height=600, level=0, x=0, y=0, tile_size=256
+            ), ((0, 0, 1000, 600), (1, 1))
+        )
+
+    def test_tile_box_outside_of_image(self):
+        self.assertEqual(
+            get_tile_box(
+                width=1000, height=600, level=10, x=4, y=0, tile_size=256
+            ), None
+        )
+        self.assertEqual(
+            get_tile_box(
+                width=1000, height=600, level=11, x=0, y=0, tile_size=256
+            ), None
+        )
+
+    def test_tile_max_level(self):
+        self.assertEqual(get_tile_max_level(width=1, height=1), 0)
+        self.assertEqual(get_tile_max_level(width=1000, height=600), 10)
+        self.assertEqual(get_tile_max_level(width=600, height=1024), 10)
+        self.assertEqual(get_tile_max_level(width=600, height=1025), 11)
+
     def test_parse_range(self):
         self.assertEqual(
             parse_range('1'), [1]
@@ -2,7 +2,10 @@
 
 from __future__ import unicode_literals
 
+from io import BytesIO
+import json
 import os
+import zipfile
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -14,7 +17,8 @@ from converter.models import Transformation
 from converter.permissions import permission_transformation_delete
 
 from ..literals import (
-    DEFAULT_DELETE_PERIOD, DEFAULT_DELETE_TIME_UNIT, PAGE_RANGE_ALL
+    DEFAULT_DELETE_PERIOD, DEFAULT_DELETE_TIME_UNIT, DEFAULT_ZIP_FILENAME,
+    PAGE_RANGE_ALL
 )
 from ..models import DeletedDocument, Document, DocumentType
 from ..permissions import (
@@ -296,6 +300,32 @@ class DocumentsViewsTestCase(GenericDocumentViewTestCase):
                 mime_type=self.document.file_mimetype
             )
 
+    def test_document_multiple_download_view_compressed(self):
+        self.expected_content_type = 'application/zip; charset=utf-8'
+        self.grant_access(
+            obj=self.document, permission=permission_document_download
+        )
+
+        response = self.get(
+            'documents:document_multiple_download',
+            data={'compressed': 'True', 'id_list': self.document.pk}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertTrue(
+            DEFAULT_ZIP_FILENAME in response['Content-Disposition']
+        )
+
+        zip_file = zipfile.ZipFile(
+            BytesIO(b''.join(response.streaming_content))
+        )
+
+        with self.document.open() as file_object:
+            self.assertEqual(
+                zip_file.read(self.document.label), file_object.read()
+            )
+
     def _request_document_version_download(self, data=None):
         data = data or {}
         return self.get(
@@ -1080,3 +1110,59 @@ class DuplicatedDocumentsViewsTestCase(GenericDocumentViewTestCase):
         self.assertContains(
             response, text=self.document.label, status_code=200
         )
+
+
+class DashboardWidgetViewTestCase(GenericDocumentViewTestCase):
+    def setUp(self):
+        super(DashboardWidgetViewTestCase, self).setUp()
+        self.login_user()
+
+    def _request_dashboard_widget_value(self, name):
+        response = self.get(
+            'common:dashboard_widget_value', kwargs={'name': name}
+        )
+        return json.loads(force_text(response.content))['value']
+
+    def test_total_documents_widget_no_permissions(self):
+        self.assertEqual(
+            self._request_dashboard_widget_value(
+                name='documents_total_documents'
+            ), 0
+        )
+
+    def test_total_documents_widget_with_access(self):
+        self.grant_access(
+            obj=self.document, permission=permission_document_view
+        )
+
+        self.assertEqual(
+            self._request_dashboard_widget_value(
+                name='documents_total_documents'
+            ), 1
+        )
+
+    def test_total_documents_widget_invalidation(self):
+        self.grant_access(
+            obj=self.document, permission=permission_document_view
+        )
+        self._request_dashboard_widget_value(name='documents_total_documents')
+
+        self.document.delete()
+
+        self.assertEqual(
+            self._request_dashboard_widget_value(
+                name='documents_total_documents'
+            ), 0
+        )
+        self.assertEqual(
+            self._request_dashboard_widget_value(
+                name='documents_documents_in_trash'
+            ), 1
+        )
+
+    def test_unknown_widget(self):
+        response = self.get(
+            'common:dashboard_widget_value', kwargs={'name': 'unknown'}
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -6,7 +6,8 @@ from .api_views import (
     APIDeletedDocumentListView, APIDeletedDocumentRestoreView,
     APIDeletedDocumentView, APIDocumentDownloadView, APIDocumentView,
     APIDocumentListView, APIDocumentVersionDownloadView,
-    APIDocumentPageImageView, APIDocumentPageView,
+    APIDocumentPageImageView, APIDocumentPageTileView,
+    APIDocumentPageTilesView, APIDocumentPageView,
     APIDocumentTypeDocumentListView, APIDocumentTypeListView,
     APIDocumentTypeView, APIDocumentVersionsListView,
     APIDocumentVersionPageListView, APIDocumentVersionView,
@@ -23,8 +24,9 @@ from .views import (
     DocumentPageRotateRightView, DocumentPageView, DocumentPageViewResetView,
     DocumentPageZoomInView, DocumentPageZoomOutView, DocumentPreviewView,
     DocumentPrint, DocumentRestoreView, DocumentRestoreManyView,
-    DocumentTransformationsClearView, DocumentTransformationsCloneView,
-    DocumentTrashView, DocumentTrashManyView, DocumentTypeCreateView,
+    DocumentSimilarListView, DocumentTransformationsClearView,
+    DocumentTransformationsCloneView, DocumentTrashView,
+    DocumentTrashManyView, DocumentTypeCreateView,
     DocumentTypeDeleteView, DocumentTypeDocumentListView,
     DocumentTypeFilenameCreateView, DocumentTypeFilenameDeleteView,
     DocumentTypeFilenameEditView, DocumentTypeFilenameListView,
@@ -32,7 +34,7 @@ from .views import (
     DocumentVersionDownloadFormView, DocumentVersionDownloadView,
     DocumentVersionListView, DocumentVersionRevertView, DocumentVersionView,
     DocumentView, DuplicatedDocumentListView, EmptyTrashCanView,
-    RecentDocumentListView, ScanDuplicatedDocuments
+    RecentDocumentListView, ScanDuplicatedDocuments, UpdatePageHashesView
 )
 
 
@@ -63,6 +65,10 @@ urlpatterns = [
         r'^(?P<pk>\d+)/duplicates/$', DocumentDuplicatesListView.as_view(),
         name='document_duplicates_list'
     ),
+    url(
+        r'^(?P<pk>\d+)/similar/$', DocumentSimilarListView.as_view(),
+        name='document_similar_list'
+    ),
     url(
         r'^(?P<pk>\d+)/restore/$', DocumentRestoreView.as_view(),
         name='document_restore'
@@ -276,6 +282,10 @@ urlpatterns = [
         ScanDuplicatedDocuments.as_view(),
         name='duplicated_document_scan'
     ),
+    url(
+        r'^tools/documents/pages/hashes/update/$',
+        UpdatePageHashesView.as_view(), name='page_hashes_update'
+    ),
 ]
 
 api_urls = [
@@ -317,6 +327,14 @@ api_urls = [
         r'^documents/(?P<pk>[0-9]+)/versions/(?P<version_pk>[0-9]+)/pages/(?P<page_pk>[0-9]+)/image/$',
         APIDocumentPageImageView.as_view(), name='documentpage-image'
     ),
+    url(
+        r'^documents/(?P<pk>[0-9]+)/versions/(?P<version_pk>[0-9]+)/pages/(?P<page_pk>[0-9]+)/tiles/$',
+        APIDocumentPageTilesView.as_view(), name='documentpage-tiles'
+    ),
+    url(
+        r'^documents/(?P<pk>[0-9]+)/versions/(?P<version_pk>[0-9]+)/pages/(?P<page_pk>[0-9]+)/tiles/(?P<level>[0-9]+)/(?P<x>[0-9]+)/(?P<y>[0-9]+)/$',
+        APIDocumentPageTileView.as_view(), name='documentpage-tile'
+    ),
     url(
         r'^document_types/(?P<pk>[0-9]+)/documents/$',
         APIDocumentTypeDocumentListView.as_view(),
@@ -1,5 +1,84 @@
 from __future__ import unicode_literals
 
+from PIL import Image
+
+from .literals import PAGE_HASH_SEGMENT_COUNT, PAGE_HASH_SIZE
+
+
+def get_hamming_distance(value_1, value_2):
+    return bin(value_1 ^ value_2).count('1')
+
+
+def get_image_hash(file_object):
+    """
+    Return the difference hash (dHash) of an image: the image is reduced to
+    a grayscale thumbnail and each bit records whether a pixel is brighter
+    than its right neighbour. Scans of the same page produce hashes that
+    differ only in a few bits.
+    """
+    image = Image.open(file_object).convert('L').resize(
+        (PAGE_HASH_SIZE + 1, PAGE_HASH_SIZE), Image.ANTIALIAS
+    )
+    pixels = list(image.getdata())
+
+    result = 0
+    for row in range(PAGE_HASH_SIZE):
+        for column in range(PAGE_HASH_SIZE):
+            offset = row * (PAGE_HASH_SIZE + 1) + column
+            result = (result << 1) | (pixels[offset] > pixels[offset + 1])
+
+    return result
+
+
+def get_image_hash_segments(value):
+    """
+    Split an image hash into PAGE_HASH_SEGMENT_COUNT integers, most
+    significant first.
+    """
+    segment_bits = PAGE_HASH_SIZE * PAGE_HASH_SIZE // PAGE_HASH_SEGMENT_COUNT
+    mask = (1 << segment_bits) - 1
+
+    return [
+        (value >> (segment_bits * index)) & mask
+        for index in reversed(range(PAGE_HASH_SEGMENT_COUNT))
+    ]
+
+
+def get_tile_box(width, height, level, x, y, tile_size):
+    """
+    Return the region of the full resolution image covered by a tile of a
+    deep zoom pyramid and the size of the tile, or None if the tile is
+    outside of the image.
+    """
+    max_level = get_tile_max_level(width=width, height=height)
+
+    if not 0 <= level <= max_level or x < 0 or y < 0:
+        return None
+
+    scale = 2 ** (max_level - level)
+    left = x * tile_size * scale
+    top = y * tile_size * scale
+
+    if left >= width or top >= height:
+        return None
+
+    right = min(left + tile_size * scale, width)
+    bottom = min(top + tile_size * scale, height)
+
+    return (left, top, right, bottom), (
+        (right - left + scale - 1) // scale,
+        (bottom - top + scale - 1) // scale
+    )
+
+
+def get_tile_max_level(width, height):
+    """
+    Return the deepest level of the deep zoom pyramid of an image. The
+    image is at full resolution at the deepest level and each level above
+    halves it, down to a single pixel at level 0.
+    """
+    return (max(width, height, 1) - 1).bit_length()
+
 
 def parse_range(astr):
     # http://stackoverflow.com/questions/4248399/
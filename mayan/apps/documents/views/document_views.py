@@ -11,7 +11,7 @@ from django.utils.http import urlencode
 from django.utils.translation import ugettext_lazy as _, ungettext
 
 from acls.models import AccessControlList
-from common.compressed_files import CompressedFile
+from common.compressed_files import StreamingZipFile
 from common.generics import (
     ConfirmView, FormView, MultipleObjectConfirmActionView,
     MultipleObjectFormActionView, SingleObjectDetailView,
@@ -32,7 +32,8 @@ from ..forms import (
 )
 from ..literals import PAGE_RANGE_RANGE, DEFAULT_ZIP_FILENAME
 from ..models import (
-    DeletedDocument, Document, DuplicatedDocument, RecentDocument
+    DeletedDocument, Document, DocumentPageHash, DuplicatedDocument,
+    RecentDocument
 )
 from ..permissions import (
     permission_document_delete, permission_document_download,
@@ -212,6 +213,24 @@ class DocumentDuplicatesListView(DocumentListView):
             return Document.objects.none()
 
 
+class DocumentSimilarListView(DocumentDuplicatesListView):
+    def get_extra_context(self):
+        context = super(DocumentSimilarListView, self).get_extra_context()
+        context.update(
+            {
+                'title': _(
+                    'Documents similar to: %s'
+                ) % self.get_document(),
+            }
+        )
+        return context
+
+    def get_object_list(self):
+        return DocumentPageHash.objects.get_similar_documents(
+            document=self.get_document()
+        )
+
+
 class DocumentEditView(SingleObjectEditView):
     form_class = DocumentForm
     model = Document
@@ -527,22 +546,10 @@ class DocumentDownloadView(SingleObjectDownloadView):
         )
 
         if self.request.GET.get('compressed') == 'True' or queryset.count() > 1:
-            compressed_file = CompressedFile()
-            for item in queryset:
-                descriptor = DocumentDownloadView.get_item_file(item=item)
-                compressed_file.add_file(
-                    descriptor, arcname=self.get_item_label(item=item)
-                )
-                descriptor.close()
-                DocumentDownloadView.commit_event(
-                    item=item, request=self.request
-                )
-
-            compressed_file.close()
-
             return DocumentDownloadView.VirtualFile(
-                compressed_file.as_file(zip_filename),
-                name=zip_filename
+                StreamingZipFile(
+                    members=self.get_zip_members(queryset=queryset)
+                ), name=zip_filename
             )
         else:
             item = queryset.first()
@@ -561,6 +568,20 @@ class DocumentDownloadView(SingleObjectDownloadView):
     def get_item_label(self, item):
         return item.label
 
+    def get_zip_members(self, queryset):
+        """
+        Yield the file of each item as it is added to the streamed archive.
+        Each file is closed and its download event committed only once the
+        archive has consumed it completely.
+        """
+        for item in queryset.iterator():
+            descriptor = DocumentDownloadView.get_item_file(item=item)
+            yield descriptor, self.get_item_label(item=item)
+            descriptor.close()
+            DocumentDownloadView.commit_event(
+                item=item, request=self.request
+            )
+
 
 class DocumentUpdatePageCountView(MultipleObjectConfirmActionView):
     model = Document
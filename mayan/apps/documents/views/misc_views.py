@@ -8,7 +8,10 @@ from django.utils.translation import ugettext_lazy as _
 from common.generics import ConfirmView
 
 from ..permissions import permission_document_tools
-from ..tasks import task_clear_image_cache, task_scan_duplicates_all
+from ..tasks import (
+    task_clear_image_cache, task_scan_duplicates_all,
+    task_update_page_hashes_all
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,3 +40,16 @@ class ScanDuplicatedDocuments(ConfirmView):
         messages.success(
             self.request, _('Duplicated document scan queued successfully.')
         )
+
+
+class UpdatePageHashesView(ConfirmView):
+    extra_context = {
+        'title': _('Calculate the missing document page hashes?')
+    }
+    view_permission = permission_document_tools
+
+    def view_action(self):
+        task_update_page_hashes_all.apply_async()
+        messages.success(
+            self.request, _('Document page hash update queued successfully.')
+        )
@@ -410,19 +410,33 @@ class DocumentVersionThumbnailWidget(DocumentThumbnailWidget):
 
 
 class InteractiveDocumentPageWidget(BaseDocumentThumbnailWidget):
+    """
+    Display a page as a grid of deep zoom tiles, only the tiles of the
+    level matching the zoom that are visible are loaded.
+    """
     click_view_name = None
+    preview_view_name = 'rest_api:documentpage-tiles'
 
     def get_preview_view_query_dict(self, instance):
         return {
-            'zoom': self.zoom,
             'rotation': self.rotation,
-            'size': setting_display_size.value,
         }
 
     def render(self, instance, *args, **kwargs):
         self.zoom = kwargs.pop('zoom')
         self.rotation = kwargs.pop('rotation')
 
-        return super(
-            InteractiveDocumentPageWidget, self
-        ).render(instance=instance, *args, **kwargs)
+        return mark_safe(
+            '<div class="instance-image-widget mayan-tiled-image" '
+            'data-url="{url}" data-zoom="{zoom}">'
+            '<div class="spinner-container text-primary">'
+            '<span class="spinner-icon fa-stack fa-lg">'
+            '<i class="fa fa-file-o fa-stack-2x"></i>'
+            '<i class="fa fa-clock-o fa-stack-1x"></i>'
+            '</span>'
+            '</div>'
+            '</div>'.format(
+                url=self.get_preview_view_url(instance=instance),
+                zoom=self.zoom
+            )
+        )
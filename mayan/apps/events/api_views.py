@@ -11,6 +11,7 @@ from acls.models import AccessControlList
 from rest_api.permissions import MayanPermission
 
 from .classes import Event
+from .pagination import EventPagination
 from .permissions import permission_events_view
 from .serializers import EventSerializer, EventTypeSerializer
 
@@ -20,6 +21,7 @@ class APIObjectEventListView(generics.ListAPIView):
     Return a list of events for the specified object.
     """
 
+    pagination_class = EventPagination
     serializer_class = EventSerializer
 
     def get_object(self):
@@ -61,6 +63,7 @@ class APIEventListView(generics.ListAPIView):
     """
 
     mayan_view_permissions = {'GET': (permission_events_view,)}
+    pagination_class = EventPagination
     permission_classes = (MayanPermission,)
     queryset = Action.objects.all()
     serializer_class = EventSerializer
@@ -1,14 +1,28 @@
 from __future__ import unicode_literals
 
+from datetime import timedelta
+
 from django.apps import apps
+from django.core.signals import (
+    got_request_exception, request_finished, request_started
+)
 from django.utils.translation import ugettext_lazy as _
 
+from celery.signals import task_failure, task_postrun, task_prerun
+
 from common import MayanAppConfig, menu_tools
+from mayan.celery import app
 from navigation import SourceColumn
 from rest_api.classes import APIEndPoint
 
+from .handlers import (
+    handler_event_buffer_discard, handler_event_buffer_request_started,
+    handler_event_buffer_start, handler_event_buffer_stop
+)
 from .links import link_events_list
 from .licenses import *  # NOQA
+from .literals import ARCHIVE_EVENTS_INTERVAL
+from .queues import *  # NOQA
 from .widgets import event_object_link, event_type_link
 
 
@@ -49,4 +63,38 @@ class EventsApp(MayanAppConfig):
             )
         )
 
+        app.conf.CELERYBEAT_SCHEDULE.update(
+            {
+                'task_archive_events': {
+                    'task': 'events.tasks.task_archive_events',
+                    'schedule': timedelta(seconds=ARCHIVE_EVENTS_INTERVAL),
+                },
+            }
+        )
+
         menu_tools.bind_links(links=(link_events_list,))
+
+        got_request_exception.connect(
+            handler_event_buffer_discard,
+            dispatch_uid='events_handler_event_buffer_got_request_exception'
+        )
+        request_finished.connect(
+            handler_event_buffer_stop,
+            dispatch_uid='events_handler_event_buffer_request_finished'
+        )
+        request_started.connect(
+            handler_event_buffer_request_started,
+            dispatch_uid='events_handler_event_buffer_request_started'
+        )
+        task_failure.connect(
+            handler_event_buffer_discard,
+            dispatch_uid='events_handler_event_buffer_task_failure'
+        )
+        task_postrun.connect(
+            handler_event_buffer_stop,
+            dispatch_uid='events_handler_event_buffer_task_postrun'
+        )
+        task_prerun.connect(
+            handler_event_buffer_start,
+            dispatch_uid='events_handler_event_buffer_task_prerun'
+        )
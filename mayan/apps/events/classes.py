@@ -1,10 +1,114 @@
 from __future__ import unicode_literals
 
+from datetime import timedelta
+import gzip
+import json
+import logging
+import threading
+
 from django.apps import apps
-from django.utils.encoding import force_text
+from django.contrib.contenttypes.models import ContentType
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+from django.utils.encoding import force_bytes, force_text
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
 from actstream import action
+from actstream.registry import check
+
+from common.utils import TemporaryFile
+
+from .literals import (
+    EVENT_ARCHIVE_DELETE_CHUNK_SIZE, EVENT_ARCHIVE_FILENAME_FORMAT,
+    EVENT_BUFFER_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EventArchive(object):
+    """
+    Move the actions older than the retention period to compressed JSON
+    lines files, one per month. Only whole months are archived so that
+    each month is written once.
+    """
+    fields = (
+        'pk', 'actor_content_type__app_label', 'actor_content_type__model',
+        'actor_object_id', 'verb', 'description',
+        'target_content_type__app_label', 'target_content_type__model',
+        'target_object_id', 'action_object_content_type__app_label',
+        'action_object_content_type__model', 'action_object_object_id',
+        'timestamp', 'public'
+    )
+
+    @classmethod
+    def archive(cls, retention_days):
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+
+        queryset = Action.objects.filter(
+            timestamp__lt=cls.get_month_start(
+                datetime=now() - timedelta(days=retention_days)
+            )
+        )
+
+        while True:
+            timestamp = queryset.order_by('timestamp').values_list(
+                'timestamp', flat=True
+            ).first()
+
+            if not timestamp:
+                break
+
+            month_start = cls.get_month_start(datetime=timestamp)
+            month_end = cls.get_month_start(
+                datetime=month_start + timedelta(days=32)
+            )
+
+            cls.archive_month(
+                name=month_start.strftime(EVENT_ARCHIVE_FILENAME_FORMAT),
+                queryset=queryset.filter(
+                    timestamp__gte=month_start, timestamp__lt=month_end
+                )
+            )
+
+    @classmethod
+    def archive_month(cls, name, queryset):
+        from .runtime import archive_storage
+
+        logger.info('Archiving events to: %s', name)
+
+        with TemporaryFile() as file_object:
+            archive_file = gzip.GzipFile(fileobj=file_object, mode='wb')
+
+            for values in queryset.order_by('timestamp', 'pk').values(*cls.fields).iterator():
+                archive_file.write(
+                    force_bytes(json.dumps(values, cls=DjangoJSONEncoder))
+                )
+                archive_file.write(b'\n')
+
+            archive_file.close()
+            file_object.seek(0)
+            archive_storage.save(name=name, content=File(file_object))
+
+        # Delete in chunks to keep the transactions and locks short
+        while True:
+            action_ids = list(
+                queryset.values_list('pk', flat=True)[:EVENT_ARCHIVE_DELETE_CHUNK_SIZE]
+            )
+
+            if not action_ids:
+                break
+
+            queryset.model.objects.filter(pk__in=action_ids).delete()
+
+    @staticmethod
+    def get_month_start(datetime):
+        return datetime.replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
 
 
 class Event(object):
@@ -30,6 +134,17 @@ class Event(object):
         except KeyError as exception:
             return force_text(exception)
 
+    @classmethod
+    def load_types(cls):
+        """
+        Cache the event types of all the registered events with a single
+        query.
+        """
+        EventType = apps.get_model('events', 'EventType')
+
+        for event_type in EventType.objects.filter(name__in=cls._registry.keys()):
+            cls._registry[event_type.name].event_type = event_type
+
     @classmethod
     def refresh(cls):
         for event_type in cls.all():
@@ -47,7 +162,36 @@ class Event(object):
         self.event_type = None
         self.__class__._registry[name] = self
 
+    def get_action(self, actor=None, action_object=None, target=None):
+        """
+        Return an unsaved actstream action for the event, built the same
+        way actstream's action handler does.
+        """
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+
+        actor = actor or target
+
+        result = Action(
+            actor_content_type=ContentType.objects.get_for_model(actor),
+            actor_object_id=actor.pk, public=True, timestamp=now(),
+            verb=self.name
+        )
+
+        for name, obj in (('action_object', action_object), ('target', target)):
+            if obj is not None:
+                check(obj)
+                setattr(result, '{}_object_id'.format(name), obj.pk)
+                setattr(
+                    result, '{}_content_type'.format(name),
+                    ContentType.objects.get_for_model(obj)
+                )
+
+        return result
+
     def get_type(self):
+        if not self.event_type:
+            self.__class__.load_types()
+
         if not self.event_type:
             EventType = apps.get_model('events', 'EventType')
 
@@ -58,13 +202,98 @@ class Event(object):
         return self.event_type
 
     def commit(self, actor=None, action_object=None, target=None):
-        if not self.event_type:
-            EventType = apps.get_model('events', 'EventType')
-            self.event_type, created = EventType.objects.get_or_create(
-                name=self.name
+        self.get_type()
+
+        if EventBuffer.is_active() and EventBuffer.is_supported():
+            EventBuffer.add(
+                action=self.get_action(
+                    actor=actor, action_object=action_object, target=target
+                )
+            )
+        else:
+            action.send(
+                actor or target, actor=actor, verb=self.name,
+                action_object=action_object, target=target
             )
 
-        action.send(
-            actor or target, actor=actor, verb=self.name,
-            action_object=action_object, target=target
-        )
+
+class EventBuffer(object):
+    """
+    Per thread buffer of the actions of the events committed during a
+    request or a task. The actions are inserted with a single query when
+    the outermost request or task finishes or when the buffer is full.
+    The post_save signal is sent for each action afterwards so that its
+    receivers, like the workflow transition triggers, still run. The
+    actions of a request or task that failed are discarded.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def add(cls, action):
+        cls._local.actions.append(action)
+
+        if len(cls._local.actions) >= EVENT_BUFFER_SIZE:
+            cls.flush()
+
+    @classmethod
+    def discard(cls):
+        if cls.is_active():
+            cls._local.actions = []
+
+    @classmethod
+    def flush(cls):
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+
+        actions = cls._local.actions
+        cls._local.actions = []
+
+        if actions:
+            # Send the signals in the same transaction so that their
+            # receivers can batch their own work until it commits
+            with transaction.atomic():
+                Action.objects.bulk_create(actions)
+
+                for entry in actions:
+                    post_save.send(
+                        sender=Action, instance=entry, created=True,
+                        raw=False, update_fields=None,
+                        using=transaction.get_connection().alias
+                    )
+
+    @classmethod
+    def is_active(cls):
+        return getattr(cls._local, 'depth', 0) > 0
+
+    @staticmethod
+    def is_supported():
+        # The post_save receivers need the primary keys of the actions,
+        # bulk_create only sets them on some databases.
+        return connection.features.can_return_ids_from_bulk_insert
+
+    @classmethod
+    def reset(cls):
+        """
+        Save the actions left by a request or task that didn't finish
+        cleanly and deactivate the buffer.
+        """
+        if cls.is_active():
+            cls._local.depth = 0
+            cls.flush()
+
+    @classmethod
+    def start(cls):
+        if not cls.is_active():
+            cls._local.actions = []
+            cls._local.depth = 0
+
+        cls._local.depth += 1
+
+    @classmethod
+    def stop(cls):
+        if not cls.is_active():
+            return
+
+        cls._local.depth -= 1
+
+        if not cls.is_active():
+            cls.flush()
@@ -0,0 +1,21 @@
+from __future__ import unicode_literals
+
+from .classes import EventBuffer
+
+
+def handler_event_buffer_discard(sender, **kwargs):
+    EventBuffer.discard()
+
+
+def handler_event_buffer_request_started(sender, **kwargs):
+    # Requests don't nest, an active buffer was left by a previous request
+    EventBuffer.reset()
+    EventBuffer.start()
+
+
+def handler_event_buffer_start(sender, **kwargs):
+    EventBuffer.start()
+
+
+def handler_event_buffer_stop(sender, **kwargs):
+    EventBuffer.stop()
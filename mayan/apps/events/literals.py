@@ -0,0 +1,7 @@
+from __future__ import unicode_literals
+
+ARCHIVE_EVENTS_INTERVAL = 24 * 60 * 60  # Once a day
+ARCHIVE_PATH = 'event_archive'
+EVENT_ARCHIVE_DELETE_CHUNK_SIZE = 1000
+EVENT_ARCHIVE_FILENAME_FORMAT = 'events-%Y-%m.jsonl.gz'
+EVENT_BUFFER_SIZE = 500
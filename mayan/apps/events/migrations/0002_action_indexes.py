@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+INDEXES = (
+    (
+        'events_action_actor_idx',
+        ('actor_content_type_id', 'actor_object_id', 'timestamp')
+    ),
+    (
+        'events_action_action_object_idx',
+        ('action_object_content_type_id', 'action_object_object_id', 'timestamp')
+    ),
+    (
+        'events_action_target_idx',
+        ('target_content_type_id', 'target_object_id', 'timestamp')
+    ),
+    ('events_action_verb_idx', ('verb', 'timestamp')),
+)
+
+
+def operation_create_indexes(apps, schema_editor):
+    Action = apps.get_model(app_label='actstream', model_name='Action')
+
+    for name, columns in INDEXES:
+        schema_editor.execute(
+            'CREATE INDEX {} ON {} ({})'.format(
+                schema_editor.quote_name(name),
+                schema_editor.quote_name(Action._meta.db_table),
+                ', '.join(
+                    [schema_editor.quote_name(column) for column in columns]
+                )
+            )
+        )
+
+
+def operation_drop_indexes(apps, schema_editor):
+    Action = apps.get_model(app_label='actstream', model_name='Action')
+
+    for name, columns in INDEXES:
+        if schema_editor.connection.vendor == 'mysql':
+            schema_editor.execute(
+                'DROP INDEX {} ON {}'.format(
+                    schema_editor.quote_name(name),
+                    schema_editor.quote_name(Action._meta.db_table)
+                )
+            )
+        else:
+            schema_editor.execute(
+                'DROP INDEX {}'.format(schema_editor.quote_name(name))
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('actstream', '0001_initial'),
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=operation_create_indexes,
+            reverse_code=operation_drop_indexes
+        ),
+    ]
@@ -0,0 +1,14 @@
+from __future__ import unicode_literals
+
+from rest_api.pagination import MayanCursorPagination, MayanPagination
+
+
+class EventCursorPagination(MayanCursorPagination):
+    """
+    Keyset pagination in the same order events are shown, newest first.
+    """
+    ordering = '-timestamp'
+
+
+class EventPagination(MayanPagination):
+    cursor_pagination_class = EventCursorPagination
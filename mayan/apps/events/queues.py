@@ -0,0 +1,10 @@
+from __future__ import absolute_import, unicode_literals
+
+from django.utils.translation import ugettext_lazy as _
+
+from common.queues import queue_common_periodic
+
+queue_common_periodic.add_task_type(
+    name='events.tasks.task_archive_events',
+    label=_('Archive old events')
+)
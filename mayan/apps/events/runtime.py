@@ -0,0 +1,5 @@
+from django.utils.module_loading import import_string
+
+from .settings import setting_archive_storage_backend
+
+archive_storage = import_string(setting_archive_storage_backend.value)()
@@ -0,0 +1,21 @@
+from __future__ import unicode_literals
+
+from django.utils.translation import ugettext_lazy as _
+
+from smart_settings import Namespace
+
+namespace = Namespace(name='events', label=_('Events'))
+setting_archive_storage_backend = namespace.add_setting(
+    global_name='EVENTS_ARCHIVE_STORAGE_BACKEND',
+    default='events.storage.EventArchiveFileStorage', help_text=_(
+        'Path to the Storage subclass used to store the archived events.'
+    )
+)
+setting_retention_days = namespace.add_setting(
+    global_name='EVENTS_RETENTION_DAYS', default=0, help_text=_(
+        'Number of days events are kept in the database. Older events are '
+        'moved, a whole month at a time, to compressed monthly files in '
+        'the archive storage. Set to 0 to keep all events in the '
+        'database.'
+    )
+)
@@ -0,0 +1,16 @@
+from __future__ import unicode_literals
+
+import os
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+
+from .literals import ARCHIVE_PATH
+
+
+class EventArchiveFileStorage(FileSystemStorage):
+    """Simple wrapper for the stock Django FileSystemStorage class"""
+
+    def __init__(self, *args, **kwargs):
+        super(EventArchiveFileStorage, self).__init__(*args, **kwargs)
+        self.location = os.path.join(settings.MEDIA_ROOT, ARCHIVE_PATH)
@@ -0,0 +1,18 @@
+from __future__ import unicode_literals
+
+import logging
+
+from mayan.celery import app
+
+from .classes import EventArchive
+from .settings import setting_retention_days
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(ignore_result=True)
+def task_archive_events():
+    if setting_retention_days.value:
+        logger.info('Start archiving events')
+        EventArchive.archive(retention_days=setting_retention_days.value)
+        logger.info('Finished archiving events')
@@ -0,0 +1,108 @@
+from __future__ import unicode_literals
+
+from datetime import timedelta
+import gzip
+import json
+
+import mock
+
+from django.utils.timezone import now
+
+from actstream.models import Action
+
+from common.tests import BaseTestCase
+from documents.events import event_document_view
+
+from ..classes import EventArchive, EventBuffer
+from ..literals import EVENT_ARCHIVE_FILENAME_FORMAT
+from ..runtime import archive_storage
+
+
+class EventBufferTestCase(BaseTestCase):
+    def tearDown(self):
+        EventBuffer.reset()
+        super(EventBufferTestCase, self).tearDown()
+
+    def test_event_commit_unbuffered(self):
+        event_document_view.commit(target=self.admin_user)
+
+        self.assertEqual(Action.objects.count(), 1)
+
+    @mock.patch.object(EventBuffer, 'is_supported', return_value=True)
+    def test_event_commit_buffered(self, is_supported):
+        EventBuffer.start()
+        event_document_view.commit(target=self.admin_user)
+        event_document_view.commit(target=self.admin_user)
+
+        self.assertEqual(Action.objects.count(), 0)
+
+        EventBuffer.stop()
+
+        self.assertEqual(Action.objects.count(), 2)
+        self.assertEqual(
+            Action.objects.first().verb, event_document_view.name
+        )
+        self.assertEqual(Action.objects.first().target, self.admin_user)
+
+    @mock.patch.object(EventBuffer, 'is_supported', return_value=True)
+    def test_event_commit_buffered_nested(self, is_supported):
+        EventBuffer.start()
+        EventBuffer.start()
+        event_document_view.commit(target=self.admin_user)
+        EventBuffer.stop()
+
+        self.assertEqual(Action.objects.count(), 0)
+
+        EventBuffer.stop()
+
+        self.assertEqual(Action.objects.count(), 1)
+
+    @mock.patch.object(EventBuffer, 'is_supported', return_value=True)
+    def test_event_commit_buffered_discard(self, is_supported):
+        EventBuffer.start()
+        event_document_view.commit(target=self.admin_user)
+        EventBuffer.discard()
+        EventBuffer.stop()
+
+        self.assertEqual(Action.objects.count(), 0)
+
+    @mock.patch.object(EventBuffer, 'is_supported', return_value=False)
+    def test_event_commit_buffer_not_supported(self, is_supported):
+        EventBuffer.start()
+        event_document_view.commit(target=self.admin_user)
+
+        self.assertEqual(Action.objects.count(), 1)
+
+        EventBuffer.stop()
+
+        self.assertEqual(Action.objects.count(), 1)
+
+
+class EventArchiveTestCase(BaseTestCase):
+    def test_event_archive(self):
+        event_document_view.commit(target=self.admin_user)
+        event_document_view.commit(target=self.admin_user)
+
+        timestamp = now() - timedelta(days=90)
+        Action.objects.filter(
+            pk=Action.objects.first().pk
+        ).update(timestamp=timestamp)
+
+        EventArchive.archive(retention_days=30)
+
+        self.assertEqual(Action.objects.count(), 1)
+
+        name = EventArchive.get_month_start(datetime=timestamp).strftime(
+            EVENT_ARCHIVE_FILENAME_FORMAT
+        )
+
+        with archive_storage.open(name) as file_object:
+            lines = gzip.GzipFile(fileobj=file_object).read().splitlines()
+
+        archive_storage.delete(name)
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(
+            json.loads(lines[0].decode('utf-8'))['verb'],
+            event_document_view.name
+        )
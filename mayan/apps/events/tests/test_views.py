@@ -2,6 +2,9 @@ from __future__ import absolute_import, unicode_literals
 
 from django.contrib.contenttypes.models import ContentType
 
+from actstream.models import Action
+
+from documents.events import event_document_view
 from documents.tests.test_views import GenericDocumentViewTestCase
 
 from ..permissions import permission_events_view
@@ -66,3 +69,24 @@ class EventsViewTestCase(GenericDocumentViewTestCase):
 
         self.assertContains(response, text=document.label, status_code=200)
         self.assertNotContains(response, text='otal: 0', status_code=200)
+
+    def test_events_list_view_keyset_pagination(self):
+        self.login_user()
+
+        self.role.permissions.add(
+            permission_events_view.stored_permission
+        )
+
+        Action.objects.all().delete()
+
+        event_document_view.commit(target=self.document)
+        event_document_view.commit(target=self.document)
+
+        actions = list(Action.objects.order_by('-timestamp', '-pk'))
+
+        response = self.get(
+            viewname='events:events_list', data={'after': actions[0].pk}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['object_list']), actions[1:])
@@ -8,6 +8,7 @@ from django.utils.translation import ugettext_lazy as _
 from actstream.models import Action, any_stream
 
 from acls.models import AccessControlList
+from common.mixins import KeysetPaginationMixin
 from common.utils import encapsulate
 from common.views import SingleObjectListView
 
@@ -16,7 +17,8 @@ from .permissions import permission_events_view
 from .widgets import event_object_link
 
 
-class EventListView(SingleObjectListView):
+class EventListView(KeysetPaginationMixin, SingleObjectListView):
+    keyset_field = 'timestamp'
     view_permission = permission_events_view
 
     def get_extra_context(self):
@@ -73,7 +75,9 @@ class ObjectEventListView(EventListView):
         return any_stream(self.content_object)
 
 
-class VerbEventListView(SingleObjectListView):
+class VerbEventListView(KeysetPaginationMixin, SingleObjectListView):
+    keyset_field = 'timestamp'
+
     def get_extra_context(self):
         return {
             'extra_columns': (
@@ -1,7 +1,5 @@
 from __future__ import unicode_literals
 
-from kombu import Exchange, Queue
-
 from django.apps import apps
 from django.utils.translation import ugettext_lazy as _
 
@@ -13,7 +11,6 @@ from common import (
     menu_tools
 )
 from common.widgets import two_state_template
-from mayan.celery import app
 from navigation import SourceColumn
 
 from .classes import MailerBackend
@@ -88,18 +85,6 @@ class MailerApp(MayanAppConfig):
             )
         )
 
-        app.conf.CELERY_QUEUES.append(
-            Queue('mailing', Exchange('mailing'), routing_key='mailing'),
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'mailer.tasks.task_send_document': {
-                    'queue': 'mailing'
-                },
-            }
-        )
-
         menu_multi_item.bind_links(
             links=(
                 link_send_multiple_document, link_send_multiple_document_link
@@ -1,6 +1,8 @@
 from __future__ import unicode_literals
 
-from kombu import Exchange, Queue
+from datetime import timedelta
+
+from celery.schedules import crontab
 
 from django.utils.translation import ugettext_lazy as _
 
@@ -9,12 +11,13 @@ from common import MayanAppConfig, menu_object, menu_secondary, menu_tools
 
 from navigation import SourceColumn
 
-from .classes import Statistic, StatisticNamespace
+from .classes import Statistic, StatisticCounter, StatisticNamespace
 from .links import (
     link_execute, link_namespace_details, link_namespace_list,
     link_statistics, link_view
 )
 from .licenses import *  # NOQA
+from .literals import COUNTER_UPDATE_INTERVAL
 from .queues import *  # NOQA
 from .tasks import task_execute_statistic  # NOQA - Force registration of task
 
@@ -36,23 +39,22 @@ class StatisticsApp(MayanAppConfig):
             attribute='schedule',
         )
 
-        app.conf.CELERY_QUEUES.extend(
-            (
-                Queue(
-                    'statistics', Exchange('statistics'),
-                    routing_key='statistics', delivery_mode=1
-                ),
-            )
-        )
-
-        app.conf.CELERY_ROUTES.update(
+        app.conf.CELERYBEAT_SCHEDULE.update(
             {
-                'mayan_statistics.tasks.task_execute_statistic': {
-                    'queue': 'statistics'
+                'task_rebuild_counters': {
+                    'task': 'mayan_statistics.tasks.task_rebuild_counters',
+                    'schedule': crontab(minute=0, hour=3),
+                },
+                'task_update_counters': {
+                    'task': 'mayan_statistics.tasks.task_update_counters',
+                    'schedule': timedelta(seconds=COUNTER_UPDATE_INTERVAL),
                 },
             }
         )
 
+        for counter in StatisticCounter.get_all():
+            counter.connect_signals()
+
         menu_object.bind_links(
             links=(link_execute, link_view), sources=(Statistic,)
         )
@@ -1,8 +1,15 @@
 from __future__ import unicode_literals
 
+import datetime
 import json
 
 from django.apps import apps
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Count, F, Max, Sum
+from django.db.models.functions import TruncDate
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
 from django.utils.encoding import force_text, python_2_unicode_compatible
 
 from celery.schedules import crontab
@@ -10,6 +17,248 @@ from celery.schedules import crontab
 from mayan.celery import app
 
 
+@python_2_unicode_compatible
+class StatisticCounter(object):
+    """
+    Count the rows of a model per day of one of its date fields. The
+    counts are stored as one row per day. Updating a counter only recounts
+    the days since the last day counted, and reading a series only sums
+    the stored days, so both are proportional to the number of days
+    instead of the number of rows. Deletions are subtracted as they happen
+    when the date is a field of the model itself, otherwise they are
+    picked up when the counter is rebuilt. Counters over a manager that
+    filters the rows by something a save can change, recount the day of
+    each saved or deleted row instead.
+    """
+    _registry = {}
+
+    @classmethod
+    def get(cls, slug):
+        return cls._registry[slug]
+
+    @classmethod
+    def get_all(cls):
+        return cls._registry.values()
+
+    @staticmethod
+    def get_start_datetime(date):
+        result = datetime.datetime.combine(date, datetime.time.min)
+
+        if timezone.is_naive(result) and timezone.is_aware(timezone.now()):
+            result = timezone.make_aware(result)
+
+        return result
+
+    def __init__(self, slug, label, app_label, model_name, date_field, manager_name='objects', recount_on_save=False):
+        self.slug = slug
+        self.label = label
+        self.app_label = app_label
+        self.model_name = model_name
+        self.date_field = date_field
+        self.manager_name = manager_name
+        self.recount_on_save = recount_on_save
+        self.__class__._registry[slug] = self
+
+    def __str__(self):
+        return force_text(self.label)
+
+    def connect_signals(self):
+        if self.recount_on_save:
+            post_delete.connect(
+                self.handler_recount,
+                dispatch_uid='mayan_statistics_counter_{}'.format(self.slug),
+                sender=self.get_model(), weak=False
+            )
+            post_save.connect(
+                self.handler_recount,
+                dispatch_uid='mayan_statistics_counter_{}'.format(self.slug),
+                sender=self.get_model(), weak=False
+            )
+        elif '__' not in self.date_field:
+            post_delete.connect(
+                self.handler_decrement,
+                dispatch_uid='mayan_statistics_counter_{}'.format(self.slug),
+                sender=self.get_model(), weak=False
+            )
+
+    def count(self, start=None, end=None):
+        """
+        Recount the days from the start date (inclusive) until the end date
+        (exclusive) or all the days when no dates are given.
+        """
+        StatisticCounterValue = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticCounterValue'
+        )
+
+        queryset = self.get_queryset()
+
+        if start:
+            queryset = queryset.filter(
+                **{
+                    '{}__gte'.format(self.date_field): self.get_start_datetime(
+                        date=start
+                    )
+                }
+            )
+
+        if end:
+            queryset = queryset.filter(
+                **{
+                    '{}__lt'.format(self.date_field): self.get_start_datetime(
+                        date=end
+                    )
+                }
+            )
+
+        results = queryset.annotate(
+            day=TruncDate(self.date_field)
+        ).values('day').annotate(total=Count('pk')).order_by()
+
+        counter_values = [
+            StatisticCounterValue(
+                date=result['day'], slug=self.slug, value=result['total']
+            ) for result in results if result['day']
+        ]
+
+        with transaction.atomic():
+            queryset = StatisticCounterValue.objects.filter(slug=self.slug)
+
+            if start:
+                queryset = queryset.filter(date__gte=start)
+
+            if end:
+                queryset = queryset.filter(date__lt=end)
+
+            queryset.delete()
+            StatisticCounterValue.objects.bulk_create(counter_values)
+
+    def get_model(self):
+        return apps.get_model(
+            app_label=self.app_label, model_name=self.model_name
+        )
+
+    def get_monthly_series(self, year, until_month):
+        """
+        Return a list of {month: count} dictionaries with the rows counted
+        during each month of the year.
+        """
+        result = []
+
+        for month in range(1, until_month + 1):
+            result.append(
+                {
+                    month: self.get_total(
+                        start=datetime.date(year, month, 1),
+                        end=self.get_next_month(year=year, month=month)
+                    )
+                }
+            )
+
+        return result
+
+    def get_monthly_totals(self, year, until_month):
+        """
+        Return a list of {month: count} dictionaries with the rows counted
+        until the end of each month of the year.
+        """
+        result = []
+
+        for month in range(1, until_month + 1):
+            result.append(
+                {
+                    month: self.get_total(
+                        end=self.get_next_month(year=year, month=month)
+                    )
+                }
+            )
+
+        return result
+
+    def get_next_month(self, year, month):
+        if month == 12:
+            return datetime.date(year + 1, 1, 1)
+        else:
+            return datetime.date(year, month + 1, 1)
+
+    def get_queryset(self):
+        return getattr(self.get_model(), self.manager_name).all()
+
+    def get_total(self, start=None, end=None):
+        """
+        Return the number of rows counted from the start date (inclusive)
+        until the end date (exclusive).
+        """
+        StatisticCounterValue = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticCounterValue'
+        )
+
+        queryset = StatisticCounterValue.objects.filter(slug=self.slug)
+
+        if start:
+            queryset = queryset.filter(date__gte=start)
+
+        if end:
+            queryset = queryset.filter(date__lt=end)
+
+        return queryset.aggregate(total=Sum('value'))['total'] or 0
+
+    def get_date(self, instance):
+        """
+        Return the day of the date field of a model instance.
+        """
+        try:
+            value = getattr(instance, self.date_field)
+        except ObjectDoesNotExist:
+            return None
+
+        if isinstance(value, datetime.datetime):
+            if timezone.is_aware(value):
+                value = timezone.localtime(value)
+
+            value = value.date()
+
+        return value
+
+    def get_last_date(self):
+        StatisticCounterValue = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticCounterValue'
+        )
+
+        return StatisticCounterValue.objects.filter(
+            slug=self.slug
+        ).aggregate(last_date=Max('date'))['last_date']
+
+    def handler_decrement(self, sender, **kwargs):
+        StatisticCounterValue = apps.get_model(
+            app_label='mayan_statistics', model_name='StatisticCounterValue'
+        )
+
+        value = self.get_date(instance=kwargs['instance'])
+
+        if value:
+            StatisticCounterValue.objects.filter(
+                date=value, slug=self.slug, value__gt=0
+            ).update(value=F('value') - 1)
+
+    def handler_recount(self, sender, **kwargs):
+        value = self.get_date(instance=kwargs['instance'])
+        last_date = self.get_last_date()
+
+        # Days from the last one counted are recounted by the next update
+        if value and last_date and value < last_date:
+            self.count(start=value, end=value + datetime.timedelta(days=1))
+
+    def rebuild(self):
+        self.count()
+
+    def update(self):
+        """
+        Recount from the last day counted, which may have been partial,
+        until today.
+        """
+        self.count(start=self.get_last_date())
+
+
 @python_2_unicode_compatible
 class StatisticNamespace(object):
     _registry = {}
@@ -103,14 +352,6 @@ class Statistic(object):
             }
         )
 
-        app.conf.CELERY_ROUTES.update(
-            {
-                self.get_task_name(): {
-                    'queue': 'statistics'
-                },
-            }
-        )
-
         self.__class__._registry[slug] = self
 
     def __str__(self):
@@ -0,0 +1,3 @@
+from __future__ import unicode_literals
+
+COUNTER_UPDATE_INTERVAL = 10 * 60  # 10 minutes
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mayan_statistics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatisticCounterValue',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                ('slug', models.SlugField(verbose_name='Slug')),
+                ('date', models.DateField(verbose_name='Date')),
+                (
+                    'value', models.PositiveIntegerField(
+                        default=0, verbose_name='Value'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Statistic counter value',
+                'verbose_name_plural': 'Statistic counter values',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='statisticcountervalue',
+            unique_together=set([('slug', 'date')]),
+        ),
+    ]
@@ -30,3 +30,21 @@ class StatisticResult(models.Model):
     class Meta:
         verbose_name = _('Statistics result')
         verbose_name_plural = _('Statistics results')
+
+
+@python_2_unicode_compatible
+class StatisticCounterValue(models.Model):
+    """
+    Number of rows counted by a statistic counter for a single day.
+    """
+    slug = models.SlugField(verbose_name=_('Slug'))
+    date = models.DateField(verbose_name=_('Date'))
+    value = models.PositiveIntegerField(default=0, verbose_name=_('Value'))
+
+    def __str__(self):
+        return '{}: {}'.format(self.slug, self.date)
+
+    class Meta:
+        unique_together = ('slug', 'date')
+        verbose_name = _('Statistic counter value')
+        verbose_name_plural = _('Statistic counter values')
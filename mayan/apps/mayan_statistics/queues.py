@@ -3,12 +3,22 @@ from __future__ import unicode_literals
 from django.utils.translation import ugettext_lazy as _
 
 from task_manager.classes import CeleryQueue
+from task_manager.literals import TASK_CLASS_PERIODIC
 
 queue_statistics = CeleryQueue(
-    name='statistics', label=_('Statistics'), transient=True
+    name='statistics', label=_('Statistics'),
+    task_class=TASK_CLASS_PERIODIC, transient=True
 )
 
 queue_statistics.add_task_type(
     name='mayan_statistics.tasks.task_execute_statistic',
     label=_('Execute statistic')
 )
+queue_statistics.add_task_type(
+    name='mayan_statistics.tasks.task_rebuild_counters',
+    label=_('Rebuild statistic counters')
+)
+queue_statistics.add_task_type(
+    name='mayan_statistics.tasks.task_update_counters',
+    label=_('Update statistic counters')
+)
@@ -4,7 +4,7 @@ import logging
 
 from mayan.celery import app
 
-from .classes import Statistic
+from .classes import Statistic, StatisticCounter
 
 logger = logging.getLogger(__name__)
 
@@ -16,3 +16,15 @@ def task_execute_statistic(slug):
     Statistic.get(slug=slug).execute()
 
     logger.info('Finshed')
+
+
+@app.task(ignore_result=True)
+def task_rebuild_counters():
+    for counter in StatisticCounter.get_all():
+        counter.rebuild()
+
+
+@app.task(ignore_result=True)
+def task_update_counters():
+    for counter in StatisticCounter.get_all():
+        counter.update()
@@ -0,0 +1,84 @@
+from __future__ import unicode_literals
+
+import datetime
+
+from django.test import override_settings
+
+from documents.models import Document
+from documents.statistics import (
+    counter_documents, counter_documents_active, counter_document_pages
+)
+from documents.tests.test_models import GenericDocumentTestCase
+
+from ..models import StatisticCounterValue
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class StatisticCounterTestCase(GenericDocumentTestCase):
+    def test_counter_update(self):
+        counter_documents.update()
+        counter_document_pages.update()
+
+        self.assertEqual(counter_documents.get_total(), 1)
+        self.assertEqual(
+            counter_document_pages.get_total(),
+            self.document.latest_version.pages.count()
+        )
+
+    def test_counter_update_is_incremental(self):
+        counter_documents.update()
+
+        StatisticCounterValue.objects.create(
+            date=datetime.date(2000, 1, 1), slug=counter_documents.slug,
+            value=5
+        )
+
+        counter_documents.update()
+
+        # Only the days since the last one counted are recounted
+        self.assertEqual(counter_documents.get_total(), 6)
+
+        counter_documents.rebuild()
+
+        self.assertEqual(counter_documents.get_total(), 1)
+
+    def test_counter_document_delete(self):
+        counter_documents.update()
+
+        self.document.delete(to_trash=False)
+
+        self.assertEqual(counter_documents.get_total(), 0)
+
+    def test_counter_monthly_series(self):
+        counter_documents.update()
+
+        today = datetime.date.today()
+
+        self.assertEqual(
+            counter_documents.get_monthly_series(
+                year=today.year, until_month=today.month
+            )[-1], {today.month: 1}
+        )
+
+    def test_counter_active_documents_trash(self):
+        # Move the document to a day that is no longer recounted by the
+        # updates
+        Document.passthrough.filter(pk=self.document.pk).update(
+            date_added=self.document.date_added - datetime.timedelta(days=2)
+        )
+        self.document.refresh_from_db()
+        counter_documents.rebuild()
+        counter_documents_active.rebuild()
+        StatisticCounterValue.objects.create(
+            date=datetime.date.today(), slug=counter_documents_active.slug,
+            value=0
+        )
+
+        self.document.delete()
+
+        self.assertEqual(counter_documents.get_total(), 1)
+        self.assertEqual(counter_documents_active.get_total(), 0)
+
+        self.document.restore()
+
+        self.assertEqual(counter_documents_active.get_total(), 1)
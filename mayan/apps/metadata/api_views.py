@@ -1,18 +1,25 @@
 from __future__ import absolute_import, unicode_literals
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
 from django.shortcuts import get_object_or_404
+from django.utils.encoding import force_text
+from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
 from acls.models import AccessControlList
 from documents.models import Document, DocumentType
 from documents.permissions import (
     permission_document_type_view, permission_document_type_edit
 )
+from document_indexing.tasks import task_index_document
 from rest_api.filters import MayanObjectPermissionsFilter
 from rest_api.permissions import MayanPermission
 
-from .models import MetadataType
+from .models import DocumentMetadata, DocumentTypeMetadataType, MetadataType
 from .permissions import (
     permission_metadata_document_add, permission_metadata_document_remove,
     permission_metadata_document_edit, permission_metadata_document_view,
@@ -20,7 +27,7 @@ from .permissions import (
     permission_metadata_type_edit, permission_metadata_type_view
 )
 from .serializers import (
-    DocumentMetadataSerializer, DocumentTypeMetadataTypeSerializer,
+    DocumentMetadataBulkSerializer, DocumentMetadataSerializer, DocumentTypeMetadataTypeSerializer,
     MetadataTypeSerializer, NewDocumentMetadataSerializer,
     NewDocumentTypeMetadataTypeSerializer,
     WritableDocumentTypeMetadataTypeSerializer
@@ -81,6 +88,175 @@ class APIDocumentMetadataListView(generics.ListCreateAPIView):
         return super(APIDocumentMetadataListView, self).post(*args, **kwargs)
 
 
+class APIDocumentMetadataBulkView(generics.GenericAPIView):
+    permission_classes = (IsAuthenticated,)
+    serializer_class = DocumentMetadataBulkSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs['many'] = True
+        return super(APIDocumentMetadataBulkView, self).get_serializer(
+            *args, **kwargs
+        )
+
+    def perform_bulk_save(self, items):
+        """
+        Validate all the items against a single fetch of the documents,
+        metadata types and existing document metadata involved, then write
+        the valid ones with one bulk insert and one update per distinct
+        value. Signals are not fired per item; instead every affected
+        document is queued for indexing once.
+        """
+        documents = Document.objects.select_related('document_type').in_bulk(
+            set([item['document_pk'] for item in items])
+        )
+        metadata_types = MetadataType.objects.in_bulk(
+            set([item['metadata_type_pk'] for item in items])
+        )
+
+        documents_add = AccessControlList.objects.check_access_bulk(
+            permissions=permission_metadata_document_add,
+            user=self.request.user, objects=documents.values()
+        )
+        documents_edit = AccessControlList.objects.check_access_bulk(
+            permissions=permission_metadata_document_edit,
+            user=self.request.user, objects=documents.values()
+        )
+
+        valid_pairs = set(
+            DocumentTypeMetadataType.objects.filter(
+                document_type__in=set(
+                    [
+                        document.document_type_id for document in
+                        documents.values()
+                    ]
+                ), metadata_type__in=metadata_types.keys()
+            ).values_list('document_type', 'metadata_type')
+        )
+
+        queryset = DocumentMetadata.objects.filter(
+            document__in=documents.keys(),
+            metadata_type__in=metadata_types.keys()
+        )
+
+        existing = {}
+        for document_metadata in queryset:
+            key = (
+                document_metadata.document_id,
+                document_metadata.metadata_type_id
+            )
+            existing[key] = document_metadata
+
+        results = []
+        to_create = {}
+        to_update = {}
+
+        for item in items:
+            result = {
+                'document_pk': item['document_pk'],
+                'metadata_type_pk': item['metadata_type_pk']
+            }
+            results.append(result)
+
+            document = documents.get(item['document_pk'])
+            metadata_type = metadata_types.get(item['metadata_type_pk'])
+
+            if not document:
+                result['error'] = _('Document not found.')
+                continue
+
+            if not metadata_type:
+                result['error'] = _('Metadata type not found.')
+                continue
+
+            if (document.document_type_id, metadata_type.pk) not in valid_pairs:
+                result['error'] = _(
+                    'Metadata type is not valid for this document type.'
+                )
+                continue
+
+            key = (document.pk, metadata_type.pk)
+            # A repeated item edits the entry created by a previous one
+            document_metadata = existing.get(key) or to_create.get(key)
+
+            if document_metadata:
+                allowed = document in documents_edit
+            else:
+                allowed = document in documents_add
+
+            if not allowed:
+                result['error'] = _('Insufficient access.')
+                continue
+
+            try:
+                value = metadata_type.validate_value(
+                    document_type=document.document_type,
+                    value=item.get('value')
+                )
+            except DjangoValidationError as exception:
+                result['error'] = ' '.join(exception.messages)
+                continue
+
+            result['value'] = value
+
+            if document_metadata:
+                document_metadata.value = value
+                if key not in to_create:
+                    to_update[key] = document_metadata
+                result['status'] = 'updated'
+            else:
+                to_create[key] = DocumentMetadata(
+                    document=document, metadata_type=metadata_type,
+                    value=value
+                )
+                result['status'] = 'created'
+
+        updates = {}
+        for document_metadata in to_update.values():
+            updates.setdefault(document_metadata.value, []).append(
+                document_metadata.pk
+            )
+
+        with transaction.atomic():
+            DocumentMetadata.objects.bulk_create(to_create.values())
+
+            for value, pk_list in updates.items():
+                DocumentMetadata.objects.filter(pk__in=pk_list).update(
+                    value=value
+                )
+
+        for result in results:
+            if 'error' in result:
+                result['status'] = 'error'
+                result['error'] = force_text(result['error'])
+
+        affected_documents = set(
+            [key[0] for key in to_create]
+        ) | set(
+            [key[0] for key in to_update]
+        )
+
+        for document_pk in sorted(affected_documents):
+            task_index_document.apply_async(
+                kwargs=dict(document_id=document_pk)
+            )
+
+        return results
+
+    def post(self, request, *args, **kwargs):
+        """
+        Add or edit the metadata of several documents in a single request.
+        Accepts a list of document, metadata type and value entries and
+        returns the outcome of each entry in the same order.
+        """
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(
+            self.perform_bulk_save(items=serializer.validated_data)
+        )
+
+
 class APIDocumentMetadataView(generics.RetrieveUpdateDestroyAPIView):
     lookup_url_kwarg = 'metadata_pk'
 
@@ -2,8 +2,6 @@ from __future__ import unicode_literals
 
 import logging
 
-from kombu import Exchange, Queue
-
 from django.apps import apps
 from django.db.models.signals import post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
@@ -18,7 +16,6 @@ from common.widgets import two_state_template
 from documents.search import document_page_search, document_search
 from documents.signals import post_document_type_change
 from documents.permissions import permission_document_view
-from mayan.celery import app
 from navigation import SourceColumn
 from rest_api.classes import APIEndPoint
 
@@ -54,6 +51,7 @@ class MetadataApp(MayanAppConfig):
 
     def ready(self):
         super(MetadataApp, self).ready()
+        from documents.serializers import DocumentSerializer
 
         Document = apps.get_model(
             app_label='documents', model_name='Document'
@@ -72,6 +70,24 @@ class MetadataApp(MayanAppConfig):
 
         APIEndPoint(app=self, version_string='2')
 
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        DocumentSerializer.add_expandable_field(
+            name='metadata', many=True, prefetch_lookup='metadata',
+            prefetch_queryset=lambda request: DocumentMetadata.objects.filter(
+                document__in=AccessControlList.objects.filter_by_access(
+                    permission_metadata_document_view, request.user,
+                    queryset=Document.objects.all()
+                )
+            ).select_related('metadata_type'),
+            serializer_class='metadata.serializers.DocumentMetadataSerializer',
+            serializer_kwargs={
+                'fields': ('id', 'metadata_type', 'url', 'value')
+            }
+        )
+
         Document.add_to_class(
             'metadata_value_of', DocumentMetadataHelper.constructor
         )
@@ -165,21 +181,6 @@ class MetadataApp(MayanAppConfig):
             )
         )
 
-        app.conf.CELERY_QUEUES.append(
-            Queue('metadata', Exchange('metadata'), routing_key='metadata'),
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'metadata.tasks.task_remove_metadata_type': {
-                    'queue': 'metadata'
-                },
-                'metadata.tasks.task_add_required_metadata_type': {
-                    'queue': 'metadata'
-                },
-            }
-        )
-
         document_search.add_model_field(
             field='metadata__metadata_type__name', label=_('Metadata type')
         )
@@ -8,11 +8,12 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.reverse import reverse
 
 from documents.serializers import DocumentSerializer, DocumentTypeSerializer
+from rest_api.mixins import DynamicFieldsSerializerMixin
 
 from .models import DocumentMetadata, DocumentTypeMetadataType, MetadataType
 
 
-class MetadataTypeSerializer(serializers.HyperlinkedModelSerializer):
+class MetadataTypeSerializer(DynamicFieldsSerializerMixin, serializers.HyperlinkedModelSerializer):
     class Meta:
         extra_kwargs = {
             'url': {
@@ -96,7 +97,7 @@ class WritableDocumentTypeMetadataTypeSerializer(serializers.ModelSerializer):
         )
 
 
-class DocumentMetadataSerializer(serializers.HyperlinkedModelSerializer):
+class DocumentMetadataSerializer(DynamicFieldsSerializerMixin, serializers.HyperlinkedModelSerializer):
     document = DocumentSerializer(read_only=True)
     metadata_type = MetadataTypeSerializer(read_only=True)
     url = serializers.SerializerMethodField()
@@ -157,3 +158,18 @@ class NewDocumentMetadataSerializer(serializers.ModelSerializer):
             raise ValidationError(exception)
 
         return attrs
+
+
+class DocumentMetadataBulkSerializer(serializers.Serializer):
+    document_pk = serializers.IntegerField(
+        help_text=_('Primary key of the document to be edited.')
+    )
+    metadata_type_pk = serializers.IntegerField(
+        help_text=_(
+            'Primary key of the metadata type to be added to or edited on '
+            'the document.'
+        )
+    )
+    value = serializers.CharField(
+        allow_blank=True, allow_null=True, max_length=255, required=False
+    )
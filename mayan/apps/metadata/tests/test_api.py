@@ -311,6 +311,88 @@ class DocumentMetadataAPITestCase(BaseAPITestCase):
             metadata_type=self.metadata_type, value=TEST_METADATA_VALUE
         )
 
+    def test_document_metadata_bulk_view(self):
+        with open(TEST_SMALL_DOCUMENT_PATH) as file_object:
+            document_2 = self.document_type.new_document(
+                file_object=file_object,
+            )
+
+        self._create_document_metadata()
+
+        response = self.client.post(
+            reverse('rest_api:documentmetadata-bulk'), data=[
+                {
+                    'document_pk': self.document.pk,
+                    'metadata_type_pk': self.metadata_type.pk,
+                    'value': TEST_METADATA_VALUE_EDITED
+                },
+                {
+                    'document_pk': document_2.pk,
+                    'metadata_type_pk': self.metadata_type.pk,
+                    'value': TEST_METADATA_VALUE
+                },
+                {
+                    'document_pk': document_2.pk,
+                    'metadata_type_pk': self.metadata_type.pk + 1,
+                    'value': TEST_METADATA_VALUE
+                }
+            ], format='json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in response.data],
+            ['updated', 'created', 'error']
+        )
+
+        self.assertEqual(
+            self.document.metadata.get().value, TEST_METADATA_VALUE_EDITED
+        )
+        self.assertEqual(
+            document_2.metadata.get().value, TEST_METADATA_VALUE
+        )
+
+    def test_document_metadata_bulk_view_duplicate_items(self):
+        response = self.client.post(
+            reverse('rest_api:documentmetadata-bulk'), data=[
+                {
+                    'document_pk': self.document.pk,
+                    'metadata_type_pk': self.metadata_type.pk,
+                    'value': TEST_METADATA_VALUE
+                },
+                {
+                    'document_pk': self.document.pk,
+                    'metadata_type_pk': self.metadata_type.pk,
+                    'value': TEST_METADATA_VALUE_EDITED
+                }
+            ], format='json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in response.data],
+            ['created', 'updated']
+        )
+        self.assertEqual(
+            self.document.metadata.get().value, TEST_METADATA_VALUE_EDITED
+        )
+
+    def test_document_metadata_bulk_view_anonymous(self):
+        self.client.logout()
+
+        response = self.client.post(
+            reverse('rest_api:documentmetadata-bulk'), data=[
+                {
+                    'document_pk': self.document.pk,
+                    'metadata_type_pk': self.metadata_type.pk,
+                    'value': TEST_METADATA_VALUE
+                }
+            ], format='json'
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.document.metadata.count(), 0)
+
     def test_document_metadata_create_view(self):
         response = self.client.post(
             reverse(
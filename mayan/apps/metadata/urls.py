@@ -3,9 +3,10 @@ from __future__ import unicode_literals
 from django.conf.urls import url
 
 from .api_views import (
-    APIDocumentMetadataListView, APIDocumentMetadataView,
-    APIDocumentTypeMetadataTypeListView, APIDocumentTypeMetadataTypeView,
-    APIMetadataTypeListView, APIMetadataTypeView
+    APIDocumentMetadataBulkView, APIDocumentMetadataListView,
+    APIDocumentMetadataView, APIDocumentTypeMetadataTypeListView,
+    APIDocumentTypeMetadataTypeView, APIMetadataTypeListView,
+    APIMetadataTypeView
 )
 from .views import (
     DocumentMetadataAddView, DocumentMetadataEditView,
@@ -92,6 +93,10 @@ api_urls = [
         APIDocumentTypeMetadataTypeView.as_view(),
         name='documenttypemetadatatype-detail'
     ),
+    url(
+        r'^documents/metadata/bulk/$', APIDocumentMetadataBulkView.as_view(),
+        name='documentmetadata-bulk'
+    ),
     url(
         r'^documents/(?P<document_pk>\d+)/metadata/$',
         APIDocumentMetadataListView.as_view(), name='documentmetadata-list'
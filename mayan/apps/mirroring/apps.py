@@ -1,9 +1,55 @@
 from __future__ import unicode_literals
 
 from django import apps
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
 
+from common import MayanAppConfig
 
-class MirroringApp(apps.AppConfig):
+from .handlers import handler_index_changed
+
+
+class MirroringApp(MayanAppConfig):
+    app_url = 'mirroring'
+    has_tests = True
     name = 'mirroring'
     verbose_name = _('Mirroring')
+
+    def ready(self):
+        super(MirroringApp, self).ready()
+
+        # WebDAV clients authenticate on each request instead of logging in
+        settings.STRONGHOLD_PUBLIC_URLS += (
+            r'^/%s/webdav/.+$' % self.app_url,
+        )
+
+        Document = apps.apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        DocumentVersion = apps.apps.get_model(
+            app_label='documents', model_name='DocumentVersion'
+        )
+        IndexInstanceNode = apps.apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+
+        # Changes that alter the paths, sizes or times of a mounted index
+        for model in (Document, DocumentVersion, IndexInstanceNode):
+            dispatch_uid = 'mirroring_handler_index_changed_{}'.format(
+                model._meta.model_name
+            )
+            post_delete.connect(
+                handler_index_changed,
+                dispatch_uid='{}_delete'.format(dispatch_uid), sender=model
+            )
+            post_save.connect(
+                handler_index_changed,
+                dispatch_uid='{}_save'.format(dispatch_uid), sender=model
+            )
+
+        m2m_changed.connect(
+            handler_index_changed,
+            dispatch_uid='mirroring_handler_index_changed_documents',
+            sender=IndexInstanceNode.documents.through
+        )
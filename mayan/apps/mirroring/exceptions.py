@@ -0,0 +1,8 @@
+from __future__ import unicode_literals
+
+
+class RangeNotSatisfiable(Exception):
+    """
+    Raised when the byte range requested is outside of the file
+    """
+    pass
@@ -0,0 +1,15 @@
+from __future__ import unicode_literals
+
+import uuid
+
+from django.core.cache import cache
+
+from .literals import INDEX_VERSION_CACHE_KEY
+
+
+def handler_index_changed(sender, **kwargs):
+    """
+    Change the index version token, mounted indexes compare it to decide
+    when to reload their tree.
+    """
+    cache.set(INDEX_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
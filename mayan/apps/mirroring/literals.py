@@ -1,3 +1,8 @@
+BLOCK_CACHE_SIZE = 512  # Blocks, 64 MB
+BLOCK_SIZE = 128 * 1024
+INDEX_MAX_AGE = 60 * 5  # 5 minutes
+INDEX_VERSION_CACHE_KEY = 'mirroring_index_version'
 MAX_FILE_DESCRIPTOR = 65535
 MIN_FILE_DESCRIPTOR = 0
 FILE_MODE = DIRECTORY_MODE = 0o555
+WEBDAV_REALM = 'Mayan EDMS'
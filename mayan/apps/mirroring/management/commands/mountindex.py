@@ -1,121 +1,226 @@
 from __future__ import unicode_literals
 from __future__ import print_function
 
-import datetime
+from collections import Counter, OrderedDict
 from errno import ENOENT
+from functools import wraps
 import logging
+import posixpath
 from stat import S_IFDIR, S_IFREG
+import threading
 from time import time
 
 from fuse import FUSE, FuseOSError, Operations
 
 from django.core import management
-from django.core.cache import caches
-from django.core.exceptions import MultipleObjectsReturned
+from django.core.cache import cache
 from django.core.management.base import CommandError
-from django.db.models import Count
+from django.db import connection
+from django.utils.encoding import force_text
 
 from document_indexing.models import Index, IndexInstanceNode
-from documents.models import Document
+from documents.models import DocumentVersion
 
 from ...literals import (
-    MAX_FILE_DESCRIPTOR, MIN_FILE_DESCRIPTOR, FILE_MODE, DIRECTORY_MODE
-)
-from ...settings import (
-    setting_document_lookup_cache_timeout, setting_node_lookup_cache_timeout
+    BLOCK_CACHE_SIZE, BLOCK_SIZE, DIRECTORY_MODE, FILE_MODE, INDEX_MAX_AGE,
+    INDEX_VERSION_CACHE_KEY, MAX_FILE_DESCRIPTOR, MIN_FILE_DESCRIPTOR
 )
+from ...settings import setting_refresh_interval
+from ...utils import get_timestamp
 
 logger = logging.getLogger(__name__)
 
 
+def database_access(function):
+    """
+    FUSE calls the operations from threads Django doesn't manage, close
+    the connection of the thread after using the database so connections
+    are not leaked.
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            return function(*args, **kwargs)
+        finally:
+            connection.close()
+
+    return wrapper
+
+
+class IndexTree(object):
+    """
+    In memory copy of the paths of an index. Directories map to the names
+    of their entries, files map to the stored size and times of the latest
+    version of their document.
+    """
+    def __init__(self, directories, files, version):
+        self.directories = directories
+        self.files = files
+        self.time = time()
+        self.version = version
+
+
+class OpenFile(object):
+    def __init__(self, document_version_id, file_object):
+        self.document_version_id = document_version_id
+        self.file_object = file_object
+        self.lock = threading.Lock()
+
+
 class IndexFS(Operations):
+    def _get_block(self, open_file, block_index):
+        key = (open_file.document_version_id, block_index)
+
+        with self.block_cache_lock:
+            block = self.block_cache.pop(key, None)
+            if block is not None:
+                # Reinsert to mark as the most recently used
+                self.block_cache[key] = block
+                return block
+
+        with open_file.lock:
+            open_file.file_object.seek(block_index * BLOCK_SIZE)
+            block = open_file.file_object.read(BLOCK_SIZE)
+
+        with self.block_cache_lock:
+            self.block_cache[key] = block
+            while len(self.block_cache) > BLOCK_CACHE_SIZE:
+                self.block_cache.popitem(last=False)
+
+        return block
+
     def _get_next_file_descriptor(self):
         while(True):
             self.file_descriptor_count += 1
             if self.file_descriptor_count > MAX_FILE_DESCRIPTOR:
                 self.file_descriptor_count = MIN_FILE_DESCRIPTOR
 
-            try:
-                if not self.file_descriptors[self.file_descriptor_count]:
-                    return self.file_descriptor_count
-            except KeyError:
+            if self.file_descriptor_count not in self.file_descriptors:
                 return self.file_descriptor_count
 
-    def _path_to_node(self, path, access_only=False, directory_only=True):
-        logger.debug('path: %s', path)
-        logger.debug('directory_only: %s', directory_only)
-
-        parts = path.split('/')
-
-        logger.debug('parts: %s', parts)
-
-        node = self.index.instance_root
-
-        if len(parts) > 1 and parts[1] != '':
-            obj = self.cache.get(path)
-
-            if obj:
-                node_pk = obj.get('node_pk')
-                if node_pk:
-                    if access_only:
-                        return True
-                    else:
-                        return IndexInstanceNode.objects.get(pk=node_pk)
-
-                document_pk = obj.get('document_pk')
-                if document_pk:
-                    if access_only:
-                        return True
-                    else:
-                        return Document.objects.get(pk=document_pk)
-
-            for count, part in enumerate(parts[1:]):
-                try:
-                    node = node.children.get(value=part)
-                except IndexInstanceNode.DoesNotExist:
-                    logger.debug('%s does not exists', part)
-
-                    if directory_only:
-                        return None
-                    else:
-                        try:
-                            if node.index_template_node.link_documents:
-                                result = node.documents.get(label=part)
-                                logger.debug(
-                                    'path %s is a valid file path', path
-                                )
-                                self.cache.set(
-                                    path, {'document_pk': result.pk},
-                                    setting_document_lookup_cache_timeout.value
-                                )
-
-                                return result
-                            else:
-                                return None
-                        except Document.DoesNotExist:
-                            logger.debug(
-                                'path %s is a file, but is not found', path
-                            )
-                            return None
-                        except MultipleObjectsReturned:
-                            return None
-                except MultipleObjectsReturned:
-                    return None
-
-            self.cache.set(
-                path, {'node_pk': node.pk},
-                setting_node_lookup_cache_timeout.value
+    def _get_tree(self):
+        """
+        Return the current tree, reloading it when the index version token
+        changed. Only one thread reloads, the others keep using the current
+        tree meanwhile.
+        """
+        now = time()
+
+        if now >= self.next_check and self.tree_lock.acquire(False):
+            try:
+                version = cache.get(INDEX_VERSION_CACHE_KEY)
+
+                if version != self.tree.version or now - self.tree.time > INDEX_MAX_AGE:
+                    self.tree = self._load_tree(version=version)
+
+                self.next_check = now + setting_refresh_interval.value
+            finally:
+                self.tree_lock.release()
+
+        return self.tree
+
+    @database_access
+    def _load_tree(self, version):
+        logger.debug('loading index: %s', self.index)
+
+        root = self.index.instance_root
+
+        children = {}
+        queryset = IndexInstanceNode.objects.filter(
+            tree_id=root.tree_id
+        ).values_list(
+            'pk', 'parent_id', 'value', 'index_template_node__link_documents'
+        )
+
+        for pk, parent_id, value, link_documents in queryset.iterator():
+            children.setdefault(parent_id, []).append(
+                (pk, value, link_documents)
+            )
+
+        documents = {}
+        queryset = IndexInstanceNode.documents.through.objects.filter(
+            document__in_trash=False, document__is_stub=False,
+            indexinstancenode__tree_id=root.tree_id
+        ).values_list(
+            'indexinstancenode_id', 'document_id', 'document__label',
+            'document__date_added'
+        )
+
+        for node_id, document_id, label, date_added in queryset.iterator():
+            documents.setdefault(node_id, []).append(
+                (document_id, label, date_added)
             )
 
-        logger.debug('node: %s', node)
-        logger.debug('node is root: %s', node.is_root_node())
+        latest_versions = {}
+        queryset = DocumentVersion.objects.filter(
+            document__index_instance_nodes__tree_id=root.tree_id
+        ).order_by('document_id', 'timestamp', 'pk').values_list(
+            'document_id', 'pk', 'size', 'timestamp'
+        ).distinct()
+
+        for document_id, pk, size, timestamp in queryset.iterator():
+            latest_versions[document_id] = (pk, size, timestamp)
+
+        directories = {'/': []}
+        files = {}
+        pending = [(root.pk, '/', root.index_template_node.link_documents)]
+
+        while pending:
+            node_id, path, link_documents = pending.pop()
+            node_count = len(children.get(node_id, ()))
+
+            entries = [
+                (value, pk, link) for pk, value, link in children.get(node_id, ())
+            ]
+            if link_documents:
+                entries.extend(
+                    [
+                        (label, document_id, date_added)
+                        for document_id, label, date_added in documents.get(node_id, ())
+                        if document_id in latest_versions
+                    ]
+                )
 
-        return node
+            # Names that can't be represented as unique paths are not shown
+            counts = Counter([entry[0] for entry in entries])
+
+            for index, (name, pk, extra) in enumerate(entries):
+                if '/' in name or counts[name] > 1:
+                    continue
+
+                entry_path = posixpath.join(path, name)
+                directories[path].append(name)
+
+                if index < node_count:
+                    # Index node, extra is the link documents flag
+                    directories[entry_path] = []
+                    pending.append((pk, entry_path, extra))
+                else:
+                    # Document, extra is the date added
+                    version_id, size, timestamp = latest_versions[pk]
+                    files[entry_path] = {
+                        'ctime': get_timestamp(extra),
+                        'document_version_id': version_id,
+                        'mtime': get_timestamp(timestamp),
+                        'size': size or 0,
+                    }
+
+        logger.debug(
+            'index loaded: %s, %d directories, %d files', self.index,
+            len(directories), len(files)
+        )
 
+        return IndexTree(directories=directories, files=files, version=version)
+
+    @database_access
     def __init__(self, index_slug):
+        self.block_cache = OrderedDict()
+        self.block_cache_lock = threading.Lock()
         self.file_descriptor_count = MIN_FILE_DESCRIPTOR
         self.file_descriptors = {}
-        self.cache = caches['default']
+        self.file_descriptors_lock = threading.Lock()
+        self.next_check = time() + setting_refresh_interval.value
+        self.tree_lock = threading.Lock()
 
         try:
             self.index = Index.objects.get(slug=index_slug)
@@ -123,92 +228,103 @@ class IndexFS(Operations):
             print('Unknown index slug: {}.'.format(index_slug))
             exit(1)
 
+        self.tree = self._load_tree(version=cache.get(INDEX_VERSION_CACHE_KEY))
+
     def access(self, path, fh=None):
-        result = self._path_to_node(
-            path=path, access_only=True, directory_only=False
-        )
+        tree = self._get_tree()
+        path = force_text(path)
 
-        if not result:
+        if path not in tree.directories and path not in tree.files:
             raise FuseOSError(ENOENT)
 
     def getattr(self, path, fh=None):
         logger.debug('path: %s, fh: %s', path, fh)
 
-        now = time()
-        result = self._path_to_node(path=path, directory_only=False)
-
-        if not result:
-            raise FuseOSError(ENOENT)
+        tree = self._get_tree()
+        path = force_text(path)
 
-        if isinstance(result, IndexInstanceNode):
-            return {
-                'st_mode': (S_IFDIR | DIRECTORY_MODE), 'st_ctime': now,
-                'st_mtime': now, 'st_atime': now, 'st_nlink': 2
-            }
-        else:
+        if path in tree.directories:
             return {
-                'st_mode': (S_IFREG | FILE_MODE),
-                'st_ctime': (
-                    result.date_added.replace(tzinfo=None) - result.date_added.utcoffset() - datetime.datetime(1970, 1, 1)
-                ).total_seconds(),
-                'st_mtime': (
-                    result.latest_version.timestamp.replace(tzinfo=None) - result.latest_version.timestamp.utcoffset() - datetime.datetime(1970, 1, 1)
-                ).total_seconds(),
-                'st_atime': now,
-                'st_size': result.size
+                'st_mode': (S_IFDIR | DIRECTORY_MODE), 'st_ctime': tree.time,
+                'st_mtime': tree.time, 'st_atime': tree.time, 'st_nlink': 2
             }
 
+        try:
+            entry = tree.files[path]
+        except KeyError:
+            raise FuseOSError(ENOENT)
+
+        return {
+            'st_mode': (S_IFREG | FILE_MODE), 'st_ctime': entry['ctime'],
+            'st_mtime': entry['mtime'], 'st_atime': time(),
+            'st_size': entry['size']
+        }
+
+    @database_access
     def open(self, path, flags):
-        result = self._path_to_node(path=path, directory_only=False)
+        try:
+            entry = self._get_tree().files[force_text(path)]
+        except KeyError:
+            raise FuseOSError(ENOENT)
 
-        if isinstance(result, Document):
-            next_file_descriptor = self._get_next_file_descriptor()
-            self.file_descriptors[next_file_descriptor] = result.open()
-            return next_file_descriptor
-        else:
+        try:
+            document_version = DocumentVersion.objects.get(
+                pk=entry['document_version_id']
+            )
+        except DocumentVersion.DoesNotExist:
             raise FuseOSError(ENOENT)
 
-    def release(self, path, fh):
-        self.file_descriptors[fh] = None
-        del(self.file_descriptors[fh])
+        open_file = OpenFile(
+            document_version_id=document_version.pk,
+            file_object=document_version.open()
+        )
 
-    def read(self, path, size, offset, fh):
-        self.file_descriptors[fh].seek(offset)
-        return self.file_descriptors[fh].read(size)
+        with self.file_descriptors_lock:
+            file_descriptor = self._get_next_file_descriptor()
+            self.file_descriptors[file_descriptor] = open_file
 
-    def readdir(self, path, fh):
-        logger.debug('path: %s', path)
+        return file_descriptor
 
-        node = self._path_to_node(path=path, directory_only=True)
+    def read(self, path, size, offset, fh):
+        open_file = self.file_descriptors[fh]
+        position = offset
+        end = offset + size
+        result = []
+
+        while position < end:
+            block_index, block_offset = divmod(position, BLOCK_SIZE)
+            block = self._get_block(
+                open_file=open_file, block_index=block_index
+            )
+            data = block[block_offset:block_offset + end - position]
 
-        if not node:
-            raise FuseOSError(ENOENT)
+            if not data:
+                break
 
-        yield '.'
-        yield '..'
+            result.append(data)
+            position += len(data)
 
-        # Nodes
-        queryset = node.get_children().values('value').exclude(
-            value__contains='/'
-        )
+            if len(block) < BLOCK_SIZE:
+                # Last block of the file
+                break
 
-        for duplicate in queryset.order_by().annotate(count_id=Count('id')).filter(count_id__gt=1):
-            queryset = queryset.exclude(label=duplicate['label'])
+        return b''.join(result)
 
-        for child_node in queryset.values_list('value', flat=True):
-            yield child_node
+    def readdir(self, path, fh):
+        logger.debug('path: %s', path)
 
-        # Documents
-        if node.index_template_node.link_documents:
-            queryset = node.documents.values('label').exclude(
-                label__contains='/'
-            )
+        try:
+            names = self._get_tree().directories[force_text(path)]
+        except KeyError:
+            raise FuseOSError(ENOENT)
 
-            for duplicate in queryset.order_by().annotate(count_id=Count('id')).filter(count_id__gt=1):
-                queryset = queryset.exclude(label=duplicate['label'])
+        return ['.', '..'] + names
+
+    def release(self, path, fh):
+        with self.file_descriptors_lock:
+            open_file = self.file_descriptors.pop(fh)
 
-            for document_label in queryset.values_list('label', flat=True):
-                yield document_label
+        open_file.file_object.close()
 
 
 class Command(management.BaseCommand):
@@ -237,8 +353,8 @@ class Command(management.BaseCommand):
         try:
             FUSE(
                 operations=IndexFS(index_slug=options['slug']),
-                mountpoint=options['mount_point'], nothreads=True, foreground=True,
-                allow_other=options['allow_other'],
+                mountpoint=options['mount_point'], nothreads=False,
+                foreground=True, allow_other=options['allow_other'],
                 allow_root=options['allow_root']
             )
         except RuntimeError:
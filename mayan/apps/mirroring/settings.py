@@ -6,11 +6,10 @@ from smart_settings import Namespace
 
 namespace = Namespace(name='mirroring', label=_('Mirroring'))
 
-setting_document_lookup_cache_timeout = namespace.add_setting(
-    global_name='MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT', default=10,
-    help_text=_('Time in seconds to cache the path lookup to a document.'),
-)
-setting_node_lookup_cache_timeout = namespace.add_setting(
-    global_name='MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT', default=10,
-    help_text=_('Time in seconds to cache the path lookup to an index node.'),
+setting_refresh_interval = namespace.add_setting(
+    global_name='MIRRORING_REFRESH_INTERVAL', default=10,
+    help_text=_(
+        'Time in seconds between checks for changes to the indexes. The '
+        'mounted index is reloaded when a change is found.'
+    ),
 )
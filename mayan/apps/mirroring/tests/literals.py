@@ -0,0 +1,5 @@
+from __future__ import unicode_literals
+
+TEST_INDEX_LABEL = 'test label'
+TEST_INDEX_SLUG = 'test_slug'
+TEST_NODE_EXPRESSION = 'test_node'
@@ -0,0 +1,184 @@
+from __future__ import unicode_literals
+
+import mock
+
+from django.test import override_settings
+
+from document_indexing.models import Index
+from documents.models import Document
+from documents.tests.literals import TEST_SMALL_DOCUMENT_PATH
+from documents.tests.test_models import GenericDocumentTestCase
+
+from ..management.commands.mountindex import IndexFS
+
+from .literals import TEST_INDEX_LABEL, TEST_INDEX_SLUG, TEST_NODE_EXPRESSION
+
+TEST_BLOCK_SIZE = 16
+TEST_DOCUMENT_LABEL_SLASH = 'test/label'
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class IndexFSTestCase(GenericDocumentTestCase):
+    def setUp(self):
+        super(IndexFSTestCase, self).setUp()
+        self.index = Index.objects.create(
+            label=TEST_INDEX_LABEL, slug=TEST_INDEX_SLUG
+        )
+        self.index.document_types.add(self.document_type)
+        self.index.node_templates.create(
+            parent=self.index.template_root, expression=TEST_NODE_EXPRESSION,
+            link_documents=True
+        )
+        self.index.rebuild()
+
+        # The operations close the connection of their thread, which would
+        # close the connection of the test transaction.
+        patcher = mock.patch(
+            'mirroring.management.commands.mountindex.connection'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_document_path(self, label):
+        return '/{}/{}'.format(TEST_NODE_EXPRESSION, label)
+
+    def _get_index_fs(self):
+        self.index.rebuild()
+        return IndexFS(index_slug=TEST_INDEX_SLUG)
+
+    def _upload_document(self, label):
+        with open(TEST_SMALL_DOCUMENT_PATH) as file_object:
+            return self.document_type.new_document(
+                file_object=file_object, label=label
+            )
+
+    def _read_document(self):
+        file_object = self.document.latest_version.open()
+        content = file_object.read()
+        file_object.close()
+
+        return content
+
+    def test_tree_document(self):
+        tree = self._get_index_fs().tree
+
+        self.assertEqual(tree.directories['/'], [TEST_NODE_EXPRESSION])
+        self.assertEqual(
+            tree.directories['/{}'.format(TEST_NODE_EXPRESSION)],
+            [self.document.label]
+        )
+
+        entry = tree.files[self._get_document_path(self.document.label)]
+        self.assertEqual(
+            entry['document_version_id'], self.document.latest_version.pk
+        )
+        self.assertEqual(entry['size'], self.document.latest_version.size)
+
+    def test_tree_duplicated_names(self):
+        self._upload_document(label=self.document.label)
+
+        tree = self._get_index_fs().tree
+
+        self.assertEqual(
+            tree.directories['/{}'.format(TEST_NODE_EXPRESSION)], []
+        )
+        self.assertFalse(
+            self._get_document_path(self.document.label) in tree.files
+        )
+
+    def test_tree_name_with_slash(self):
+        self._upload_document(label=TEST_DOCUMENT_LABEL_SLASH)
+
+        tree = self._get_index_fs().tree
+
+        self.assertEqual(
+            tree.directories['/{}'.format(TEST_NODE_EXPRESSION)],
+            [self.document.label]
+        )
+        self.assertFalse(
+            self._get_document_path(TEST_DOCUMENT_LABEL_SLASH) in tree.files
+        )
+
+    def test_tree_trashed_document(self):
+        index_fs = self._get_index_fs()
+
+        # Bypass the signals to leave the document in the index
+        Document.objects.filter(pk=self.document.pk).update(in_trash=True)
+
+        tree = index_fs._load_tree(version=None)
+
+        self.assertFalse(
+            self._get_document_path(self.document.label) in tree.files
+        )
+
+    def test_tree_stub_document(self):
+        index_fs = self._get_index_fs()
+
+        Document.objects.filter(pk=self.document.pk).update(is_stub=True)
+
+        tree = index_fs._load_tree(version=None)
+
+        self.assertFalse(
+            self._get_document_path(self.document.label) in tree.files
+        )
+
+    def test_tree_latest_version(self):
+        with open(TEST_SMALL_DOCUMENT_PATH) as file_object:
+            self.document.new_version(file_object=file_object)
+
+        tree = self._get_index_fs().tree
+
+        self.assertEqual(self.document.versions.count(), 2)
+        self.assertEqual(
+            tree.files[
+                self._get_document_path(self.document.label)
+            ]['document_version_id'], self.document.latest_version.pk
+        )
+
+    @mock.patch(
+        'mirroring.management.commands.mountindex.BLOCK_SIZE', TEST_BLOCK_SIZE
+    )
+    def test_read_block_boundaries(self):
+        content = self._read_document()
+        index_fs = self._get_index_fs()
+        path = self._get_document_path(self.document.label)
+        file_descriptor = index_fs.open(path=path, flags=0)
+
+        for offset, size in ((0, TEST_BLOCK_SIZE), (10, 20), (5, 50)):
+            self.assertEqual(
+                index_fs.read(
+                    path=path, size=size, offset=offset, fh=file_descriptor
+                ), content[offset:offset + size]
+            )
+
+        index_fs.release(path=path, fh=file_descriptor)
+
+    @mock.patch(
+        'mirroring.management.commands.mountindex.BLOCK_SIZE', TEST_BLOCK_SIZE
+    )
+    def test_read_end_of_file(self):
+        content = self._read_document()
+        index_fs = self._get_index_fs()
+        path = self._get_document_path(self.document.label)
+        file_descriptor = index_fs.open(path=path, flags=0)
+
+        self.assertEqual(
+            index_fs.read(
+                path=path, size=TEST_BLOCK_SIZE * 2,
+                offset=len(content) - 5, fh=file_descriptor
+            ), content[-5:]
+        )
+        self.assertEqual(
+            index_fs.read(
+                path=path, size=TEST_BLOCK_SIZE, offset=len(content),
+                fh=file_descriptor
+            ), b''
+        )
+        self.assertEqual(
+            index_fs.read(
+                path=path, size=len(content) * 2, offset=0,
+                fh=file_descriptor
+            ), content
+        )
+
+        index_fs.release(path=path, fh=file_descriptor)
@@ -0,0 +1,28 @@
+from __future__ import unicode_literals
+
+from common.tests import BaseTestCase
+
+from ..exceptions import RangeNotSatisfiable
+from ..utils import get_byte_range
+
+
+class MirroringUtilsTestCase(BaseTestCase):
+    def test_byte_range(self):
+        self.assertEqual(get_byte_range(value='bytes=0-9', size=100), (0, 9))
+        self.assertEqual(get_byte_range(value='bytes=90-', size=100), (90, 99))
+        self.assertEqual(get_byte_range(value='bytes=-10', size=100), (90, 99))
+        self.assertEqual(
+            get_byte_range(value='bytes=50-500', size=100), (50, 99)
+        )
+
+    def test_byte_range_ignored(self):
+        self.assertEqual(get_byte_range(value=None, size=100), None)
+        self.assertEqual(get_byte_range(value='bytes=9-0', size=100), None)
+        self.assertEqual(
+            get_byte_range(value='bytes=0-1,5-6', size=100), None
+        )
+        self.assertEqual(get_byte_range(value='pages=1-2', size=100), None)
+
+    def test_byte_range_not_satisfiable(self):
+        with self.assertRaises(RangeNotSatisfiable):
+            get_byte_range(value='bytes=100-', size=100)
@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+from django.core.urlresolvers import reverse
+
+from document_indexing.models import Index
+from document_indexing.permissions import permission_document_indexing_view
+from documents.permissions import permission_document_view
+from documents.tests.test_views import GenericDocumentViewTestCase
+
+from .literals import TEST_INDEX_LABEL, TEST_INDEX_SLUG, TEST_NODE_EXPRESSION
+
+
+class IndexWebDAVViewTestCase(GenericDocumentViewTestCase):
+    def setUp(self):
+        super(IndexWebDAVViewTestCase, self).setUp()
+        self.index = Index.objects.create(
+            label=TEST_INDEX_LABEL, slug=TEST_INDEX_SLUG
+        )
+        self.index.document_types.add(self.document_type)
+        self.index.node_templates.create(
+            parent=self.index.template_root, expression=TEST_NODE_EXPRESSION,
+            link_documents=True
+        )
+        self.index.rebuild()
+        self.login_user()
+
+    def _get_path(self, path=''):
+        return reverse(
+            'mirroring:index_webdav', kwargs={
+                'index_slug': TEST_INDEX_SLUG, 'path': path
+            }
+        )
+
+    def _request_document(self, **kwargs):
+        return self.client.get(
+            path=self._get_path(
+                '{}/{}'.format(TEST_NODE_EXPRESSION, self.document.label)
+            ), **kwargs
+        )
+
+    def _request_propfind(self, path=''):
+        return self.client.generic(
+            'PROPFIND', path=self._get_path(path), HTTP_DEPTH='1'
+        )
+
+    def test_propfind_no_permission(self):
+        response = self._request_propfind()
+        self.assertEqual(response.status_code, 403)
+
+    def test_propfind_with_access(self):
+        self.grant_access(
+            obj=self.index, permission=permission_document_indexing_view
+        )
+        self.grant_access(
+            obj=self.document, permission=permission_document_view
+        )
+
+        response = self._request_propfind()
+        self.assertContains(
+            response, text=TEST_NODE_EXPRESSION, status_code=207
+        )
+
+        response = self._request_propfind(path=TEST_NODE_EXPRESSION)
+        self.assertContains(
+            response, text=self.document.latest_version.checksum,
+            status_code=207
+        )
+
+    def test_propfind_document_no_permission(self):
+        self.grant_access(
+            obj=self.index, permission=permission_document_indexing_view
+        )
+
+        response = self._request_propfind(path=TEST_NODE_EXPRESSION)
+        self.assertNotContains(
+            response, text=self.document.label, status_code=207
+        )
+
+    def test_document_range_request(self):
+        self.grant_access(
+            obj=self.index, permission=permission_document_indexing_view
+        )
+        self.grant_access(
+            obj=self.document, permission=permission_document_view
+        )
+
+        response = self._request_document(HTTP_RANGE='bytes=0-9')
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(
+            response['Content-Range'], 'bytes 0-9/{}'.format(
+                self.document.latest_version.size
+            )
+        )
+
+        with self.document.latest_version.open(raw=True) as file_object:
+            self.assertEqual(
+                b''.join(response.streaming_content), file_object.read(10)
+            )
+
+    def test_document_not_modified(self):
+        self.grant_access(
+            obj=self.index, permission=permission_document_indexing_view
+        )
+        self.grant_access(
+            obj=self.document, permission=permission_document_view
+        )
+
+        response = self._request_document(
+            HTTP_IF_NONE_MATCH='"{}"'.format(
+                self.document.latest_version.checksum
+            )
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_write_method_not_allowed(self):
+        self.grant_access(
+            obj=self.index, permission=permission_document_indexing_view
+        )
+
+        response = self.client.delete(path=self._get_path())
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,13 @@
+from __future__ import unicode_literals
+
+from django.conf.urls import url
+from django.views.decorators.csrf import csrf_exempt
+
+from .views import IndexWebDAVView
+
+urlpatterns = [
+    url(
+        r'^webdav/(?P<index_slug>[-\w]+)/(?P<path>.*)$',
+        csrf_exempt(IndexWebDAVView.as_view()), name='index_webdav'
+    ),
+]
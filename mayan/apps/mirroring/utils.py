@@ -0,0 +1,54 @@
+from __future__ import unicode_literals
+
+import calendar
+
+from .exceptions import RangeNotSatisfiable
+
+
+def get_byte_range(value, size):
+    """
+    Parse the value of an HTTP Range header for a file of the given size.
+    Return a tuple with the first and last byte offsets requested or None
+    when the header must be ignored and the whole file served.
+    """
+    if not value:
+        return None
+
+    unit, separator, ranges = value.partition('=')
+
+    if unit.strip() != 'bytes' or ',' in ranges:
+        # Multiple ranges are not supported, serve the whole file
+        return None
+
+    first, separator, last = ranges.strip().partition('-')
+
+    try:
+        first = int(first) if first else None
+        last = int(last) if last else None
+    except ValueError:
+        return None
+
+    if first is None:
+        if last is None:
+            return None
+
+        # Suffix range, the last bytes of the file
+        if not last or not size:
+            raise RangeNotSatisfiable
+
+        return max(size - last, 0), size - 1
+
+    if last is not None and last < first:
+        return None
+
+    if first >= size:
+        raise RangeNotSatisfiable
+
+    if last is None:
+        return first, size - 1
+    else:
+        return first, min(last, size - 1)
+
+
+def get_timestamp(value):
+    return calendar.timegm(value.utctimetuple())
@@ -0,0 +1,372 @@
+from __future__ import unicode_literals
+
+from collections import Counter
+import logging
+
+from django.http import (
+    Http404, HttpResponse, HttpResponseForbidden, HttpResponseNotModified,
+    StreamingHttpResponse
+)
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
+from django.utils.http import http_date, urlquote
+from django.views.generic import View
+
+from rest_framework.authentication import BasicAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from acls.models import AccessControlList
+from document_indexing.models import IndexInstance, IndexInstanceNode
+from document_indexing.permissions import permission_document_indexing_view
+from documents.models import DocumentVersion
+from documents.permissions import permission_document_view
+
+from .exceptions import RangeNotSatisfiable
+from .literals import BLOCK_SIZE, WEBDAV_REALM
+from .utils import get_byte_range, get_timestamp
+
+logger = logging.getLogger(__name__)
+
+
+def get_file_chunks(file_object, start, length):
+    """
+    Read only the requested portion of the file, one block at a time.
+    """
+    try:
+        file_object.seek(start)
+
+        while length > 0:
+            data = file_object.read(min(length, BLOCK_SIZE))
+            if not data:
+                break
+
+            length -= len(data)
+            yield data
+    finally:
+        file_object.close()
+
+
+class IndexWebDAVView(View):
+    """
+    Read only WebDAV view of an index instance. The index nodes are the
+    collections and the latest versions of the documents linked to them
+    are the files.
+    """
+    http_method_names = ('get', 'head', 'options', 'propfind')
+
+    def dispatch(self, request, *args, **kwargs):
+        user = self.get_user()
+
+        if not user:
+            response = HttpResponse(status=401)
+            response['WWW-Authenticate'] = 'Basic realm="{}"'.format(
+                WEBDAV_REALM
+            )
+            return response
+
+        request.user = user
+
+        self.index = get_object_or_404(
+            IndexInstance, slug=self.kwargs['index_slug']
+        )
+
+        AccessControlList.objects.check_access(
+            permissions=permission_document_indexing_view, user=user,
+            obj=self.index
+        )
+
+        return super(IndexWebDAVView, self).dispatch(request, *args, **kwargs)
+
+    def get(self, request, *args, **kwargs):
+        return self.get_response(include_content=True)
+
+    def get_document(self, node, name):
+        if not node.index_template_node.link_documents:
+            return None
+
+        queryset = AccessControlList.objects.filter_by_access(
+            permission=permission_document_view, user=self.request.user,
+            queryset=node.documents.filter(is_stub=False, label=name)
+        )
+
+        try:
+            return queryset.get()
+        except (
+            queryset.model.DoesNotExist,
+            queryset.model.MultipleObjectsReturned
+        ):
+            return None
+
+    def get_document_entry(self, href, label, date_added, checksum, mimetype,
+                           size, timestamp):
+        return {
+            'content_type': mimetype,
+            'created': date_added.isoformat(),
+            'etag': self.get_etag(checksum=checksum),
+            'href': href,
+            'is_collection': False,
+            'modified': http_date(get_timestamp(timestamp)),
+            'name': label,
+            'size': size or 0,
+        }
+
+    def get_document_response(self, document, include_content):
+        document_version = document.latest_version
+        if not document_version:
+            raise Http404
+
+        etag = self.get_etag(checksum=document.latest_version_checksum)
+        if etag and self.request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            return HttpResponseNotModified()
+
+        size = document_version.size
+        if size is None:
+            size = document_version.file.storage.size(
+                document_version.file.name
+            )
+
+        byte_range = None
+        if_range = self.request.META.get('HTTP_IF_RANGE')
+
+        # A changed file invalidates the ranges the client has
+        if if_range is None or (etag and if_range == etag):
+            try:
+                byte_range = get_byte_range(
+                    value=self.request.META.get('HTTP_RANGE'), size=size
+                )
+            except RangeNotSatisfiable:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = 'bytes */{}'.format(size)
+                return response
+
+        if byte_range:
+            start, end = byte_range
+            status = 206
+        else:
+            start, end = 0, size - 1
+            status = 200
+
+        if include_content:
+            # The stored file is served instead of the one returned by the
+            # pre open hooks to keep sizes and offsets matching the ETag.
+            response = StreamingHttpResponse(
+                content_type=document_version.mimetype, status=status,
+                streaming_content=get_file_chunks(
+                    file_object=document_version.open(raw=True),
+                    start=start, length=end - start + 1
+                )
+            )
+        else:
+            response = HttpResponse(
+                content_type=document_version.mimetype, status=status
+            )
+
+        response['Accept-Ranges'] = 'bytes'
+        response['Content-Length'] = end - start + 1
+        response['Last-Modified'] = http_date(
+            get_timestamp(document_version.timestamp)
+        )
+
+        if byte_range:
+            response['Content-Range'] = 'bytes {}-{}/{}'.format(
+                start, end, size
+            )
+
+        if etag:
+            response['ETag'] = etag
+
+        return response
+
+    def get_etag(self, checksum):
+        if checksum:
+            return '"{}"'.format(checksum)
+
+    def get_node(self, names):
+        """
+        Return the index node at the end of the path names, matching all the
+        names at once instead of walking the tree one level at a time.
+        """
+        root = self.index.instance_root
+
+        if not names:
+            return root
+
+        filters = {}
+        prefix = ''
+
+        for name in reversed(names):
+            filters['{}value'.format(prefix)] = name
+            prefix = '{}parent__'.format(prefix)
+
+        filters['{}pk'.format(prefix)] = root.pk
+
+        try:
+            return IndexInstanceNode.objects.get(**filters)
+        except (
+            IndexInstanceNode.DoesNotExist,
+            IndexInstanceNode.MultipleObjectsReturned
+        ):
+            return None
+
+    def get_node_entries(self, node, href):
+        """
+        Return the entries of a collection using one query for the child
+        nodes, one for the documents and one for their latest versions
+        regardless of the size of the collection.
+        """
+        entries = [
+            {
+                'href': '{}{}/'.format(href, urlquote(value, safe='')),
+                'is_collection': True, 'name': value
+            } for value in node.get_children().values_list('value', flat=True)
+        ]
+
+        if node.index_template_node.link_documents:
+            documents = AccessControlList.objects.filter_by_access(
+                permission=permission_document_view, user=self.request.user,
+                queryset=node.documents.filter(is_stub=False)
+            )
+
+            latest_versions = {}
+            queryset = DocumentVersion.objects.filter(
+                document__in=documents
+            ).order_by('document_id', 'timestamp', 'pk').values_list(
+                'document_id', 'mimetype', 'size', 'timestamp'
+            )
+
+            for document_id, mimetype, size, timestamp in queryset.iterator():
+                latest_versions[document_id] = (mimetype, size, timestamp)
+
+            queryset = documents.values_list(
+                'pk', 'label', 'date_added', 'latest_version_checksum'
+            )
+
+            for pk, label, date_added, checksum in queryset.iterator():
+                if pk in latest_versions:
+                    mimetype, size, timestamp = latest_versions[pk]
+                    entries.append(
+                        self.get_document_entry(
+                            href='{}{}'.format(href, urlquote(label, safe='')),
+                            label=label, date_added=date_added,
+                            checksum=checksum, mimetype=mimetype, size=size,
+                            timestamp=timestamp
+                        )
+                    )
+
+        # Names that can't be represented as unique paths are not shown
+        counts = Counter([entry['name'] for entry in entries])
+
+        return [
+            entry for entry in entries if entry['name'] and (
+                '/' not in entry['name'] and counts[entry['name']] == 1
+            )
+        ]
+
+    def get_resource(self):
+        """
+        Return the node and the document, if any, of the requested path.
+        """
+        names = [name for name in self.kwargs['path'].split('/') if name]
+
+        node = self.get_node(names=names)
+        if node:
+            return node, None
+
+        if names:
+            node = self.get_node(names=names[:-1])
+            if node:
+                document = self.get_document(node=node, name=names[-1])
+                if document:
+                    return node, document
+
+        raise Http404
+
+    def get_response(self, include_content):
+        node, document = self.get_resource()
+
+        if document:
+            return self.get_document_response(
+                document=document, include_content=include_content
+            )
+
+        href = urlquote(self.request.path)
+        if not href.endswith('/'):
+            href = '{}/'.format(href)
+
+        return HttpResponse(
+            content=render_to_string(
+                'mirroring/webdav_collection.html', {
+                    'entries': self.get_node_entries(node=node, href=href),
+                    'title': self.request.path,
+                }
+            )
+        )
+
+    def get_user(self):
+        if self.request.user.is_authenticated:
+            return self.request.user
+
+        # Most WebDAV clients only support HTTP basic authentication
+        try:
+            result = BasicAuthentication().authenticate(request=self.request)
+        except AuthenticationFailed:
+            return None
+
+        if result:
+            return result[0]
+
+    def head(self, request, *args, **kwargs):
+        return self.get_response(include_content=False)
+
+    def options(self, request, *args, **kwargs):
+        response = super(IndexWebDAVView, self).options(
+            request, *args, **kwargs
+        )
+        response['DAV'] = '1'
+        response['MS-Author-Via'] = 'DAV'
+        return response
+
+    def propfind(self, request, *args, **kwargs):
+        depth = request.META.get('HTTP_DEPTH', '1')
+
+        # Listing a whole index in one response is refused, RFC 4918 9.1
+        if depth not in ('0', '1'):
+            return HttpResponseForbidden()
+
+        node, document = self.get_resource()
+
+        if document:
+            document_version = document.latest_version
+            if not document_version:
+                raise Http404
+
+            entries = [
+                self.get_document_entry(
+                    href=urlquote(request.path), label=document.label,
+                    date_added=document.date_added,
+                    checksum=document.latest_version_checksum,
+                    mimetype=document_version.mimetype,
+                    size=document_version.size,
+                    timestamp=document_version.timestamp
+                )
+            ]
+        else:
+            href = urlquote(request.path)
+            if not href.endswith('/'):
+                href = '{}/'.format(href)
+
+            entries = [
+                {
+                    'href': href, 'is_collection': True,
+                    'name': node.value if node.parent_id else self.index.label
+                }
+            ]
+
+            if depth == '1':
+                entries.extend(self.get_node_entries(node=node, href=href))
+
+        return HttpResponse(
+            content=render_to_string(
+                'mirroring/webdav_multistatus.xml', {'entries': entries}
+            ), content_type='application/xml; charset=utf-8', status=207
+        )
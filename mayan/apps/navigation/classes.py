@@ -10,13 +10,14 @@ from django.conf import settings
 from django.core.exceptions import PermissionDenied
 from django.shortcuts import resolve_url
 from django.template import VariableDoesNotExist, Variable
-from django.template.defaulttags import URLNode
-from django.urls import resolve
+from django.urls import reverse
 from django.utils.encoding import force_str, force_text
 
 from common.utils import return_attrib
 from permissions import Permission
 
+from .utils import get_current_view_name
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,8 +75,59 @@ class Menu(object):
         self.bound_links = {}
         self.unbound_links = {}
         self.link_positions = {}
+        self._class_sources_cache = {}
+        self._links_cache = {}
         self.__class__._registry[name] = self
 
+    def _get_source_links(self, source):
+        """
+        Return the links bound to a source minus the unbound ones, sorted
+        by their bind position. The result is cached until the links
+        bound to the source change.
+        """
+        bound_links = self.bound_links.get(source, ())
+
+        try:
+            cached_bound_links, links = self._links_cache[source]
+        except KeyError:
+            pass
+        else:
+            if cached_bound_links is bound_links:
+                return links
+
+        unbound_links = self.unbound_links.get(source, ())
+        links = sorted(
+            [link for link in bound_links if link not in unbound_links],
+            key=lambda link: self.link_positions.get(link) or 0
+        )
+        self._links_cache[source] = (bound_links, links)
+
+        return links
+
+    def _get_class_source(self, resolved_object):
+        """
+        Return the class source to which the links of a navigation object
+        are bound. The lookup is cached per object class.
+        """
+        klass = type(resolved_object)
+        # Objects using .defer() or .only() also match their parent classes
+        deferred = bool(
+            hasattr(resolved_object, 'get_deferred_fields') and resolved_object.get_deferred_fields()
+        )
+
+        try:
+            return self._class_sources_cache[(klass, deferred)]
+        except KeyError:
+            result = None
+            for bound_source in self.bound_links.keys():
+                if inspect.isclass(bound_source):
+                    if klass == bound_source or (deferred and issubclass(klass, bound_source)):
+                        result = bound_source
+                        break
+
+            self._class_sources_cache[(klass, deferred)] = result
+            return result
+
     def _map_links_to_source(self, links, source, map_variable='bound_links', position=None):
         source_links = getattr(self, map_variable).setdefault(source, [])
 
@@ -83,6 +135,9 @@ class Menu(object):
             source_links.append(link)
             self.link_positions[link] = position
 
+        self._class_sources_cache = {}
+        self._links_cache = {}
+
     def bind_links(self, links, sources=None, position=None):
         """
         Associate a link to a model, a view inside this menu
@@ -137,10 +192,8 @@ class Menu(object):
             logger.warning('No request variable, aborting menu resolution')
             return ()
 
-        current_path = request.META['PATH_INFO']
-
         # Get sources: view name, view objects
-        current_view = resolve(current_path).view_name
+        current_view = get_current_view_name(request=request)
 
         resolved_navigation_object_list = self.get_resolved_navigation_object_list(
             context=context, source=source
@@ -149,46 +202,28 @@ class Menu(object):
         for resolved_navigation_object in resolved_navigation_object_list:
             resolved_links = []
 
-            for bound_source, links in self.bound_links.items():
-                try:
-                    if inspect.isclass(bound_source):
-                        if type(resolved_navigation_object) == bound_source:
-                            for link in links:
-                                resolved_link = link.resolve(
-                                    context=context,
-                                    resolved_object=resolved_navigation_object
-                                )
-                                if resolved_link:
-                                    if resolved_link.link not in self.unbound_links.get(bound_source, ()):
-                                        resolved_links.append(resolved_link)
-                            # No need for further content object match testing
-                            break
-                        elif hasattr(resolved_navigation_object, 'get_deferred_fields') and resolved_navigation_object.get_deferred_fields() and isinstance(resolved_navigation_object, bound_source):
-                            # Second try for objects using .defer() or .only()
-                            for link in links:
-                                resolved_link = link.resolve(
-                                    context=context,
-                                    resolved_object=resolved_navigation_object
-                                )
-                                if resolved_link:
-                                    if resolved_link.link not in self.unbound_links.get(bound_source, ()):
-                                        resolved_links.append(resolved_link)
-                            # No need for further content object match testing
-                            break
-                except TypeError:
-                    # When source is a dictionary
-                    pass
+            bound_source = self._get_class_source(
+                resolved_object=resolved_navigation_object
+            )
+
+            if bound_source:
+                for link in self._get_source_links(source=bound_source):
+                    resolved_link = link.resolve(
+                        context=context,
+                        resolved_object=resolved_navigation_object
+                    )
+                    if resolved_link:
+                        resolved_links.append(resolved_link)
 
             if resolved_links:
                 result.append(resolved_links)
 
         resolved_links = []
         # View links
-        for link in self.bound_links.get(current_view, []):
+        for link in self._get_source_links(source=current_view):
             resolved_link = link.resolve(context=context)
             if resolved_link:
-                if resolved_link.link not in self.unbound_links.get(current_view, ()):
-                    resolved_links.append(resolved_link)
+                resolved_links.append(resolved_link)
 
         if resolved_links:
             result.append(resolved_links)
@@ -196,27 +231,18 @@ class Menu(object):
         resolved_links = []
 
         # Main menu links
-        for link in self.bound_links.get(None, []):
+        for link in self._get_source_links(source=None):
             if isinstance(link, Menu):
-                resolved_link = link
-                if resolved_link not in self.unbound_links.get(None, ()):
-                    resolved_links.append(resolved_link)
+                resolved_links.append(link)
             else:
                 # "Always show" links
                 resolved_link = link.resolve(context=context)
                 if resolved_link:
-                    if resolved_link.link not in self.unbound_links.get(None, ()):
-                        resolved_links.append(resolved_link)
+                    resolved_links.append(resolved_link)
 
         if resolved_links:
             result.append(resolved_links)
 
-        if result:
-            # Sort links by position value passed during bind
-            result[0] = sorted(
-                result[0], key=lambda item: (self.link_positions.get(item.link) or 0) if isinstance(item, ResolvedLink) else (self.link_positions.get(item) or 0)
-            )
-
         return result
 
     def unbind_links(self, links, sources=None):
@@ -259,14 +285,99 @@ class Link(object):
         self.view = view
         self.url = url
 
-    def resolve(self, context, resolved_object=None):
+    def check_access(self, context, obj):
+        """
+        Check the link's permissions against an object. When the object is
+        part of the context's object list, the access for the entire list
+        is resolved with a single bulk ACL check and the result is cached
+        in the request for the following rows.
+        """
         AccessControlList = apps.get_model(
             app_label='acls', model_name='AccessControlList'
         )
 
         request = Variable('request').resolve(context)
-        current_path = request.META['PATH_INFO']
-        current_view = resolve(current_path).view_name
+
+        access_cache = request.__dict__.setdefault(
+            '_navigation_access_cache', {}
+        ).setdefault(
+            (
+                tuple(permission.pk for permission in self.permissions),
+                self.permissions_related
+            ), {'batches': set(), 'results': {}}
+        )
+
+        try:
+            return access_cache['results'][obj]
+        except (KeyError, TypeError):
+            pass
+
+        object_list = context.get('object_list')
+        if object_list is not None and id(object_list) not in access_cache['batches']:
+            try:
+                if obj in object_list:
+                    access_cache['batches'].add(id(object_list))
+                    object_list = list(object_list)
+                    granted = AccessControlList.objects.check_access_bulk(
+                        permissions=self.permissions, user=request.user,
+                        objects=object_list, related=self.permissions_related
+                    )
+                    for entry in object_list:
+                        access_cache['results'][entry] = entry in granted
+
+                    return obj in granted
+            except TypeError:
+                # Not an iterable or unhashable entries, do single
+                # object checks
+                pass
+
+        try:
+            AccessControlList.objects.check_access(
+                permissions=self.permissions, user=request.user, obj=obj,
+                related=self.permissions_related
+            )
+        except PermissionDenied:
+            return False
+        else:
+            return True
+
+    def get_compiled_arguments(self):
+        """
+        Return the template variables of the link's view arguments and
+        keyword arguments. They are compiled only once and reused for every
+        resolution until the link's arguments are changed. The keyword
+        arguments are returned as None when they are a callable that must
+        be evaluated against each context.
+        """
+        try:
+            source, compiled = self._compiled_arguments
+        except AttributeError:
+            pass
+        else:
+            if source == (self.args, self.kwargs):
+                return compiled
+
+        if isinstance(self.args, list) or isinstance(self.args, tuple):
+            # TODO: Don't check for instance check for iterable in try/except
+            # block. This update required changing all 'args' argument in
+            # links.py files to be iterables and not just strings.
+            args = [Variable(arg) for arg in self.args]
+        else:
+            args = [Variable(self.args)]
+
+        if callable(self.kwargs):
+            kwargs = None
+        else:
+            kwargs = {
+                key: Variable(value) for key, value in self.kwargs.items()
+            }
+
+        self._compiled_arguments = ((self.args, self.kwargs), (args, kwargs))
+        return args, kwargs
+
+    def resolve(self, context, resolved_object=None):
+        request = Variable('request').resolve(context)
+        current_view = get_current_view_name(request=request)
 
         # ACL is tested agains the resolved_object or just {{ object }} if not
         if not resolved_object:
@@ -279,12 +390,7 @@ class Link(object):
         # too
         if self.permissions:
             if resolved_object:
-                try:
-                    AccessControlList.objects.check_access(
-                        permissions=self.permissions, user=request.user,
-                        obj=resolved_object, related=self.permissions_related
-                    )
-                except PermissionDenied:
+                if not self.check_access(context=context, obj=resolved_object):
                     return None
             else:
                 try:
@@ -304,35 +410,27 @@ class Link(object):
         resolved_link = ResolvedLink(current_view=current_view, link=self)
 
         if self.view:
-            view_name = Variable('"{}"'.format(self.view))
-            if isinstance(self.args, list) or isinstance(self.args, tuple):
-                # TODO: Don't check for instance check for iterable in try/except
-                # block. This update required changing all 'args' argument in
-                # links.py files to be iterables and not just strings.
-                args = [Variable(arg) for arg in self.args]
-            else:
-                args = [Variable(self.args)]
-
             # If we were passed an instance of the view context object we are
             # resolving, inject it into the context. This help resolve links for
             # object lists.
             if resolved_object:
                 context['resolved_object'] = resolved_object
 
-            try:
-                kwargs = self.kwargs(context)
-            except TypeError:
-                # Is not a callable
-                kwargs = self.kwargs
-
-            kwargs = {key: Variable(value) for key, value in kwargs.items()}
+            args, kwargs = self.get_compiled_arguments()
 
-            # Use Django's exact {% url %} code to resolve the link
-            node = URLNode(
-                view_name=view_name, args=args, kwargs=kwargs, asvar=None
-            )
             try:
-                resolved_link.url = node.render(context)
+                if kwargs is None:
+                    # Is a callable, evaluate it for each resolution
+                    kwargs = {
+                        key: Variable(value) for key, value in self.kwargs(context).items()
+                    }
+
+                resolved_link.url = reverse(
+                    self.view, args=[arg.resolve(context) for arg in args],
+                    kwargs={
+                        key: value.resolve(context) for key, value in kwargs.items()
+                    }
+                )
             except Exception as exception:
                 logger.error(
                     'Error resolving link "%s" URL; %s', self.text, exception
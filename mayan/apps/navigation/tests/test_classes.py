@@ -1,5 +1,6 @@
 from __future__ import absolute_import, unicode_literals
 
+from django.contrib.auth.models import Group
 from django.template import Context
 from django.urls import reverse
 
@@ -202,3 +203,28 @@ class MenuClassTestCase(GenericViewTestCase):
         self.menu.unbind_links(links=(self.sub_menu,))
 
         self.assertEqual(self.menu.resolve(context=context), [])
+
+    def test_source_link_binding_after_resolution(self):
+        self.menu.bind_links(links=(self.link,), sources=(Group,))
+
+        response = self.get(TEST_VIEW_NAME)
+        context = Context({'request': response.wsgi_request})
+
+        self.assertEqual(
+            [
+                resolved_link.link for resolved_link in self.menu.resolve(
+                    context=context, source=self.group
+                )[0]
+            ], [self.link]
+        )
+
+        link_2 = Link(text=TEST_LINK_TEXT, view=TEST_VIEW_NAME)
+        self.menu.bind_links(links=(link_2,), sources=(Group,), position=-1)
+
+        self.assertEqual(
+            [
+                resolved_link.link for resolved_link in self.menu.resolve(
+                    context=context, source=self.group
+                )[0]
+            ], [link_2, self.link]
+        )
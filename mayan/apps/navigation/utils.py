@@ -0,0 +1,20 @@
+from __future__ import unicode_literals
+
+from django.urls import resolve
+
+
+def get_current_view_name(request):
+    """
+    Return the name of the view serving the request. The URL is resolved
+    only once per request and the result is stored in the request for the
+    rest of the menus and links being rendered.
+    """
+    try:
+        return request._navigation_current_view_name
+    except AttributeError:
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            resolver_match = resolve(request.META['PATH_INFO'])
+
+        request._navigation_current_view_name = resolver_match.view_name
+        return request._navigation_current_view_name
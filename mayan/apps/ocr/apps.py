@@ -3,8 +3,6 @@ from __future__ import unicode_literals
 from datetime import timedelta
 import logging
 
-from kombu import Exchange, Queue
-
 from django.apps import apps
 from django.db.models.signals import post_save
 from django.utils.timezone import now
@@ -19,7 +17,6 @@ from common.settings import settings_db_sync_task_delay
 from documents.search import document_search, document_page_search
 from documents.signals import post_version_upload
 from documents.widgets import document_link
-from mayan.celery import app
 from navigation import SourceColumn
 from rest_api.classes import APIEndPoint
 
@@ -111,18 +108,6 @@ class OCRApp(MayanAppConfig):
             attribute='result'
         )
 
-        app.conf.CELERY_QUEUES.append(
-            Queue('ocr', Exchange('ocr'), routing_key='ocr'),
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'ocr.tasks.task_do_ocr': {
-                    'queue': 'ocr'
-                },
-            }
-        )
-
         document_search.add_model_field(
             field='versions__pages__ocr_content__content', label=_('OCR')
         )
@@ -20,3 +20,22 @@ class MayanObjectPermissionsFilter(BaseFilterBackend):
             )
         else:
             return queryset
+
+
+class MayanExpandPrefetchFilter(BaseFilterBackend):
+    """
+    Prefetch the related objects of the fields requested via the expand
+    query parameter of serializers using DynamicFieldsSerializerMixin.
+    """
+    def filter_queryset(self, request, queryset, view):
+        try:
+            prefetches = view.get_serializer_class().get_expand_prefetches(
+                request=request
+            )
+        except AttributeError:
+            return queryset
+        else:
+            if prefetches:
+                return queryset.prefetch_related(*prefetches)
+            else:
+                return queryset
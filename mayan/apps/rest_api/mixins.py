@@ -0,0 +1,148 @@
+from __future__ import unicode_literals
+
+from django.db.models import Prefetch
+from django.utils.module_loading import import_string
+from django.utils.six import string_types
+
+from rest_framework import serializers
+
+
+class DynamicFieldsSerializerMixin(object):
+    """
+    Serializer mixin that allows API clients to choose the fields to render
+    and to inline related objects.
+    The "fields" query parameter is a comma separated list of the fields to
+    render, dotted names select the fields of nested serializers:
+    ?fields=id,label,latest_version.checksum
+    The "expand" query parameter is a comma separated list of the
+    expandable fields to add to the representation: ?expand=tags,metadata
+    Expandable fields are registered by other apps with
+    add_expandable_field and are backed by a prefetch of the related
+    objects that MayanExpandPrefetchFilter adds to the view's queryset.
+    The query parameters are only used by the top level serializer of GET
+    requests, a list of fields can also be passed as the fields keyword
+    argument when instantiating the serializer.
+    """
+    expand_query_param = 'expand'
+    fields_query_param = 'fields'
+
+    @classmethod
+    def add_expandable_field(cls, name, serializer_class, many=False, prefetch_lookup=None, prefetch_queryset=None, serializer_kwargs=None, source=None):
+        """
+        Register a field that is only rendered when requested via the
+        expand query parameter. prefetch_queryset is a function that
+        receives the request and returns the queryset used to prefetch
+        the related objects, this allows filtering them by access.
+        """
+        if '_expandable_fields' not in cls.__dict__:
+            cls._expandable_fields = {}
+
+        cls._expandable_fields[name] = {
+            'many': many,
+            'prefetch_lookup': prefetch_lookup,
+            'prefetch_queryset': prefetch_queryset,
+            'serializer_class': serializer_class,
+            'serializer_kwargs': serializer_kwargs or {},
+            'source': source,
+        }
+
+    @classmethod
+    def get_expandable_fields(cls):
+        return getattr(cls, '_expandable_fields', {})
+
+    @classmethod
+    def get_expand_prefetches(cls, request):
+        """
+        Return the prefetch lookups required to render the fields
+        requested via the expand query parameter.
+        """
+        result = []
+
+        for name in cls.get_query_param_list(request=request, name=cls.expand_query_param):
+            try:
+                expandable_field = cls.get_expandable_fields()[name]
+            except KeyError:
+                continue
+
+            if expandable_field['prefetch_lookup']:
+                if expandable_field['prefetch_queryset']:
+                    result.append(
+                        Prefetch(
+                            expandable_field['prefetch_lookup'],
+                            queryset=expandable_field['prefetch_queryset'](
+                                request
+                            )
+                        )
+                    )
+                else:
+                    result.append(expandable_field['prefetch_lookup'])
+
+        return result
+
+    @staticmethod
+    def get_query_param_list(request, name):
+        if request is None or request.method != 'GET':
+            return ()
+
+        return [
+            value.strip() for value in request.query_params.get(name, '').split(',') if value.strip()
+        ]
+
+    @staticmethod
+    def restrict_fields(serializer, field_names):
+        """
+        Remove the fields of a serializer not present in field_names.
+        Dotted names restrict the fields of the nested serializers.
+        """
+        nested_field_names = {}
+        for field_name in field_names:
+            name, _, nested_name = field_name.partition('.')
+            nested_field_names.setdefault(name, [])
+            if nested_name:
+                nested_field_names[name].append(nested_name)
+
+        for name in list(serializer.fields.keys()):
+            if name not in nested_field_names:
+                serializer.fields.pop(name)
+            elif nested_field_names[name]:
+                nested_serializer = getattr(
+                    serializer.fields[name], 'child', serializer.fields[name]
+                )
+                if isinstance(nested_serializer, serializers.Serializer):
+                    DynamicFieldsSerializerMixin.restrict_fields(
+                        serializer=nested_serializer,
+                        field_names=nested_field_names[name]
+                    )
+
+    def __init__(self, *args, **kwargs):
+        field_names = kwargs.pop('fields', None)
+
+        super(DynamicFieldsSerializerMixin, self).__init__(*args, **kwargs)
+
+        request = self._context.get('request')
+
+        for name in self.get_query_param_list(request=request, name=self.expand_query_param):
+            try:
+                expandable_field = self.get_expandable_fields()[name]
+            except KeyError:
+                continue
+
+            serializer_class = expandable_field['serializer_class']
+            if isinstance(serializer_class, string_types):
+                serializer_class = import_string(serializer_class)
+
+            serializer_kwargs = expandable_field['serializer_kwargs'].copy()
+            if expandable_field['source']:
+                serializer_kwargs['source'] = expandable_field['source']
+
+            self.fields[name] = serializer_class(
+                many=expandable_field['many'], read_only=True,
+                **serializer_kwargs
+            )
+
+        field_names = field_names or self.get_query_param_list(
+            request=request, name=self.fields_query_param
+        )
+
+        if field_names:
+            self.restrict_fields(serializer=self, field_names=field_names)
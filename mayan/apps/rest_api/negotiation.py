@@ -0,0 +1,17 @@
+from __future__ import unicode_literals
+
+from rest_framework.negotiation import BaseContentNegotiation
+
+
+class IgnoreClientContentNegotiation(BaseContentNegotiation):
+    """
+    Use the first parser and renderer of the view without looking at the
+    Accept header. For views that return their own HttpResponse and pick
+    the media type of the content themselves, errors are still rendered
+    with the first renderer.
+    """
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return (renderers[0], renderers[0].media_type)
@@ -0,0 +1,53 @@
+from __future__ import unicode_literals
+
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class MayanCursorPagination(CursorPagination):
+    """
+    Keyset pagination ordered by primary key. The position in the
+    collection is kept in an opaque cursor so that deep pages are fetched
+    with an indexed range lookup instead of an OFFSET scan.
+    """
+    ordering = '-pk'
+
+
+class MayanPagination(PageNumberPagination):
+    """
+    Page number pagination that switches to cursor (keyset) pagination
+    when the client requests it by adding the cursor query parameter, even
+    with an empty value, to the URL. Large collections like documents or
+    document pages should be traversed this way.
+    """
+    cursor_pagination_class = MayanCursorPagination
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+
+    def __init__(self, *args, **kwargs):
+        super(MayanPagination, self).__init__(*args, **kwargs)
+        self.cursor_paginator = None
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data=data)
+        else:
+            return super(MayanPagination, self).get_paginated_response(
+                data=data
+            )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        cursor_query_param = self.cursor_pagination_class.cursor_query_param
+
+        if cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            self.cursor_paginator.page_size = self.get_page_size(
+                request=request
+            )
+            self.display_page_controls = False
+            return self.cursor_paginator.paginate_queryset(
+                queryset=queryset, request=request, view=view
+            )
+        else:
+            return super(MayanPagination, self).paginate_queryset(
+                queryset=queryset, request=request, view=view
+            )
@@ -2,8 +2,6 @@ from __future__ import absolute_import, unicode_literals
 
 from django.utils.translation import ugettext_lazy as _
 
-from kombu import Exchange, Queue
-
 from common import (
     MayanAppConfig, MissingItem, menu_object, menu_secondary, menu_sidebar,
     menu_setup
@@ -12,7 +10,6 @@ from common.signals import post_initial_setup, post_upgrade
 from converter.links import link_transformation_list
 from documents.menus import menu_documents
 from documents.signals import post_version_upload
-from mayan.celery import app
 from navigation import SourceColumn
 from rest_api.classes import APIEndPoint
 
@@ -90,31 +87,6 @@ class SourcesApp(MayanAppConfig):
             func=lambda context: context['object'].message
         )
 
-        app.conf.CELERY_QUEUES.extend(
-            (
-                Queue(
-                    'sources', Exchange('sources'), routing_key='sources'
-                ),
-                Queue(
-                    'sources_periodic', Exchange('sources_periodic'),
-                    routing_key='sources_periodic', delivery_mode=1
-                ),
-            )
-        )
-
-        app.conf.CELERY_ROUTES.update(
-            {
-                'sources.tasks.task_check_interval_source': {
-                    'queue': 'sources_periodic'
-                },
-                'sources.tasks.task_source_handle_upload': {
-                    'queue': 'sources'
-                },
-                'sources.tasks.task_upload_document': {
-                    'queue': 'sources'
-                },
-            }
-        )
         menu_documents.bind_links(links=(link_document_create_multiple,))
 
         menu_object.bind_links(
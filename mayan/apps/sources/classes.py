@@ -10,6 +10,7 @@ from django.core.files import File
 from django.utils.encoding import force_text, python_2_unicode_compatible
 
 from converter import TransformationResize, converter_class
+from converter.literals import OUTPUT_PROFILE_PREVIEW
 
 
 class PseudoFile(File):
@@ -83,7 +84,9 @@ class StagingFile(object):
         for transformation in transformations:
             converter.transform(transformation=transformation)
 
-        return converter.get_page(as_base64=as_base64)
+        return converter.get_page(
+            as_base64=as_base64, profile=OUTPUT_PROFILE_PREVIEW
+        )
 
     def delete(self):
         os.unlink(self.get_full_path())
@@ -64,6 +64,27 @@ DEFAULT_METADATA_ATTACHMENT_NAME = 'metadata.yaml'
 DEFAULT_POP3_TIMEOUT = 60
 DEFAULT_IMAP_MAILBOX = 'INBOX'
 DEFAULT_SOURCE_TASK_RETRY_DELAY = 10
+DEFAULT_WATCH_FOLDER_CONCURRENCY = 4
+DEFAULT_WATCH_FOLDER_POLL_INTERVAL = 60
+
+# Seconds a file must remain unmodified before a polling check considers
+# it completely written.
+WATCH_FOLDER_SETTLE_TIME = 5
+# Seconds after which an unfinished journal entry is considered abandoned
+# by a crashed worker and is dispatched again.
+WATCH_FOLDER_JOURNAL_TIMEOUT = 60 * 60
+
+WATCH_FOLDER_STATE_FAILED = 'failed'
+WATCH_FOLDER_STATE_PROCESSED = 'processed'
+WATCH_FOLDER_STATE_QUEUED = 'queued'
+WATCH_FOLDER_STATE_UPLOADING = 'uploading'
+
+WATCH_FOLDER_STATE_CHOICES = (
+    (WATCH_FOLDER_STATE_QUEUED, _('Queued')),
+    (WATCH_FOLDER_STATE_UPLOADING, _('Uploading')),
+    (WATCH_FOLDER_STATE_PROCESSED, _('Processed')),
+    (WATCH_FOLDER_STATE_FAILED, _('Failed')),
+)
 
 # Upload wizard steps
 STEP_DOCUMENT_TYPE = '0'
@@ -0,0 +1,107 @@
+from __future__ import unicode_literals
+
+import logging
+import time
+
+from django.core import management
+from django.db import close_old_connections
+from django.utils.encoding import force_text
+
+from ...models import WatchFolderSource
+from ...settings import setting_watch_folder_poll_interval
+from ...watchers import InotifyWatcher, WatcherUnavailable
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Monitor the enabled watch folders and queue their files for upload '
+        'as soon as they are completely written or moved into the folder. '
+        'Falls back to polling when filesystem events are not available.'
+    )
+
+    def check_source(self, source):
+        try:
+            source.check_source()
+        except Exception as exception:
+            logger.error(
+                'Error processing source: %s; %s', source, exception
+            )
+
+    def handle(self, *args, **options):
+        try:
+            watcher = InotifyWatcher()
+        except WatcherUnavailable as exception:
+            logger.warning(
+                'Filesystem events not available, using polling; %s',
+                exception
+            )
+            self.stderr.write(
+                'Filesystem events not available, using polling.'
+            )
+            watcher = None
+
+        next_scan = 0
+        sources = {}
+
+        while True:
+            close_old_connections()
+
+            if time.time() >= next_scan:
+                sources = self.refresh_sources(
+                    sources=sources, watcher=watcher
+                )
+                for source in sources.values():
+                    self.check_source(source=source)
+
+                next_scan = time.time() + setting_watch_folder_poll_interval.value
+
+            timeout = max(0, next_scan - time.time())
+
+            if not watcher:
+                time.sleep(timeout)
+                continue
+
+            for path, file_name in watcher.read_events(timeout=timeout):
+                source = sources.get(path)
+
+                if not source:
+                    continue
+
+                close_old_connections()
+
+                if file_name is None:
+                    self.check_source(source=source)
+                else:
+                    try:
+                        source.queue_file(file_name=file_name)
+                    except Exception as exception:
+                        logger.error(
+                            'Error queuing file "%s" of source: %s; %s',
+                            file_name, source, exception
+                        )
+
+    def refresh_sources(self, sources, watcher):
+        """
+        Return a dictionary of the enabled watch folder sources by folder
+        path, adding and removing filesystem watches as sources change.
+        """
+        result = {}
+
+        for source in WatchFolderSource.objects.filter(enabled=True):
+            result[force_text(source.folder_path)] = source
+
+        if watcher:
+            for path in set(sources.keys()) - set(result.keys()):
+                watcher.remove_watch(path=path)
+
+            for path in set(result.keys()) - set(sources.keys()):
+                try:
+                    watcher.add_watch(path=path)
+                except OSError as exception:
+                    logger.error(
+                        'Unable to watch folder "%s"; %s', path, exception
+                    )
+
+        return result
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sources', '0016_auto_20170630_2040'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WatchFolderJournalEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'file_name', models.CharField(
+                        max_length=255, verbose_name='File name'
+                    )
+                ),
+                (
+                    'state', models.CharField(
+                        choices=[
+                            ('queued', 'Queued'),
+                            ('uploading', 'Uploading'),
+                            ('processed', 'Processed')
+                        ], default='queued', max_length=16,
+                        verbose_name='State'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name='Date time'
+                    )
+                ),
+                (
+                    'source', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='journal_entries',
+                        to='sources.WatchFolderSource',
+                        verbose_name='Source'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Watch folder journal entry',
+                'verbose_name_plural': 'Watch folder journal entries',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='watchfolderjournalentry',
+            unique_together=set([('source', 'file_name')]),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sources', '0017_watchfolderjournalentry'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='watchfolderjournalentry',
+            name='state',
+            field=models.CharField(
+                choices=[
+                    ('queued', 'Queued'), ('uploading', 'Uploading'),
+                    ('processed', 'Processed'), ('failed', 'Failed')
+                ], default='queued', max_length=16, verbose_name='State'
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+from datetime import timedelta
 from email import message_from_string
 from email.header import decode_header
 import imaplib
@@ -8,6 +9,7 @@ import logging
 import os
 import poplib
 import subprocess
+import time
 
 import sh
 import yaml
@@ -20,7 +22,7 @@ except sh.CommandNotFound:
 from django.core.exceptions import ValidationError
 from django.core.files import File
 from django.core.files.base import ContentFile
-from django.db import models, transaction
+from django.db import OperationalError, models, transaction
 from django.utils.encoding import force_text, python_2_unicode_compatible
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
@@ -51,8 +53,14 @@ from .literals import (
     SOURCE_UNCOMPRESS_CHOICES, SOURCE_UNCOMPRESS_CHOICE_N,
     SOURCE_UNCOMPRESS_CHOICE_Y, SOURCE_CHOICE_EMAIL_IMAP,
     SOURCE_CHOICE_EMAIL_POP3, SOURCE_CHOICE_SANE_SCANNER,
+    WATCH_FOLDER_JOURNAL_TIMEOUT, WATCH_FOLDER_SETTLE_TIME,
+    WATCH_FOLDER_STATE_CHOICES, WATCH_FOLDER_STATE_FAILED,
+    WATCH_FOLDER_STATE_PROCESSED, WATCH_FOLDER_STATE_QUEUED,
+    WATCH_FOLDER_STATE_UPLOADING
+)
+from .settings import (
+    setting_scanimage_path, setting_watch_folder_concurrency
 )
-from .settings import setting_scanimage_path
 
 logger = logging.getLogger(__name__)
 
@@ -754,24 +762,179 @@ class WatchFolderSource(IntervalBaseModel):
     )
 
     def check_source(self):
+        """
+        Polling check. Recover the journal left by crashed workers and queue
+        the files that have not been modified for a few seconds, as a
+        guard against files still being written.
+        """
+        self.recover_journal()
+
+        settle_time = time.time() - WATCH_FOLDER_SETTLE_TIME
+
         # Force self.folder_path to unicode to avoid os.listdir returning
         # str for non-latin filenames, gh-issue #163
-        for file_name in os.listdir(force_text(self.folder_path)):
+        for file_name in sorted(os.listdir(force_text(self.folder_path))):
             full_path = os.path.join(self.folder_path, file_name)
-            if os.path.isfile(full_path):
+            try:
+                if os.path.isfile(full_path) and os.path.getmtime(full_path) < settle_time:
+                    if not self.queue_file(file_name=file_name):
+                        break
+            except OSError:
+                # The file was removed or renamed while being checked
+                continue
+
+    def get_pending_count(self):
+        return self.journal_entries.exclude(
+            state__in=(WATCH_FOLDER_STATE_FAILED, WATCH_FOLDER_STATE_PROCESSED)
+        ).count()
+
+    def process_file(self, file_name):
+        """
+        Upload a journaled file and remove it from the folder. The journal
+        entry is claimed atomically so that a file dispatched more than
+        once is only uploaded once. Files that can't be uploaded are left
+        in the folder and their entry is marked as failed, they are not
+        retried until the file is removed.
+        """
+        claimed = self.journal_entries.filter(
+            file_name=file_name, state=WATCH_FOLDER_STATE_QUEUED
+        ).update(state=WATCH_FOLDER_STATE_UPLOADING, datetime=now())
+
+        if not claimed:
+            return
+
+        full_path = os.path.join(self.folder_path, file_name)
+
+        if os.path.isfile(full_path):
+            try:
                 with File(file=open(full_path, mode='rb')) as file_object:
                     self.handle_upload(
                         file_object=file_object,
                         expand=(self.uncompress == SOURCE_UNCOMPRESS_CHOICE_Y),
                         label=file_name
                     )
-                    os.unlink(full_path)
+            except OperationalError:
+                # Release the claim so that a retry can upload the file
+                self.journal_entries.filter(file_name=file_name).update(
+                    state=WATCH_FOLDER_STATE_QUEUED
+                )
+                raise
+            except Exception:
+                self.journal_entries.filter(file_name=file_name).update(
+                    state=WATCH_FOLDER_STATE_FAILED, datetime=now()
+                )
+                raise
+
+        self.journal_entries.filter(file_name=file_name).update(
+            state=WATCH_FOLDER_STATE_PROCESSED, datetime=now()
+        )
+        self.remove_file(file_name=file_name)
+
+    def queue_file(self, file_name):
+        """
+        Journal a file and dispatch its upload task. Returns False when
+        the concurrency limit of the source has been reached and the file
+        was left for a later check.
+        """
+        if self.get_pending_count() >= setting_watch_folder_concurrency.value:
+            return False
+
+        entry, created = self.journal_entries.get_or_create(
+            file_name=file_name
+        )
+
+        if created:
+            self._dispatch_file(file_name=file_name)
+
+        return True
+
+    def recover_journal(self):
+        """
+        Finish the removal of the files already uploaded, dispatch again
+        the files whose upload was abandoned and forget the failed files
+        that were removed from the folder.
+        """
+        processed = self.journal_entries.filter(
+            state=WATCH_FOLDER_STATE_PROCESSED
+        )
+
+        for entry in processed:
+            self.remove_file(file_name=entry.file_name)
+
+        failed = self.journal_entries.filter(state=WATCH_FOLDER_STATE_FAILED)
+
+        for entry in failed:
+            if not os.path.isfile(os.path.join(self.folder_path, entry.file_name)):
+                entry.delete()
+
+        expired = self.journal_entries.exclude(
+            state__in=(WATCH_FOLDER_STATE_FAILED, WATCH_FOLDER_STATE_PROCESSED)
+        ).filter(
+            datetime__lt=now() - timedelta(
+                seconds=WATCH_FOLDER_JOURNAL_TIMEOUT
+            )
+        )
+
+        for entry in expired:
+            if os.path.isfile(os.path.join(self.folder_path, entry.file_name)):
+                entry.state = WATCH_FOLDER_STATE_QUEUED
+                entry.save()
+                self._dispatch_file(file_name=entry.file_name)
+            else:
+                entry.delete()
+
+    def remove_file(self, file_name):
+        try:
+            os.unlink(os.path.join(self.folder_path, file_name))
+        except OSError as exception:
+            logger.warning(
+                'Unable to remove watch folder file "%s"; %s', file_name,
+                exception
+            )
+
+        self.journal_entries.filter(file_name=file_name).delete()
+
+    def _dispatch_file(self, file_name):
+        from .tasks import task_watch_folder_upload
+
+        task_watch_folder_upload.apply_async(
+            kwargs={'file_name': file_name, 'source_id': self.pk}
+        )
 
     class Meta:
         verbose_name = _('Watch folder')
         verbose_name_plural = _('Watch folders')
 
 
+@python_2_unicode_compatible
+class WatchFolderJournalEntry(models.Model):
+    """
+    Track the files of a watch folder from the moment their upload is
+    dispatched until they are removed from the folder, allowing uploads
+    interrupted by a crash to be recovered.
+    """
+    source = models.ForeignKey(
+        WatchFolderSource, on_delete=models.CASCADE,
+        related_name='journal_entries', verbose_name=_('Source')
+    )
+    file_name = models.CharField(max_length=255, verbose_name=_('File name'))
+    state = models.CharField(
+        choices=WATCH_FOLDER_STATE_CHOICES, default=WATCH_FOLDER_STATE_QUEUED,
+        max_length=16, verbose_name=_('State')
+    )
+    datetime = models.DateTimeField(
+        default=now, verbose_name=_('Date time')
+    )
+
+    class Meta:
+        unique_together = ('source', 'file_name')
+        verbose_name = _('Watch folder journal entry')
+        verbose_name_plural = _('Watch folder journal entries')
+
+    def __str__(self):
+        return self.file_name
+
+
 class SourceLog(models.Model):
     source = models.ForeignKey(
         Source, on_delete=models.CASCADE, related_name='logs',
@@ -3,12 +3,14 @@ from __future__ import unicode_literals
 from django.utils.translation import ugettext_lazy as _
 
 from task_manager.classes import CeleryQueue
+from task_manager.literals import TASK_CLASS_PERIODIC
 
 queue_sources = CeleryQueue(
-    name='sources', label=_('Sources'), transient=True
+    name='sources', label=_('Sources')
 )
 queue_sources_periodic = CeleryQueue(
-    name='sources_periodic', label=_('Sources periodic')
+    name='sources_periodic', label=_('Sources periodic'),
+    task_class=TASK_CLASS_PERIODIC, transient=True
 )
 
 queue_sources_periodic.add_task_type(
@@ -24,3 +26,7 @@ queue_sources.add_task_type(
     name='sources.tasks.task_upload_document',
     label=_('Upload document')
 )
+queue_sources.add_task_type(
+    name='sources.tasks.task_watch_folder_upload',
+    label=_('Upload watch folder file')
+)
@@ -4,6 +4,10 @@ from django.utils.translation import ugettext_lazy as _
 
 from smart_settings import Namespace
 
+from .literals import (
+    DEFAULT_WATCH_FOLDER_CONCURRENCY, DEFAULT_WATCH_FOLDER_POLL_INTERVAL
+)
+
 namespace = Namespace(name='sources', label=_('Sources'))
 
 setting_scanimage_path = namespace.add_setting(
@@ -13,3 +17,18 @@ setting_scanimage_path = namespace.add_setting(
     ),
     is_path=True
 )
+setting_watch_folder_concurrency = namespace.add_setting(
+    global_name='SOURCE_WATCH_FOLDER_CONCURRENCY',
+    default=DEFAULT_WATCH_FOLDER_CONCURRENCY, help_text=_(
+        'Maximum number of files of a single watch folder being uploaded at '
+        'the same time.'
+    )
+)
+setting_watch_folder_poll_interval = namespace.add_setting(
+    global_name='SOURCE_WATCH_FOLDER_POLL_INTERVAL',
+    default=DEFAULT_WATCH_FOLDER_POLL_INTERVAL, help_text=_(
+        'Interval in seconds between full scans of the watch folders done by '
+        'the watchfolders command, in addition to the filesystem events or '
+        'when filesystem events are not available.'
+    )
+)
@@ -2,11 +2,12 @@ import logging
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
-from django.core.files import File
 from django.db import OperationalError
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
+from celery import group
+
 from mayan.celery import app
 
 from common.compressed_files import CompressedFile, NotACompressedFile
@@ -35,6 +36,48 @@ def task_check_interval_source(source_id):
             source.logs.all().delete()
 
 
+@app.task(bind=True, default_retry_delay=DEFAULT_SOURCE_TASK_RETRY_DELAY, ignore_result=True)
+def task_watch_folder_upload(self, source_id, file_name):
+    WatchFolderSource = apps.get_model(
+        app_label='sources', model_name='WatchFolderSource'
+    )
+
+    try:
+        source = WatchFolderSource.objects.get(pk=source_id)
+    except WatchFolderSource.DoesNotExist:
+        # Source was deleted before we could execute, abort
+        return
+
+    try:
+        source.process_file(file_name=file_name)
+    except OperationalError as exception:
+        logger.warning(
+            'Operational error while uploading watch folder file "%s"; %s. '
+            'Retrying.', file_name, exception
+        )
+        raise self.retry(exc=exception)
+    except Exception as exception:
+        logger.error(
+            'Error processing watch folder file "%s"; %s', file_name,
+            exception
+        )
+        source.logs.create(
+            message=_(
+                'Error processing file "%(file_name)s", the file was left '
+                'in the folder and will not be retried until it is '
+                'removed: %(error)s'
+            ) % {
+                'error': exception, 'file_name': file_name
+            }
+        )
+
+    # Use the upload slot freed by this file for the next waiting file
+    if source.enabled:
+        task_check_interval_source.apply_async(
+            kwargs={'source_id': source.pk}
+        )
+
+
 @app.task(bind=True, default_retry_delay=DEFAULT_SOURCE_TASK_RETRY_DELAY, ignore_result=True)
 def task_upload_document(self, source_id, document_type_id, shared_uploaded_file_id, description=None, label=None, language=None, metadata_dict_list=None, tag_ids=None, user_id=None):
     SharedUploadedFile = apps.get_model(
@@ -123,62 +166,80 @@ def task_source_handle_upload(self, document_type_id, shared_uploaded_file_id, s
         skip_list = []
 
     with shared_upload.open() as file_object:
-        if expand:
-            try:
-                compressed_file = CompressedFile(file_object)
-                for compressed_file_child in compressed_file.children():
-                    # TODO: find way to uniquely identify child files
-                    # Use filename in the mean time.
-                    if force_text(compressed_file_child) not in skip_list:
-                        kwargs.update(
-                            {'label': force_text(compressed_file_child)}
-                        )
+        if not expand:
+            task_upload_document.delay(
+                shared_uploaded_file_id=shared_upload.pk, **kwargs
+            )
+            return
 
-                        try:
-                            child_shared_uploaded_file = SharedUploadedFile.objects.create(
-                                file=File(compressed_file_child)
-                            )
-                        except OperationalError as exception:
-                            logger.warning(
-                                'Operational error while preparing to upload '
-                                'child document: %s. Rescheduling.', exception
-                            )
-
-                            task_source_handle_upload.delay(
-                                document_type_id=document_type_id,
-                                shared_uploaded_file_id=shared_uploaded_file_id,
-                                source_id=source_id, description=description,
-                                expand=expand, label=label,
-                                language=language,
-                                metadata_dict_list=metadata_dict_list,
-                                skip_list=skip_list, tag_ids=tag_ids,
-                                user_id=user_id
-                            )
-                            return
-                        else:
-                            skip_list.append(force_text(compressed_file_child))
-                            task_upload_document.delay(
-                                shared_uploaded_file_id=child_shared_uploaded_file.pk,
-                                **kwargs
-                            )
-                        finally:
-                            compressed_file_child.close()
+        try:
+            compressed_file = CompressedFile(file_object)
+            children = compressed_file.children()
+        except NotACompressedFile:
+            logging.debug('Exception: NotACompressedFile')
+            task_upload_document.delay(
+                shared_uploaded_file_id=shared_upload.pk, **kwargs
+            )
+            return
+
+        # Each child is streamed into the shared storage as it is read from
+        # the archive and all their upload tasks are dispatched as a single
+        # group. Parallelism is bounded by the concurrency of the workers
+        # consuming the sources queue.
+        upload_tasks = []
+
+        for compressed_file_child in children:
+            # TODO: find way to uniquely identify child files
+            # Use filename in the mean time.
+            if force_text(compressed_file_child) not in skip_list:
+                child_kwargs = kwargs.copy()
+                child_kwargs['label'] = force_text(compressed_file_child)
 
-                    compressed_file_child.close()
                 try:
-                    shared_upload.delete()
+                    child_shared_uploaded_file = SharedUploadedFile.objects.create(
+                        file=compressed_file_child
+                    )
                 except OperationalError as exception:
                     logger.warning(
-                        'Operational error during attempt to delete shared '
-                        'upload file: %s; %s. Retrying.', shared_upload,
-                        exception
+                        'Operational error while preparing to upload '
+                        'child document: %s. Rescheduling.', exception
                     )
-            except NotACompressedFile:
-                logging.debug('Exception: NotACompressedFile')
-                task_upload_document.delay(
-                    shared_uploaded_file_id=shared_upload.pk, **kwargs
-                )
-        else:
-            task_upload_document.delay(
-                shared_uploaded_file_id=shared_upload.pk, **kwargs
-            )
+
+                    # Dispatch the children already extracted, they are
+                    # in the skip list of the rescheduled task.
+                    if upload_tasks:
+                        group(upload_tasks).apply_async()
+
+                    task_source_handle_upload.delay(
+                        document_type_id=document_type_id,
+                        shared_uploaded_file_id=shared_uploaded_file_id,
+                        source_id=source_id, description=description,
+                        expand=expand, label=label, language=language,
+                        metadata_dict_list=metadata_dict_list,
+                        skip_list=skip_list, tag_ids=tag_ids,
+                        user_id=user_id
+                    )
+                    return
+                else:
+                    skip_list.append(force_text(compressed_file_child))
+                    upload_tasks.append(
+                        task_upload_document.s(
+                            shared_uploaded_file_id=child_shared_uploaded_file.pk,
+                            **child_kwargs
+                        )
+                    )
+                finally:
+                    compressed_file_child.close()
+            else:
+                compressed_file_child.close()
+
+        if upload_tasks:
+            group(upload_tasks).apply_async()
+
+    try:
+        shared_upload.delete()
+    except OperationalError as exception:
+        logger.warning(
+            'Operational error during attempt to delete shared upload '
+            'file: %s; %s. Retrying.', shared_upload, exception
+        )
@@ -1,8 +1,16 @@
 from __future__ import unicode_literals
 
+from datetime import timedelta
+import os
 import shutil
+import tarfile
+import time
 
+import mock
+
+from django.db import OperationalError
 from django.test import override_settings
+from django.utils.timezone import now
 
 from common.utils import mkdtemp
 from common.tests import BaseTestCase
@@ -10,11 +18,18 @@ from documents.models import Document, DocumentType
 from documents.tests import (
     TEST_COMPRESSED_DOCUMENT_PATH, TEST_DOCUMENT_TYPE_LABEL,
     TEST_NON_ASCII_DOCUMENT_FILENAME, TEST_NON_ASCII_DOCUMENT_PATH,
-    TEST_NON_ASCII_COMPRESSED_DOCUMENT_PATH
+    TEST_NON_ASCII_COMPRESSED_DOCUMENT_PATH, TEST_SMALL_DOCUMENT_FILENAME,
+    TEST_SMALL_DOCUMENT_PATH
 )
 
-from ..literals import SOURCE_UNCOMPRESS_CHOICE_Y
+from ..literals import (
+    SOURCE_UNCOMPRESS_CHOICE_Y, WATCH_FOLDER_JOURNAL_TIMEOUT,
+    WATCH_FOLDER_SETTLE_TIME, WATCH_FOLDER_STATE_FAILED,
+    WATCH_FOLDER_STATE_PROCESSED, WATCH_FOLDER_STATE_QUEUED,
+    WATCH_FOLDER_STATE_UPLOADING
+)
 from ..models import WatchFolderSource, WebFormSource
+from ..settings import setting_watch_folder_concurrency
 
 
 @override_settings(OCR_AUTO_OCR=False)
@@ -33,6 +48,13 @@ class UploadDocumentTestCase(BaseTestCase):
         self.document_type.delete()
         super(UploadDocumentTestCase, self).tearDown()
 
+    def _copy_settled(self, source, destination):
+        # Age the copied file past the watch folder settle time
+        shutil.copy(source, destination)
+        path = os.path.join(destination, os.path.basename(source))
+        past = time.time() - WATCH_FOLDER_SETTLE_TIME * 2
+        os.utime(path, (past, past))
+
     def test_issue_gh_163(self):
         """
         Non-ASCII chars in document name failing in upload via watch folder
@@ -40,7 +62,7 @@ class UploadDocumentTestCase(BaseTestCase):
         """
 
         temporary_directory = mkdtemp()
-        shutil.copy(TEST_NON_ASCII_DOCUMENT_PATH, temporary_directory)
+        self._copy_settled(TEST_NON_ASCII_DOCUMENT_PATH, temporary_directory)
 
         watch_folder = WatchFolderSource.objects.create(
             document_type=self.document_type, folder_path=temporary_directory,
@@ -62,7 +84,7 @@ class UploadDocumentTestCase(BaseTestCase):
 
         # Test Non-ASCII named documents inside Non-ASCII named compressed file
 
-        shutil.copy(
+        self._copy_settled(
             TEST_NON_ASCII_COMPRESSED_DOCUMENT_PATH, temporary_directory
         )
 
@@ -81,6 +103,226 @@ class UploadDocumentTestCase(BaseTestCase):
 
         shutil.rmtree(temporary_directory)
 
+    def test_watch_folder_skips_unsettled_files(self):
+        temporary_directory = mkdtemp()
+        shutil.copy(TEST_SMALL_DOCUMENT_PATH, temporary_directory)
+
+        watch_folder = WatchFolderSource.objects.create(
+            document_type=self.document_type, folder_path=temporary_directory,
+            uncompress=SOURCE_UNCOMPRESS_CHOICE_Y
+        )
+        watch_folder.check_source()
+
+        self.assertEqual(Document.objects.count(), 0)
+
+        watch_folder.queue_file(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+
+        self.assertEqual(Document.objects.count(), 1)
+        self.assertEqual(watch_folder.journal_entries.count(), 0)
+        self.assertEqual(os.listdir(temporary_directory), [])
+
+        shutil.rmtree(temporary_directory)
+
+
+@override_settings(OCR_AUTO_OCR=False)
+class WatchFolderJournalTestCase(BaseTestCase):
+    def setUp(self):
+        super(WatchFolderJournalTestCase, self).setUp()
+        self.document_type = DocumentType.objects.create(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+        self.temporary_directory = mkdtemp()
+        self.watch_folder = WatchFolderSource.objects.create(
+            document_type=self.document_type,
+            folder_path=self.temporary_directory,
+            uncompress=SOURCE_UNCOMPRESS_CHOICE_Y
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temporary_directory)
+        self.document_type.delete()
+        super(WatchFolderJournalTestCase, self).tearDown()
+
+    def _copy_settled(self, file_name):
+        path = os.path.join(self.temporary_directory, file_name)
+        shutil.copy(TEST_SMALL_DOCUMENT_PATH, path)
+        past = time.time() - WATCH_FOLDER_SETTLE_TIME * 2
+        os.utime(path, (past, past))
+
+    def _create_entry(self, state, age=0):
+        return self.watch_folder.journal_entries.create(
+            datetime=now() - timedelta(seconds=age),
+            file_name=TEST_SMALL_DOCUMENT_FILENAME, state=state
+        )
+
+    def _file_exists(self):
+        return os.path.exists(
+            os.path.join(
+                self.temporary_directory, TEST_SMALL_DOCUMENT_FILENAME
+            )
+        )
+
+    def test_process_file_uploads_once(self):
+        self._copy_settled(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self._create_entry(state=WATCH_FOLDER_STATE_QUEUED)
+
+        self.watch_folder.process_file(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self.watch_folder.process_file(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+
+        self.assertEqual(Document.objects.count(), 1)
+        self.assertEqual(self.watch_folder.journal_entries.count(), 0)
+        self.assertFalse(self._file_exists())
+
+    def test_process_file_skips_claimed_entry(self):
+        self._copy_settled(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self._create_entry(state=WATCH_FOLDER_STATE_UPLOADING)
+
+        self.watch_folder.process_file(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+
+        self.assertEqual(Document.objects.count(), 0)
+        self.assertEqual(
+            self.watch_folder.journal_entries.get().state,
+            WATCH_FOLDER_STATE_UPLOADING
+        )
+        self.assertTrue(self._file_exists())
+
+    @mock.patch.object(WatchFolderSource, 'handle_upload')
+    def test_process_file_operational_error_releases_claim(self, handle_upload):
+        handle_upload.side_effect = OperationalError
+        self._copy_settled(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self._create_entry(state=WATCH_FOLDER_STATE_QUEUED)
+
+        with self.assertRaises(OperationalError):
+            self.watch_folder.process_file(
+                file_name=TEST_SMALL_DOCUMENT_FILENAME
+            )
+
+        self.assertEqual(
+            self.watch_folder.journal_entries.get().state,
+            WATCH_FOLDER_STATE_QUEUED
+        )
+        self.assertTrue(self._file_exists())
+
+    @mock.patch.object(WatchFolderSource, 'handle_upload')
+    def test_process_file_error_marks_failed(self, handle_upload):
+        handle_upload.side_effect = IOError
+        self._copy_settled(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self._create_entry(state=WATCH_FOLDER_STATE_QUEUED)
+
+        with self.assertRaises(IOError):
+            self.watch_folder.process_file(
+                file_name=TEST_SMALL_DOCUMENT_FILENAME
+            )
+
+        self.assertEqual(
+            self.watch_folder.journal_entries.get().state,
+            WATCH_FOLDER_STATE_FAILED
+        )
+        self.assertEqual(self.watch_folder.get_pending_count(), 0)
+        self.assertTrue(self._file_exists())
+
+    @mock.patch.object(WatchFolderSource, '_dispatch_file')
+    def test_recover_journal_keeps_failed_files(self, dispatch_file):
+        self._copy_settled(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self._create_entry(
+            age=WATCH_FOLDER_JOURNAL_TIMEOUT * 2,
+            state=WATCH_FOLDER_STATE_FAILED
+        )
+
+        self.watch_folder.recover_journal()
+
+        self.assertFalse(dispatch_file.called)
+        self.assertEqual(
+            self.watch_folder.journal_entries.get().state,
+            WATCH_FOLDER_STATE_FAILED
+        )
+        self.assertTrue(self._file_exists())
+
+    def test_recover_journal_deletes_failed_entries_of_removed_files(self):
+        self._create_entry(state=WATCH_FOLDER_STATE_FAILED)
+
+        self.watch_folder.recover_journal()
+
+        self.assertEqual(self.watch_folder.journal_entries.count(), 0)
+
+    def test_recover_journal_removes_processed_files(self):
+        self._copy_settled(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self._create_entry(state=WATCH_FOLDER_STATE_PROCESSED)
+
+        self.watch_folder.recover_journal()
+
+        self.assertEqual(Document.objects.count(), 0)
+        self.assertEqual(self.watch_folder.journal_entries.count(), 0)
+        self.assertFalse(self._file_exists())
+
+    def test_recover_journal_dispatches_abandoned_uploads(self):
+        self._copy_settled(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self._create_entry(
+            age=WATCH_FOLDER_JOURNAL_TIMEOUT * 2,
+            state=WATCH_FOLDER_STATE_UPLOADING
+        )
+
+        self.watch_folder.recover_journal()
+
+        self.assertEqual(Document.objects.count(), 1)
+        self.assertEqual(self.watch_folder.journal_entries.count(), 0)
+        self.assertFalse(self._file_exists())
+
+    def test_recover_journal_deletes_entries_of_missing_files(self):
+        self._create_entry(
+            age=WATCH_FOLDER_JOURNAL_TIMEOUT * 2,
+            state=WATCH_FOLDER_STATE_UPLOADING
+        )
+
+        self.watch_folder.recover_journal()
+
+        self.assertEqual(self.watch_folder.journal_entries.count(), 0)
+
+    def test_recover_journal_keeps_recent_uploads(self):
+        self._copy_settled(file_name=TEST_SMALL_DOCUMENT_FILENAME)
+        self._create_entry(state=WATCH_FOLDER_STATE_UPLOADING)
+
+        self.watch_folder.recover_journal()
+
+        self.assertEqual(Document.objects.count(), 0)
+        self.assertEqual(
+            self.watch_folder.journal_entries.get().state,
+            WATCH_FOLDER_STATE_UPLOADING
+        )
+
+    @mock.patch.object(WatchFolderSource, '_dispatch_file')
+    def test_concurrency_limit(self, dispatch_file):
+        setting_watch_folder_concurrency.value = '2'
+        self.addCleanup(setting_watch_folder_concurrency.invalidate_cache)
+
+        file_names = [
+            '{}-{}'.format(index, TEST_SMALL_DOCUMENT_FILENAME)
+            for index in range(3)
+        ]
+        for file_name in file_names:
+            self._copy_settled(file_name=file_name)
+
+        self.watch_folder.check_source()
+
+        self.assertEqual(
+            sorted(
+                self.watch_folder.journal_entries.values_list(
+                    'file_name', flat=True
+                )
+            ), file_names[:2]
+        )
+        self.assertEqual(dispatch_file.call_count, 2)
+        self.assertFalse(
+            self.watch_folder.queue_file(file_name=file_names[2])
+        )
+
+        # A finished upload frees a slot for the waiting file
+        self.watch_folder.remove_file(file_name=file_names[0])
+        self.watch_folder.check_source()
+
+        self.assertEqual(self.watch_folder.journal_entries.count(), 2)
+        self.assertEqual(dispatch_file.call_count, 3)
+
 
 @override_settings(OCR_AUTO_OCR=False)
 class CompressedUploadsTestCase(BaseTestCase):
@@ -117,3 +359,31 @@ class CompressedUploadsTestCase(BaseTestCase):
                 'label', flat=True
             )
         )
+
+    def test_upload_compressed_tar_file(self):
+        source = WebFormSource(
+            label='test source', uncompress=SOURCE_UNCOMPRESS_CHOICE_Y
+        )
+
+        temporary_directory = mkdtemp()
+        tar_path = os.path.join(temporary_directory, 'documents.tar.gz')
+
+        with tarfile.open(tar_path, mode='w:gz') as tar_file:
+            tar_file.add(
+                TEST_SMALL_DOCUMENT_PATH, arcname=TEST_SMALL_DOCUMENT_FILENAME
+            )
+
+        with open(tar_path) as file_object:
+            source.handle_upload(
+                document_type=self.document_type,
+                file_object=file_object,
+                expand=(source.uncompress == SOURCE_UNCOMPRESS_CHOICE_Y)
+            )
+
+        shutil.rmtree(temporary_directory)
+
+        self.assertEqual(Document.objects.count(), 1)
+        self.assertEqual(
+            Document.objects.first().label, TEST_SMALL_DOCUMENT_FILENAME
+        )
+        self.assertEqual(Document.objects.first().page_count, 1)
@@ -0,0 +1,128 @@
+from __future__ import unicode_literals
+
+import os
+import shutil
+
+import mock
+
+from django.utils.six import StringIO
+
+from common.tests import BaseTestCase
+from common.utils import mkdtemp
+from documents.models import DocumentType
+from documents.tests import TEST_DOCUMENT_TYPE_LABEL
+
+from ..management.commands.watchfolders import Command
+from ..models import WatchFolderSource
+from ..watchers import InotifyWatcher, WatcherUnavailable
+
+TEST_WATCHED_FILENAME = 'test_file.txt'
+TEST_WATCH_COMMAND_PATH = 'sources.management.commands.watchfolders'
+
+
+class InotifyWatcherTestCase(BaseTestCase):
+    def setUp(self):
+        super(InotifyWatcherTestCase, self).setUp()
+        try:
+            self.watcher = InotifyWatcher()
+        except WatcherUnavailable:
+            self.skipTest('inotify is not available')
+
+        self.temporary_directory = mkdtemp()
+        self.watcher.add_watch(path=self.temporary_directory)
+
+    def tearDown(self):
+        self.watcher.close()
+        shutil.rmtree(self.temporary_directory)
+        super(InotifyWatcherTestCase, self).tearDown()
+
+    def test_closed_file_event(self):
+        path = os.path.join(self.temporary_directory, TEST_WATCHED_FILENAME)
+        with open(path, 'w') as file_object:
+            file_object.write('test')
+
+        self.assertEqual(
+            self.watcher.read_events(timeout=1),
+            [(self.temporary_directory, TEST_WATCHED_FILENAME)]
+        )
+
+    def test_moved_file_event(self):
+        other_directory = mkdtemp()
+        path = os.path.join(other_directory, TEST_WATCHED_FILENAME)
+        with open(path, 'w') as file_object:
+            file_object.write('test')
+
+        os.rename(
+            path,
+            os.path.join(self.temporary_directory, TEST_WATCHED_FILENAME)
+        )
+        shutil.rmtree(other_directory)
+
+        self.assertEqual(
+            self.watcher.read_events(timeout=1),
+            [(self.temporary_directory, TEST_WATCHED_FILENAME)]
+        )
+
+    def test_removed_watch(self):
+        self.watcher.remove_watch(path=self.temporary_directory)
+
+        path = os.path.join(self.temporary_directory, TEST_WATCHED_FILENAME)
+        with open(path, 'w') as file_object:
+            file_object.write('test')
+
+        self.assertEqual(self.watcher.read_events(timeout=0), [])
+
+
+@mock.patch('{}.close_old_connections'.format(TEST_WATCH_COMMAND_PATH))
+class WatchFoldersCommandTestCase(BaseTestCase):
+    def setUp(self):
+        super(WatchFoldersCommandTestCase, self).setUp()
+        self.document_type = DocumentType.objects.create(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+        self.temporary_directory = mkdtemp()
+        self.watch_folder = WatchFolderSource.objects.create(
+            document_type=self.document_type,
+            folder_path=self.temporary_directory
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temporary_directory)
+        self.document_type.delete()
+        super(WatchFoldersCommandTestCase, self).tearDown()
+
+    @mock.patch.object(WatchFolderSource, 'check_source')
+    @mock.patch('{}.time.sleep'.format(TEST_WATCH_COMMAND_PATH))
+    @mock.patch('{}.InotifyWatcher'.format(TEST_WATCH_COMMAND_PATH))
+    def test_polling_fallback(self, watcher_class, sleep, check_source,
+                              close_old_connections):
+        watcher_class.side_effect = WatcherUnavailable
+        # Stop the command loop at its first wait
+        sleep.side_effect = KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            Command(stderr=StringIO(), stdout=StringIO()).handle()
+
+        self.assertEqual(check_source.call_count, 1)
+        self.assertEqual(sleep.call_count, 1)
+
+    def test_refresh_sources(self, close_old_connections):
+        watcher = mock.Mock()
+        command = Command()
+
+        sources = command.refresh_sources(sources={}, watcher=watcher)
+
+        self.assertEqual(list(sources.keys()), [self.temporary_directory])
+        watcher.add_watch.assert_called_once_with(
+            path=self.temporary_directory
+        )
+
+        self.watch_folder.enabled = False
+        self.watch_folder.save()
+
+        self.assertEqual(
+            command.refresh_sources(sources=sources, watcher=watcher), {}
+        )
+        watcher.remove_watch.assert_called_once_with(
+            path=self.temporary_directory
+        )
@@ -0,0 +1,119 @@
+from __future__ import unicode_literals
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+
+from django.utils.encoding import force_bytes, force_text
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+INOTIFY_EVENT_STRUCTURE = b'iIII'
+INOTIFY_EVENT_SIZE = struct.calcsize(INOTIFY_EVENT_STRUCTURE)
+INOTIFY_READ_SIZE = 64 * 1024
+
+
+class WatcherUnavailable(Exception):
+    """
+    Raised when the platform does not provide filesystem events.
+    """
+
+
+class InotifyWatcher(object):
+    """
+    Minimal Linux inotify binding using ctypes, reporting only files that
+    were completely written to or moved into the watched folders.
+    """
+    mask = IN_CLOSE_WRITE | IN_MOVED_TO
+
+    def __init__(self):
+        library_name = ctypes.util.find_library('c')
+
+        try:
+            self.libc = ctypes.CDLL(library_name, use_errno=True)
+            self.libc.inotify_init1
+        except (AttributeError, OSError, TypeError) as exception:
+            raise WatcherUnavailable(exception)
+
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise WatcherUnavailable(os.strerror(ctypes.get_errno()))
+
+        self.paths = {}
+
+    def add_watch(self, path):
+        descriptor = self.libc.inotify_add_watch(
+            self.fd, force_bytes(path), self.mask
+        )
+
+        if descriptor < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), path)
+
+        self.paths[descriptor] = path
+        return descriptor
+
+    def close(self):
+        os.close(self.fd)
+
+    def read_events(self, timeout=None):
+        """
+        Wait up to timeout seconds and return a list of (path, file name)
+        tuples of the files ready to be processed. A file name of None means
+        events were lost and the whole path must be scanned.
+        """
+        try:
+            readable, writable, errors = select.select(
+                [self.fd], [], [], timeout
+            )
+        except select.error as exception:
+            if exception.args[0] == errno.EINTR:
+                return []
+            raise
+
+        if not readable:
+            return []
+
+        try:
+            data = os.read(self.fd, INOTIFY_READ_SIZE)
+        except OSError as exception:
+            if exception.errno == errno.EAGAIN:
+                return []
+            raise
+
+        events = []
+        offset = 0
+
+        while offset + INOTIFY_EVENT_SIZE <= len(data):
+            descriptor, mask, cookie, length = struct.unpack_from(
+                INOTIFY_EVENT_STRUCTURE, data, offset
+            )
+            offset += INOTIFY_EVENT_SIZE
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                events.extend(
+                    [(path, None) for path in self.paths.values()]
+                )
+            elif mask & IN_IGNORED:
+                self.paths.pop(descriptor, None)
+            elif not mask & IN_ISDIR and descriptor in self.paths:
+                events.append((self.paths[descriptor], force_text(name)))
+
+        return events
+
+    def remove_watch(self, path):
+        for descriptor, watched_path in list(self.paths.items()):
+            if watched_path == path:
+                self.libc.inotify_rm_watch(self.fd, descriptor)
+                del self.paths[descriptor]
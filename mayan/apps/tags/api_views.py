@@ -1,25 +1,31 @@
 from __future__ import absolute_import, unicode_literals
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
+from django.utils.encoding import force_text
+from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import generics
 from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from acls.models import AccessControlList
 from documents.models import Document
 from documents.permissions import permission_document_view
 from documents.serializers import DocumentSerializer
+from document_indexing.tasks import task_index_document
 from rest_api.filters import MayanObjectPermissionsFilter
 from rest_api.permissions import MayanPermission
 
+from .events import event_tag_attach
 from .models import Tag
 from .permissions import (
     permission_tag_attach, permission_tag_create, permission_tag_delete,
     permission_tag_edit, permission_tag_remove, permission_tag_view
 )
 from .serializers import (
-    DocumentTagSerializer, NewDocumentTagSerializer, TagSerializer,
+    DocumentTagBulkSerializer, DocumentTagSerializer, NewDocumentTagSerializer, TagSerializer,
     WritableTagSerializer
 )
 
@@ -173,6 +179,110 @@ class APIDocumentTagListView(generics.ListCreateAPIView):
         ).post(request, *args, **kwargs)
 
 
+class APIDocumentTagBulkView(generics.GenericAPIView):
+    permission_classes = (IsAuthenticated,)
+    serializer_class = DocumentTagBulkSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs['many'] = True
+        return super(APIDocumentTagBulkView, self).get_serializer(
+            *args, **kwargs
+        )
+
+    def perform_bulk_attach(self, items):
+        """
+        Resolve the documents, tags, access and existing attachments of
+        all the items up front and attach the new ones with a single bulk
+        insert. Every affected document is queued for indexing once.
+        """
+        documents = Document.objects.in_bulk(
+            set([item['document_pk'] for item in items])
+        )
+        tags = Tag.objects.in_bulk(set([item['tag_pk'] for item in items]))
+
+        documents_allowed = AccessControlList.objects.check_access_bulk(
+            permissions=permission_tag_attach, user=self.request.user,
+            objects=documents.values()
+        )
+        tags_allowed = AccessControlList.objects.check_access_bulk(
+            permissions=permission_tag_attach, user=self.request.user,
+            objects=tags.values()
+        )
+
+        DocumentTag = Tag.documents.through
+
+        existing = set(
+            DocumentTag.objects.filter(
+                document__in=documents.keys(), tag__in=tags.keys()
+            ).values_list('document', 'tag')
+        )
+
+        results = []
+        to_create = {}
+
+        for item in items:
+            result = {
+                'document_pk': item['document_pk'], 'tag_pk': item['tag_pk']
+            }
+            results.append(result)
+
+            document = documents.get(item['document_pk'])
+            tag = tags.get(item['tag_pk'])
+
+            if not document:
+                result['error'] = _('Document not found.')
+            elif not tag:
+                result['error'] = _('Tag not found.')
+            elif document not in documents_allowed or tag not in tags_allowed:
+                result['error'] = _('Insufficient access.')
+            elif (document.pk, tag.pk) in existing:
+                result['status'] = 'unchanged'
+            else:
+                existing.add((document.pk, tag.pk))
+                to_create[(document.pk, tag.pk)] = (document, tag)
+                result['status'] = 'attached'
+
+        with transaction.atomic():
+            DocumentTag.objects.bulk_create(
+                [
+                    DocumentTag(document=document, tag=tag)
+                    for document, tag in to_create.values()
+                ]
+            )
+
+            for document, tag in to_create.values():
+                event_tag_attach.commit(
+                    action_object=tag, actor=self.request.user,
+                    target=document
+                )
+
+        for result in results:
+            if 'error' in result:
+                result['error'] = force_text(result['error'])
+                result['status'] = 'error'
+
+        for document_pk in sorted(set([key[0] for key in to_create])):
+            task_index_document.apply_async(
+                kwargs=dict(document_id=document_pk)
+            )
+
+        return results
+
+    def post(self, request, *args, **kwargs):
+        """
+        Attach tags to several documents in a single request. Accepts a
+        list of document and tag entries and returns the outcome of each
+        entry in the same order.
+        """
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(
+            self.perform_bulk_attach(items=serializer.validated_data)
+        )
+
+
 class APIDocumentTagView(generics.RetrieveDestroyAPIView):
     filter_backends = (MayanObjectPermissionsFilter,)
     mayan_object_permissions = {
@@ -38,6 +38,8 @@ class TagsApp(MayanAppConfig):
         super(TagsApp, self).ready()
         from actstream import registry
 
+        from documents.serializers import DocumentSerializer
+
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
@@ -51,6 +53,17 @@ class TagsApp(MayanAppConfig):
 
         APIEndPoint(app=self, version_string='1')
 
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        DocumentSerializer.add_expandable_field(
+            name='tags', many=True, prefetch_lookup='tags',
+            prefetch_queryset=lambda request: AccessControlList.objects.filter_by_access(
+                permission_tag_view, request.user, queryset=Tag.objects.all()
+            ), serializer_class='tags.serializers.TagSerializer'
+        )
+
         Document.add_to_class(
             'attached_tags',
             lambda document: DocumentTag.objects.filter(documents=document)
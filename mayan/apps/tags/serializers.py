@@ -8,12 +8,13 @@ from rest_framework.reverse import reverse
 
 from acls.models import AccessControlList
 from documents.models import Document
+from rest_api.mixins import DynamicFieldsSerializerMixin
 
 from .models import Tag
 from .permissions import permission_tag_attach
 
 
-class TagSerializer(serializers.HyperlinkedModelSerializer):
+class TagSerializer(DynamicFieldsSerializerMixin, serializers.HyperlinkedModelSerializer):
     documents_url = serializers.HyperlinkedIdentityField(
         view_name='rest_api:tag-document-list'
     )
@@ -119,3 +120,12 @@ class NewDocumentTagSerializer(serializers.Serializer):
             raise ValidationError(exception)
 
         return {'tag_pk': tag.pk}
+
+
+class DocumentTagBulkSerializer(serializers.Serializer):
+    document_pk = serializers.IntegerField(
+        help_text=_('Primary key of the document to be tagged.')
+    )
+    tag_pk = serializers.IntegerField(
+        help_text=_('Primary key of the tag to be attached.')
+    )
@@ -147,6 +147,45 @@ class TagAPITestCase(BaseAPITestCase):
         )
         self.assertQuerysetEqual(document.tags.all(), (repr(tag),))
 
+    def test_document_tag_bulk_view(self):
+        tag = self._create_tag()
+        document = self._document_create()
+        tag_2 = Tag.objects.create(
+            color=TEST_TAG_COLOR_EDITED, label=TEST_TAG_LABEL_EDITED
+        )
+        tag.documents.add(document)
+
+        response = self.client.post(
+            reverse('rest_api:document-tag-bulk'), data=[
+                {'document_pk': document.pk, 'tag_pk': tag.pk},
+                {'document_pk': document.pk, 'tag_pk': tag_2.pk},
+                {'document_pk': document.pk + 1, 'tag_pk': tag_2.pk}
+            ], format='json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in response.data],
+            ['unchanged', 'attached', 'error']
+        )
+        self.assertQuerysetEqual(
+            document.tags.all(), (repr(tag), repr(tag_2)), ordered=False
+        )
+
+    def test_document_tag_bulk_view_anonymous(self):
+        tag = self._create_tag()
+        document = self._document_create()
+        self.client.logout()
+
+        response = self.client.post(
+            reverse('rest_api:document-tag-bulk'), data=[
+                {'document_pk': document.pk, 'tag_pk': tag.pk}
+            ], format='json'
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(document.tags.count(), 0)
+
     def test_document_tag_detail_view(self):
         tag = self._create_tag()
         document = self._document_create()
@@ -180,3 +219,20 @@ class TagAPITestCase(BaseAPITestCase):
         )
 
         self.assertEqual(tag.documents.count(), 0)
+
+    def test_document_list_expand_tags_view(self):
+        tag = self._create_tag()
+        document = self._document_create()
+        tag.documents.add(document)
+
+        response = self.client.get(
+            reverse('rest_api:document-list'), data={
+                'expand': 'tags', 'fields': 'id,tags.label'
+            }
+        )
+
+        self.assertEqual(
+            response.data['results'][0], {
+                'id': document.pk, 'tags': [{'label': tag.label}]
+            }
+        )
@@ -3,8 +3,8 @@ from __future__ import unicode_literals
 from django.conf.urls import url
 
 from .api_views import (
-    APIDocumentTagView, APIDocumentTagListView, APITagDocumentListView,
-    APITagListView, APITagView
+    APIDocumentTagBulkView, APIDocumentTagView, APIDocumentTagListView,
+    APITagDocumentListView, APITagListView, APITagView
 )
 from .views import (
     DocumentTagListView, TagAttachActionView, TagCreateView,
@@ -62,6 +62,10 @@ api_urls = [
     ),
     url(r'^tags/(?P<pk>[0-9]+)/$', APITagView.as_view(), name='tag-detail'),
     url(r'^tags/$', APITagListView.as_view(), name='tag-list'),
+    url(
+        r'^documents/tags/bulk/$', APIDocumentTagBulkView.as_view(),
+        name='document-tag-bulk'
+    ),
     url(
         r'^documents/(?P<document_pk>[0-9]+)/tags/$',
         APIDocumentTagListView.as_view(), name='document-tag-list'
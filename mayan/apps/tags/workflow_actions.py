@@ -56,7 +56,7 @@ class AttachTagAction(WorkflowAction):
     def execute(self, context):
         for tag in self.get_tags():
             tag.attach_to(
-                document=context['entry_log'].workflow_instance.document
+                document=context['document']
             )
 
 
@@ -76,5 +76,5 @@ class RemoveTagAction(AttachTagAction):
     def execute(self, context):
         for tag in self.get_tags():
             tag.remove_from(
-                document=context['entry_log'].workflow_instance.document
+                document=context['document']
             )
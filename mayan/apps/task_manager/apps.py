@@ -6,6 +6,7 @@ from common import (
     MayanAppConfig, menu_object, menu_secondary, menu_tools
 )
 from common.widgets import two_state_template
+from mayan.celery import app
 from navigation import SourceColumn
 
 from .classes import CeleryQueue, Task
@@ -14,6 +15,7 @@ from .links import (
     link_queue_scheduled_task_list, link_queue_reserved_task_list,
     link_task_manager
 )
+from .workers import add_worker_options
 
 
 class TaskManagerApp(MayanAppConfig):
@@ -26,6 +28,11 @@ class TaskManagerApp(MayanAppConfig):
     def ready(self):
         super(TaskManagerApp, self).ready()
 
+        # All the app configurations, and with them their queues, are
+        # imported before any app is made ready.
+        CeleryQueue.configure_celery(app=app)
+        add_worker_options(app=app)
+
         SourceColumn(
             source=CeleryQueue, label=_('Label'), attribute='label'
         )
@@ -38,6 +45,10 @@ class TaskManagerApp(MayanAppConfig):
                 context['object'].is_default_queue
             )
         )
+        SourceColumn(
+            source=CeleryQueue, label=_('Task class'),
+            attribute='get_task_class_display'
+        )
         SourceColumn(
             source=CeleryQueue, label=_('Is transient?'),
             func=lambda context: two_state_template(
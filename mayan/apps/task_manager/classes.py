@@ -4,10 +4,15 @@ from datetime import timedelta
 
 from celery.five import monotonic
 from celery.task.control import inspect
+from kombu import Exchange, Queue
 
 from django.utils.encoding import force_text, python_2_unicode_compatible
 from django.utils.timezone import now
 
+from .literals import (
+    TASK_CLASS_BULK, TASK_CLASS_LABELS, TASK_CLASS_PRIORITIES
+)
+
 
 @python_2_unicode_compatible
 class TaskType(object):
@@ -58,15 +63,36 @@ class CeleryQueue(object):
             cls._registry.values(), key=lambda instance: instance.label
         )
 
+    @classmethod
+    def configure_celery(cls, app):
+        """
+        Declare the registered queues and route their task types to them,
+        tagged with the priority of the task class of the queue.
+        """
+        for queue in cls.all():
+            app.conf.CELERY_QUEUES.append(queue.get_kombu_queue())
+            app.conf.CELERY_ROUTES.update(queue.get_routes())
+
+            if queue.is_default_queue:
+                app.conf.CELERY_DEFAULT_QUEUE = queue.name
+
+    @classmethod
+    def filter_by_task_class(cls, task_class):
+        return [
+            queue for queue in cls.all() if queue.task_class == task_class
+        ]
+
     @classmethod
     def get(cls, queue_name):
         return cls._registry[queue_name]
 
-    def __init__(self, name, label, is_default_queue=False, transient=False):
+    def __init__(self, name, label, is_default_queue=False, transient=False,
+                 task_class=TASK_CLASS_BULK):
         self.name = name
         self.label = label
         self.is_default_queue = is_default_queue
         self.is_transient = transient
+        self.task_class = task_class
         self.task_types = []
         self.__class__._registry[name] = self
 
@@ -76,6 +102,29 @@ class CeleryQueue(object):
     def add_task_type(self, *args, **kwargs):
         self.task_types.append(TaskType(*args, **kwargs))
 
+    def get_kombu_queue(self):
+        if self.is_transient:
+            # Kombu reads the delivery mode from the exchange, messages of
+            # transient queues are not persisted by the broker.
+            exchange = Exchange(self.name, delivery_mode=1)
+        else:
+            exchange = Exchange(self.name)
+
+        return Queue(self.name, exchange, routing_key=self.name)
+
+    def get_priority(self):
+        return TASK_CLASS_PRIORITIES[self.task_class]
+
+    def get_routes(self):
+        return {
+            task_type.name: {
+                'queue': self.name, 'priority': self.get_priority()
+            } for task_type in self.task_types
+        }
+
+    def get_task_class_display(self):
+        return TASK_CLASS_LABELS[self.task_class]
+
     def get_active_tasks(self):
         return self._process_task_dictionary(
             task_dictionary=self.__class__._inspect_instance.active()
@@ -0,0 +1,19 @@
+from __future__ import unicode_literals
+
+from django.utils.translation import ugettext_lazy as _
+
+TASK_CLASS_BULK = 'bulk'
+TASK_CLASS_INTERACTIVE = 'interactive'
+TASK_CLASS_PERIODIC = 'periodic'
+TASK_CLASS_LABELS = {
+    TASK_CLASS_BULK: _('Bulk'),
+    TASK_CLASS_INTERACTIVE: _('Interactive'),
+    TASK_CLASS_PERIODIC: _('Periodic'),
+}
+# The Redis broker transport consumes the messages with the lowest priority
+# value first, across all the queues of a worker.
+TASK_CLASS_PRIORITIES = {
+    TASK_CLASS_BULK: 6,
+    TASK_CLASS_INTERACTIVE: 0,
+    TASK_CLASS_PERIODIC: 3,
+}
@@ -4,3 +4,5 @@ from django.utils.translation import ugettext_lazy as _
 
 TEST_QUEUE_LABEL = _('Test queue')
 TEST_QUEUE_NAME = 'test_queue'
+TEST_TASK_TYPE_LABEL = _('Test task type')
+TEST_TASK_TYPE_NAME = 'task_manager.tests.test_task'
@@ -0,0 +1,74 @@
+from __future__ import unicode_literals
+
+from common.tests import BaseTestCase
+
+from ..classes import CeleryQueue
+from ..literals import (
+    TASK_CLASS_BULK, TASK_CLASS_INTERACTIVE, TASK_CLASS_PERIODIC,
+    TASK_CLASS_PRIORITIES
+)
+
+from .literals import (
+    TEST_QUEUE_LABEL, TEST_QUEUE_NAME, TEST_TASK_TYPE_LABEL,
+    TEST_TASK_TYPE_NAME
+)
+
+
+class CeleryQueueTestCase(BaseTestCase):
+    def test_routes(self):
+        queue = CeleryQueue(
+            label=TEST_QUEUE_LABEL, name=TEST_QUEUE_NAME,
+            task_class=TASK_CLASS_INTERACTIVE
+        )
+        queue.add_task_type(
+            label=TEST_TASK_TYPE_LABEL, name=TEST_TASK_TYPE_NAME
+        )
+
+        self.assertEqual(
+            queue.get_routes(), {
+                TEST_TASK_TYPE_NAME: {
+                    'queue': TEST_QUEUE_NAME,
+                    'priority': TASK_CLASS_PRIORITIES[TASK_CLASS_INTERACTIVE]
+                }
+            }
+        )
+
+    def test_interactive_priority(self):
+        self.assertTrue(
+            TASK_CLASS_PRIORITIES[TASK_CLASS_INTERACTIVE] <
+            TASK_CLASS_PRIORITIES[TASK_CLASS_BULK]
+        )
+
+    def test_transient_queue(self):
+        queue = CeleryQueue(
+            label=TEST_QUEUE_LABEL, name=TEST_QUEUE_NAME, transient=True
+        )
+
+        kombu_queue = queue.get_kombu_queue()
+
+        self.assertEqual(kombu_queue.name, TEST_QUEUE_NAME)
+        self.assertEqual(kombu_queue.routing_key, TEST_QUEUE_NAME)
+        self.assertEqual(kombu_queue.exchange.delivery_mode, 1)
+
+    def test_filter_by_task_class(self):
+        queue = CeleryQueue(
+            label=TEST_QUEUE_LABEL, name=TEST_QUEUE_NAME,
+            task_class=TASK_CLASS_PERIODIC
+        )
+
+        self.assertTrue(
+            queue in CeleryQueue.filter_by_task_class(
+                task_class=TASK_CLASS_PERIODIC
+            )
+        )
+        self.assertFalse(
+            queue in CeleryQueue.filter_by_task_class(
+                task_class=TASK_CLASS_BULK
+            )
+        )
+
+    def test_registered_queues_have_a_task_class(self):
+        # Queues without a known task class would not be consumed by any
+        # of the worker pools.
+        for queue in CeleryQueue.all():
+            self.assertTrue(queue.task_class in TASK_CLASS_PRIORITIES)
@@ -0,0 +1,37 @@
+from __future__ import absolute_import, unicode_literals
+
+from celery import bootsteps
+from celery.bin import Option
+
+from .classes import CeleryQueue
+from .literals import TASK_CLASS_LABELS
+
+
+class TaskClassQueues(bootsteps.Step):
+    """
+    Make the worker consume from every queue registered with a task class,
+    queues added by apps are picked up without changing the worker command
+    line.
+    """
+    def __init__(self, worker, task_class=None, **options):
+        super(TaskClassQueues, self).__init__(worker, **options)
+
+        if task_class:
+            worker.app.amqp.queues.select(
+                [
+                    queue.name for queue in CeleryQueue.filter_by_task_class(
+                        task_class=task_class
+                    )
+                ]
+            )
+
+
+def add_worker_options(app):
+    app.user_options['worker'].add(
+        Option(
+            '--task-class', choices=sorted(TASK_CLASS_LABELS),
+            default=None, dest='task_class', type='choice',
+            help='Consume from all the queues of a task class.'
+        )
+    )
+    app.steps['worker'].add(TaskClassQueues)